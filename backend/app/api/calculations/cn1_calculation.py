@@ -3,7 +3,7 @@
 from fastapi import APIRouter, HTTPException
 import logging
 import json
-from app.services.loader.project_loader import extract_project_info
+from app.services.loader.project_loader import extract_project_info_and_sheet
 from app.services.config_loader import build_calculation_config
 from app.services.calculation.string_calculator import calculate_all_strings, calculate_all_cn1_circuits
 from app.utils.filesystem import load_excel_sheet
@@ -402,11 +402,10 @@ def calculate_iec_cn1(project_name: str):
     CORREGIDO: Usa normalización consistente de circuit_id
     """
     try:
-        project_info = extract_project_info(project_name)
+        # Cargar proyecto y datos CN1 (una sola apertura del Excel)
+        project_info, df = extract_project_info_and_sheet(project_name, "dc_cn1_circuits")
         logger.info(f"[CN1-IEC] Proyecto: {project_name}")
 
-        # Cargar datos CN1
-        df = load_excel_sheet(project_name, sheet_name="dc_cn1_circuits")
         if df.empty:
             raise HTTPException(status_code=400, detail="No hay datos en 'dc_cn1_circuits'.")
 
@@ -424,6 +423,7 @@ def calculate_iec_cn1(project_name: str):
 
         # Usar función de cálculo específica para CN1
         results = calculate_all_cn1_circuits(df, config, circuit_type="cn1_inverter")
+        error_count = sum(1 for r in results if "error" in r)
 
         # Respuesta con información mejorada
         response_data = {
@@ -453,8 +453,8 @@ def calculate_iec_cn1(project_name: str):
             "results": results,
             "summary": {
                 "total_circuits": len(results),
-                "successful_calculations": len([r for r in results if "error" not in r]),
-                "errors": len([r for r in results if "error" in r]),
+                "successful_calculations": len(results) - error_count,
+                "errors": error_count,
                 "parallel_strings_range": get_parallel_strings_range(config.get('cn1_parallel_mapping', {})),
                 "current_statistics": get_current_range_from_results(results),
                 "section_statistics": get_section_range_from_results(results)
@@ -475,11 +475,10 @@ def calculate_nec_cn1(project_name: str):
     CORREGIDO: Usa normalización consistente de circuit_id
     """
     try:
-        project_info = extract_project_info(project_name)
+        # Cargar proyecto y datos CN1 (una sola apertura del Excel)
+        project_info, df = extract_project_info_and_sheet(project_name, "dc_cn1_circuits")
         logger.info(f"[CN1-NEC] Proyecto: {project_name}")
 
-        # Cargar datos CN1
-        df = load_excel_sheet(project_name, sheet_name="dc_cn1_circuits")
         if df.empty:
             raise HTTPException(status_code=400, detail="No hay datos en 'dc_cn1_circuits'.")
 
@@ -497,6 +496,7 @@ def calculate_nec_cn1(project_name: str):
 
         # Usar función de cálculo específica para CN1
         results = calculate_all_cn1_circuits(df, config, circuit_type="cn1_inverter")
+        error_count = sum(1 for r in results if "error" in r)
 
         # Respuesta con información mejorada
         response_data = {
@@ -526,8 +526,8 @@ def calculate_nec_cn1(project_name: str):
             "results": results,
             "summary": {
                 "total_circuits": len(results),
-                "successful_calculations": len([r for r in results if "error" not in r]),
-                "errors": len([r for r in results if "error" in r]),
+                "successful_calculations": len(results) - error_count,
+                "errors": error_count,
                 "parallel_strings_range": get_parallel_strings_range(config.get('cn1_parallel_mapping', {})),
                 "current_statistics": get_current_range_from_results(results),
                 "section_statistics": get_section_range_from_results(results)
@@ -6,10 +6,9 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from app.services.loader.project_loader import extract_project_info
+from app.services.loader.project_loader import extract_project_info_and_sheet
 from app.services.config_loader import build_calculation_config
 from app.services.calculation.string_calculator import calculate_all_strings
-from app.utils.filesystem import load_excel_sheet
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -94,16 +93,15 @@ def extract_real_factors_from_config(config: dict) -> dict:
 # ==============================================================================
 # 📘 Endpoint IEC - Cálculo de strings con normativa IEC
 # ==============================================================================
-@router.get("/calculate-iec-strings/{project_name}")
+@router.get("/calculate-iec-strings/{project_name}", response_model=None)
 def calculate_iec_strings(project_name: str):
     """
     Calcula únicamente strings (dc_strings) usando normativa IEC para un proyecto.
     """
     try:
-        project_info = extract_project_info(project_name)
+        project_info, df = extract_project_info_and_sheet(project_name, "dc_string_circuits")
         logger.info(f"[IEC] Proyecto cargado: {project_name}, panel: {project_info.get('panel_model')}")
 
-        df = load_excel_sheet(project_name, sheet_name="dc_string_circuits")
         if df.empty:
             raise HTTPException(status_code=400, detail="No hay datos en la hoja 'dc_string_circuits'.")
 
@@ -121,6 +119,7 @@ def calculate_iec_strings(project_name: str):
             logger.info(f"[IEC] Overrides aplicados: {count} parámetros modificados")
 
         results = calculate_all_strings(df, config, circuit_type="dc_strings")
+        error_count = sum(1 for r in results if "error" in r)
 
         # 🔥 NUEVO: Extraer factores reales usados
         real_factors = extract_real_factors_from_config(config)
@@ -152,8 +151,8 @@ def calculate_iec_strings(project_name: str):
             "results": results,
             "summary": {
                 "total_circuits": len(results),
-                "successful_calculations": len([r for r in results if "error" not in r]),
-                "errors": len([r for r in results if "error" in r])
+                "successful_calculations": len(results) - error_count,
+                "errors": error_count
             },
             "metadata": config['_metadata']
         }
@@ -177,17 +176,16 @@ def calculate_iec_strings(project_name: str):
 # ==============================================================================
 # 📙 Endpoint NEC - Cálculo de strings con normativa NEC
 # ==============================================================================
-@router.get("/calculate-nec-strings/{project_name}")
+@router.get("/calculate-nec-strings/{project_name}", response_model=None)
 def calculate_nec_strings(project_name: str):
     """
     Calcula los circuitos string DC usando la normativa NEC.
     Considera overrides específicos del proyecto si existen.
     """
     try:
-        project_info = extract_project_info(project_name)
+        project_info, df = extract_project_info_and_sheet(project_name, "dc_string_circuits")
         logger.info(f"[NEC] Proyecto cargado: {project_info.get('project_name')}, Panel: {project_info.get('panel_model')}")
 
-        df = load_excel_sheet(project_name, sheet_name="dc_string_circuits")
         if df.empty:
             raise HTTPException(status_code=400, detail="La hoja dc_string_circuits está vacía.")
 
@@ -201,6 +199,7 @@ def calculate_nec_strings(project_name: str):
         config["_metadata"]["project_name"] = project_name
 
         results = calculate_all_strings(df, config, circuit_type="dc_strings")
+        error_count = sum(1 for r in results if "error" in r)
 
         # 🔥 NUEVO: Extraer factores reales usados también para NEC
         real_factors = extract_real_factors_from_config(config)
@@ -232,8 +231,8 @@ def calculate_nec_strings(project_name: str):
             "results": results,
             "summary": {
                 "total_circuits": len(results),
-                "successful_calculations": len([r for r in results if "error" not in r]),
-                "errors": len([r for r in results if "error" in r])
+                "successful_calculations": len(results) - error_count,
+                "errors": error_count
             },
             "metadata": config['_metadata']
         }
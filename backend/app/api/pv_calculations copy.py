@@ -55,8 +55,10 @@ from typing import Optional, Dict, Any
 import logging
 from app.models.string_params import StringCalculationParams
 from app.utils.filesystem import load_excel_sheet
-from app.services.loader.project_loader import extract_project_info
+from app.services.loader.project_loader import extract_project_info_and_sheet
 from app.services.parsing.parser import read_project_excel
+from app.services.calculation.string_calculator import calculate_all_strings
+from app.utils.executor import run_blocking
 import os
 # ============================================================================
 
@@ -79,11 +81,19 @@ except ImportError as e:
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Tipo de circuito → hoja del Excel de proyecto
+_SHEET_MAPPING = {
+    "dc_strings": "dc_string_circuits",
+    "level_1_dc": "dc_cn1_circuits",
+    "ac_circuits": "ac_circuits",
+    "mv_circuits": "mv_circuits"
+}
+
 # ============================================================================
 # STRING CALCULATION ENDPOINTS
 # ============================================================================
 
-@router.get("/calculate-strings/{project_name}")
+@router.get("/calculate-strings/{project_name}", response_model=None)
 def calculate_strings_with_standards(
     project_name: str, 
     circuit_type: str = Query("dc_strings", description="Circuit type: dc_strings, level_1_dc, ac_circuits, mv_circuits"),
@@ -94,23 +104,15 @@ def calculate_strings_with_standards(
     Now supports project-specific normative overrides.
     """
     try:
-        # 1. Load project information from Excel
-        project_info = extract_project_info(project_name)
-        logger.info(f"Project loaded: {project_info.get('project_name', 'N/A')}, Panel: {project_info.get('panel_model', 'N/A')}")
-        
-        # 2. Validate and load circuit data
-        sheet_mapping = {
-            "dc_strings": "dc_string_circuits",
-            "level_1_dc": "dc_cn1_circuits", 
-            "ac_circuits": "ac_circuits",
-            "mv_circuits": "mv_circuits"
-        }
-        
-        if circuit_type not in sheet_mapping:
+        # 1. Validate circuit type
+        try:
+            sheet_name = _SHEET_MAPPING[circuit_type]
+        except KeyError:
             raise HTTPException(status_code=400, detail=f"Invalid circuit type: {circuit_type}")
-        
-        sheet_name = sheet_mapping[circuit_type]
-        df = load_excel_sheet(project_name, sheet_name=sheet_name)
+
+        # 2. Load project information and circuit data (single workbook open)
+        project_info, df = extract_project_info_and_sheet(project_name, sheet_name)
+        logger.info(f"Project loaded: {project_info.get('project_name', 'N/A')}, Panel: {project_info.get('panel_model', 'N/A')}")
         
         if len(df) == 0:
             raise HTTPException(status_code=400, detail=f"No data in sheet {sheet_name}")
@@ -136,8 +138,8 @@ def calculate_strings_with_standards(
             logger.info(f"Using project overrides: {overrides_info.get('modified_count', 0)} parameters modified")
         
         # 4. Execute string calculations
-        from app.services.calculation.string_calculator import calculate_all_strings
         results = calculate_all_strings(df, config, circuit_type)
+        error_count = sum(1 for r in results if "error" in r)
         
         # 5. Build comprehensive response
         response = {
@@ -159,8 +161,8 @@ def calculate_strings_with_standards(
             "results": results,
             "summary": {
                 "total_circuits": len(results),
-                "successful_calculations": len([r for r in results if "error" not in r]),
-                "errors": len([r for r in results if "error" in r])
+                "successful_calculations": len(results) - error_count,
+                "errors": error_count
             },
             "metadata": config['_metadata']
         }
@@ -178,7 +180,7 @@ def calculate_strings_with_standards(
         logger.error(f"Unexpected error in calculation: {e}")
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
 
-@router.post("/calculate-strings-custom/{project_name}")
+@router.post("/calculate-strings-custom/{project_name}", response_model=None)
 def calculate_strings_with_custom_parameters(
     project_name: str, 
     params: StringCalculationParams,
@@ -192,34 +194,13 @@ def calculate_strings_with_custom_parameters(
     useful for specialized scenarios or advanced engineering analysis.
     """
     try:
-        # 1. Load project information
-        project_info = extract_project_info(project_name)
-        
-        # 2. Load circuit data based on type
-        sheet_mapping = {
-            "dc_strings": "dc_string_circuits",
-            "level_1_dc": "dc_cn1_circuits",
-            "ac_circuits": "ac_circuits", 
-            "mv_circuits": "mv_circuits"
-        }
-        
-        sheet_name = sheet_mapping.get(circuit_type, "dc_string_circuits")
-        df = load_excel_sheet(project_name, sheet_name=sheet_name)
+        # 1-2. Load project information and circuit data (single workbook open)
+        sheet_name = _SHEET_MAPPING.get(circuit_type, "dc_string_circuits")
+        project_info, df = extract_project_info_and_sheet(project_name, sheet_name)
         
         # 3. Convert Pydantic model to configuration dictionary
-        custom_params = {
-            "cable_material": params.cable_material,
-            "cable_max_temp": params.cable_max_temp,
-            "method": params.method,
-            "layout": params.layout,
-            "separation": params.separation,
-            "depth_cm": params.depth_cm,
-            "current_ambient": params.current_ambient,
-            "reference_voltage": params.reference_voltage,
-            "max_voltage_drop_pct": params.max_voltage_drop_pct,
-            "isc_correction": params.isc_correction,
-            "number_of_parallel_strings": params.number_of_parallel_strings
-        }
+        # isc_ref comes from the panel database, not from the custom overrides
+        custom_params = params.model_dump(exclude={"isc_ref"})
         
         # 4. Build configuration with custom parameter override
         config = build_calculation_config(
@@ -229,8 +210,8 @@ def calculate_strings_with_custom_parameters(
         )
         
         # 5. Execute calculations with custom config
-        from app.services.calculation.string_calculator import calculate_all_strings
         results = calculate_all_strings(df, config, circuit_type)
+        error_count = sum(1 for r in results if "error" in r)
         
         # 6. Structured response with custom parameter tracking
         response = {
@@ -246,8 +227,8 @@ def calculate_strings_with_custom_parameters(
             "results": results,
             "summary": {
                 "total_circuits": len(results),
-                "successful_calculations": len([r for r in results if "error" not in r]),
-                "errors": len([r for r in results if "error" in r])
+                "successful_calculations": len(results) - error_count,
+                "errors": error_count
             },
             "metadata": config['_metadata']
         }
@@ -782,7 +763,7 @@ def get_project_normative_status(project_name: str):
 # ============================================================================
 
 @router.get("/available-standards")
-def get_available_calculation_standards():
+async def get_available_calculation_standards():
     """
     Gets the list of available calculation standards/normatives.
     
@@ -790,7 +771,7 @@ def get_available_calculation_standards():
     and default selection for the frontend.
     """
     try:
-        normativas = get_available_normativas()
+        normativas = await run_blocking(get_available_normativas)
         return {
             "standards": normativas,
             "default": "IEC"
@@ -850,7 +831,7 @@ def get_base_normative_parameters(normative: str):
         raise HTTPException(status_code=500, detail=f"Error getting parameters: {str(e)}")
 
 @router.get("/available-panels")
-def get_available_panel_database():
+async def get_available_panel_database():
     """
     Gets the list of available solar panels in the database.
     
@@ -858,7 +839,7 @@ def get_available_panel_database():
     Used by frontend for panel selection and automatic parameter loading.
     """
     try:
-        panels = get_available_panels()
+        panels = await run_blocking(get_available_panels)
         return {
             "panels": panels,
             "total": len(panels)
@@ -889,7 +870,6 @@ def calculate_strings_legacy_mode(project_name: str):
     try:
         df = load_excel_sheet(project_name, sheet_name="dc_string_circuits")
         config = load_yaml_config("configs/string_config.yaml")
-        from app.services.calculation.string_calculator import calculate_all_strings
         results = calculate_all_strings(df, config)
         
         logger.warning(f"Legacy calculation used for {project_name}. Consider migrating to new endpoint.")
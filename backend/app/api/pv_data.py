@@ -70,24 +70,152 @@ Version: 1.0.0
 Maintainer: Solar Engineering Team
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pathlib import Path
 import os
+import datetime
 import numpy as np
 import pandas as pd
 import logging
+import orjson
+from concurrent.futures import FIRST_EXCEPTION, wait
 
 # Data processing imports
-from app.services.parsing.parser import read_project_excel
+from app.services.parsing.parser import ParsedWorkbook, discard_sheet_cache, read_project_excel
+from app.utils.executor import EXECUTOR, run_blocking
+from app.utils.filesystem import project_excel_path
 from app.services.validation.project_validator import validate_project_info
 from app.services.validation.dc_string_validator import validate_dc_string_circuits  
 from app.services.validation.dc_cn1_validator import validate_dc_cn1_circuits
 from app.services.validation.mv_validator import validate_mv_circuits
 
+# Optional Arrow IPC output for table-rendering clients
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Hojas esperadas en input.xlsx (tupla para el orden de los mensajes, frozenset para búsquedas O(1))
+_SHEET_NAMES = ("project_info", "dc_string_circuits", "dc_cn1_circuits", "ac_circuits", "mv_circuits")
+_ALLOWED_SHEETS = frozenset(_SHEET_NAMES)
+_CIRCUIT_SHEETS = _SHEET_NAMES[1:]
+_CONSISTENCY_SHEETS = ("dc_string_circuits", "dc_cn1_circuits", "ac_circuits")
+
+# Tipos numéricos usados en los análisis (evita reconstruir listas por petición)
+_NUMERIC_DTYPES = (np.number,)
+
+# Validadores de contenido por hoja (independientes entre sí)
+_CONTENT_VALIDATORS = (
+    ("project_info", validate_project_info),
+    ("dc_string_circuits", validate_dc_string_circuits),
+    ("dc_cn1_circuits", validate_dc_cn1_circuits),
+    # Note: AC circuits validation not implemented yet
+    ("mv_circuits", validate_mv_circuits),
+)
+
+# Minimum rows before the IQR outlier check is worth running
+_MIN_ROWS_FOR_OUTLIERS = 5
+
+# ============================================================================
+# SHEET PARSING HELPERS (blocking - run via run_blocking from async routes)
+# ============================================================================
+
+def _json_default(value):
+    """orjson fallback: dates/timestamps as ISO strings (as FastAPI's encoder did), anything else as str"""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+def _records_json(df: pd.DataFrame) -> bytes:
+    """
+    Serializes a sheet as a JSON records array (NaN → '') straight to bytes.
+    orjson writes floats with full round-trip precision (pandas' to_json
+    rounds to at most 15 decimal places).
+    """
+    records = df.fillna("").to_dict(orient="records")
+    return orjson.dumps(records, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS, default=_json_default)
+
+def _sheet_json(xl: ParsedWorkbook, sheet_name: str) -> tuple:
+    """Parses one sheet and returns (records JSON, row count)"""
+    df = xl.parse(sheet_name)
+    return _records_json(df), len(df)
+
+def _all_sheets_json(xl: ParsedWorkbook, sheet_names) -> tuple:
+    """
+    {sheet_name: records} JSON object for several sheets in a single blocking
+    call, plus the total row count. Built as bytes: no Python dict is decoded
+    and re-encoded by FastAPI.
+    """
+    parts = []
+    total_rows = 0
+    for sheet_name in sheet_names:
+        records, row_count = _sheet_json(xl, sheet_name)
+        parts.append(orjson.dumps(sheet_name) + b":" + records)
+        total_rows += row_count
+    return b"{" + b",".join(parts) + b"}", total_rows
+
+def _sheet_arrow(xl: ParsedWorkbook, sheet_name: str) -> bytes:
+    """Parses one sheet and serializes it as an Arrow IPC stream"""
+    table = pa.Table.from_pandas(xl.parse(sheet_name), preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+def _preview_records(xl: ParsedWorkbook, sheet_names: list, rows: int = 3) -> dict:
+    """Parses the first `rows` rows of each sheet, replacing NaN/Inf with None"""
+    # Parse all sheets in one call, reading only the preview rows
+    sheets = xl.parse(sheet_name=sheet_names, nrows=rows)
+
+    preview = {}
+    for sheet_name, df in sheets.items():
+        # Vectorized NaN/Inf → None (object dtype so None is not coerced back to NaN)
+        valid = df.notna() & ~df.isin([np.inf, -np.inf])
+        preview[sheet_name] = df.astype(object).where(valid, None).to_dict(orient="records")
+    return preview
+
+def _project_file_etag(project_name: str):
+    """Weak ETag of the project's input.xlsx from its mtime and size (None if missing)"""
+    try:
+        stat = os.stat(project_excel_path(project_name))
+    except OSError:
+        return None
+    return f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+def _is_not_modified(request: Request, etag: str) -> bool:
+    """True when the client's If-None-Match already matches `etag`"""
+    if_none_match = request.headers.get("if-none-match")
+    if not etag or not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+def _discard_project_file(file_path: Path) -> bool:
+    """
+    Deletes an invalid upload (a single unlink) and its parsed-sheet cache.
+    Returns True if a file was actually removed.
+    """
+    try:
+        file_path.unlink()
+    except FileNotFoundError:
+        return False
+    finally:
+        discard_sheet_cache(file_path)
+    return True
+
+def _first_column_values(df: pd.DataFrame, pattern: str) -> set:
+    """Distinct values (as str) of the first column whose lowercase name matches `pattern`"""
+    matches = np.flatnonzero(df.columns.str.lower().str.contains(pattern, regex=True, na=False))
+    if not matches.size:
+        return set()
+    return set(df.iloc[:, matches[0]].dropna().to_numpy().astype(str).tolist())
+
 # ============================================================================
 # EXCEL VALIDATION ENDPOINTS
 # ============================================================================
@@ -144,26 +272,32 @@ def validate_complete_excel_content(project_name: str):
     xl = xl_or_msg
     errors = []
 
+    futures = []
     try:
-        # Validate each sheet with specific business rules
-        errors += validate_project_info(xl.parse("project_info"))
-        errors += validate_dc_string_circuits(xl.parse("dc_string_circuits"))
-        errors += validate_dc_cn1_circuits(xl.parse("dc_cn1_circuits"))
-        # Note: AC circuits validation not implemented yet
-        errors += validate_mv_circuits(xl.parse("mv_circuits"))
+        # Validate each sheet with specific business rules (sheets are independent)
+        futures = [EXECUTOR.submit(validator, xl.parse(sheet_name)) for sheet_name, validator in _CONTENT_VALIDATORS]
+        # Stop waiting as soon as one validator fails
+        wait(futures, return_when=FIRST_EXCEPTION)
+        # Collected in validator order so the error list stays stable
+        for future in futures:
+            errors += future.result()
         
     except Exception as e:
+        for future in futures:
+            future.cancel()
         logger.error(f"Error during validation of {project_name}: {e}")
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
     if errors:
         # Only remove file for critical structural errors, not warnings
-        critical_errors = [e for e in errors if not any(x in e for x in ["Warning", "Info"])]
-        
+        critical_errors = []
+        for error in errors:
+            if "Warning" not in error and "Info" not in error:
+                critical_errors.append(error)
+
         if critical_errors:
-            file_path = Path(f"projects/{project_name}/input.xlsx")
-            if file_path.exists():
-                os.remove(file_path)
+            file_path = project_excel_path(project_name)
+            if _discard_project_file(file_path):
                 logger.info(f"Excel file removed due to critical errors: {file_path}")
             logger.error(f"Critical validation errors for {project_name}: {critical_errors}")
         else:
@@ -176,7 +310,7 @@ def validate_complete_excel_content(project_name: str):
     return {"message": "Excel content is valid."}
 
 @router.get("/validate-excel-structure/{project_name}")
-def validate_excel_file_structure(project_name: str):
+async def validate_excel_file_structure(project_name: str):
     """
     Validates only the Excel file structure without content validation.
     
@@ -203,7 +337,7 @@ def validate_excel_file_structure(project_name: str):
     Example:
         GET /validate-excel-structure/project1
     """
-    success, result = read_project_excel(project_name)
+    success, result = await run_blocking(read_project_excel, project_name)
     if not success:
         raise HTTPException(status_code=400, detail=result)
     
@@ -214,8 +348,8 @@ def validate_excel_file_structure(project_name: str):
 # DATA EXTRACTION ENDPOINTS
 # ============================================================================
 
-@router.get("/excel-data/{project_name}")
-def get_complete_excel_data(project_name: str):
+@router.get("/excel-data/{project_name}", response_model=None)
+async def get_complete_excel_data(project_name: str, request: Request):
     """
     Extracts all data from the Excel file in JSON format.
 
@@ -250,35 +384,35 @@ def get_complete_excel_data(project_name: str):
             "ac_circuits": [...],
             "mv_circuits": [...]
         }
+
+        Repeat requests with `If-None-Match: <ETag>` get a 304 while the file is unchanged.
     """
+    # The data only changes when input.xlsx is re-uploaded
+    etag = _project_file_etag(project_name)
+    if _is_not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
-    success, xl_or_msg = read_project_excel(project_name)
+    success, xl_or_msg = await run_blocking(read_project_excel, project_name)
     if not success:
         raise HTTPException(status_code=400, detail=xl_or_msg)
 
     xl = xl_or_msg
     try:
-        # Extract all sheets with data cleaning
-        data = {
-            "project_info": xl.parse("project_info").fillna("").to_dict(orient="records"),
-            "dc_string_circuits": xl.parse("dc_string_circuits").fillna("").to_dict(orient="records"),
-            "dc_cn1_circuits": xl.parse("dc_cn1_circuits").fillna("").to_dict(orient="records"),
-            "ac_circuits": xl.parse("ac_circuits").fillna("").to_dict(orient="records"),
-            "mv_circuits": xl.parse("mv_circuits").fillna("").to_dict(orient="records"),
-        }
+        # Extract all sheets with data cleaning (one worker hand-off for the whole workbook)
+        content, total_rows = await run_blocking(_all_sheets_json, xl, _SHEET_NAMES)
         
         # Log extraction metrics
-        total_rows = sum(len(sheet_data) for sheet_data in data.values())
         logger.info(f"Data extracted successfully from {project_name}: {total_rows} total rows")
         
-        return data
+        headers = {"ETag": etag} if etag else None
+        return Response(content=content, media_type="application/json", headers=headers)
         
     except Exception as e:
         logger.error(f"Error reading data from {project_name}: {e}")
         raise HTTPException(status_code=500, detail=f"Error reading file: {str(e)}")
 
-@router.get("/excel-preview/{project_name}")
-def get_excel_data_preview(project_name: str):
+@router.get("/excel-preview/{project_name}", response_model=None)
+async def get_excel_data_preview(project_name: str):
     """
     Gets a limited preview of the Excel file (first 3 rows per sheet).
     
@@ -307,25 +441,18 @@ def get_excel_data_preview(project_name: str):
     Example:
         GET /excel-preview/large_solar_project
     """
-    success, xl_or_msg = read_project_excel(project_name)
+    success, xl_or_msg = await run_blocking(read_project_excel, project_name)
     if not success:
         raise HTTPException(status_code=400, detail=xl_or_msg)
 
     xl = xl_or_msg
 
     try:
-        def safe_parse_preview(sheet_name):
-            """Helper function to safely parse sheet preview with data cleaning"""
-            df = xl.parse(sheet_name).replace({np.nan: None, np.inf: None, -np.inf: None})
-            return df.head(3).to_dict(orient="records")
-
-        preview = {
-            "project_info": safe_parse_preview("project_info"),
-            "dc_string_circuits": safe_parse_preview("dc_string_circuits"),
-            "dc_cn1_circuits": safe_parse_preview("dc_cn1_circuits"),
-            "ac_circuits": safe_parse_preview("ac_circuits"),
-            "mv_circuits": safe_parse_preview("mv_circuits"),
-        }
+        preview = await run_blocking(
+            _preview_records,
+            xl,
+            _SHEET_NAMES
+        )
 
         logger.info(f"Preview generated for {project_name}")
         return preview
@@ -334,8 +461,8 @@ def get_excel_data_preview(project_name: str):
         logger.error(f"Error generating preview for {project_name}: {e}")
         raise HTTPException(status_code=500, detail=f"Error reading Excel: {str(e)}")
 
-@router.get("/excel-sheet/{project_name}/{sheet_name}")
-def get_specific_excel_sheet(project_name: str, sheet_name: str):
+@router.get("/excel-sheet/{project_name}/{sheet_name}", response_model=None)
+async def get_specific_excel_sheet(project_name: str, sheet_name: str, request: Request):
     """
     Gets data from a specific Excel sheet.
     
@@ -350,7 +477,9 @@ def get_specific_excel_sheet(project_name: str, sheet_name: str):
         sheet_name: Name of the sheet to retrieve
         
     Returns:
-        Data from the specified sheet with metadata
+        Data from the specified sheet with metadata, or the raw sheet as an
+        Arrow IPC stream when the request sends
+        `Accept: application/vnd.apache.arrow.stream` and pyarrow is installed
         
     Raises:
         HTTPException 400: If sheet name is invalid or data cannot be read
@@ -374,36 +503,35 @@ def get_specific_excel_sheet(project_name: str, sheet_name: str):
         }
     """
     # Validate sheet names against expected structure
-    allowed_sheets = [
-        "project_info", 
-        "dc_string_circuits", 
-        "dc_cn1_circuits", 
-        "ac_circuits", 
-        "mv_circuits"
-    ]
-    
-    if sheet_name not in allowed_sheets:
+    if sheet_name not in _ALLOWED_SHEETS:
         raise HTTPException(
             status_code=400, 
-            detail=f"Invalid sheet name '{sheet_name}'. Valid sheets: {allowed_sheets}"
+            detail=f"Invalid sheet name '{sheet_name}'. Valid sheets: {list(_SHEET_NAMES)}"
         )
     
-    success, xl_or_msg = read_project_excel(project_name)
+    success, xl_or_msg = await run_blocking(read_project_excel, project_name)
     if not success:
         raise HTTPException(status_code=400, detail=xl_or_msg)
 
     xl = xl_or_msg
+
+    # Arrow IPC when the client asks for it (and pyarrow is installed)
+    if PYARROW_AVAILABLE and ARROW_STREAM_MEDIA_TYPE in request.headers.get("accept", ""):
+        try:
+            content = await run_blocking(_sheet_arrow, xl, sheet_name)
+            return Response(content=content, media_type=ARROW_STREAM_MEDIA_TYPE)
+        except Exception as e:
+            logger.warning(f"Arrow serialization failed for '{sheet_name}', falling back to JSON: {e}")
+
     try:
         # Extract specific sheet with data cleaning
-        sheet_data = xl.parse(sheet_name).fillna("").to_dict(orient="records")
+        sheet_data, row_count = await run_blocking(_sheet_json, xl, sheet_name)
         
-        logger.info(f"Sheet '{sheet_name}' data extracted from {project_name}: {len(sheet_data)} rows")
+        logger.info(f"Sheet '{sheet_name}' data extracted from {project_name}: {row_count} rows")
         
-        return {
-            "sheet_name": sheet_name,
-            "data": sheet_data,
-            "row_count": len(sheet_data)
-        }
+        content = (b'{"sheet_name":' + orjson.dumps(sheet_name) + b',"data":' + sheet_data
+                   + b',"row_count":' + orjson.dumps(row_count) + b"}")
+        return Response(content=content, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error reading sheet '{sheet_name}' from {project_name}: {e}")
@@ -453,13 +581,13 @@ def get_excel_file_information(project_name: str):
     xl = xl_or_msg
     try:
         # Get file path for metadata
-        file_path = Path(f"projects/{project_name}/input.xlsx")
+        file_path = project_excel_path(project_name)
         
         # Collect sheet information
         sheet_details = {}
         total_rows = 0
         
-        for sheet_name in ["project_info", "dc_string_circuits", "dc_cn1_circuits", "ac_circuits", "mv_circuits"]:
+        for sheet_name in _SHEET_NAMES:
             try:
                 df = xl.parse(sheet_name)
                 rows = len(df)
@@ -469,21 +597,21 @@ def get_excel_file_information(project_name: str):
             except Exception:
                 sheet_details[sheet_name] = {"rows": 0, "columns": 0, "error": "Sheet not found or readable"}
         
-        # File metadata
+        # File metadata (a single stat call also tells us whether the file exists)
         file_info = {
             "sheets": list(sheet_details.keys()),
             "total_rows": total_rows,
-            "file_exists": file_path.exists()
         }
         
-        if file_path.exists():
-            import os
-            import datetime
+        try:
             stat = os.stat(file_path)
             file_info.update({
+                "file_exists": True,
                 "file_size_bytes": stat.st_size,
                 "last_modified": datetime.datetime.fromtimestamp(stat.st_mtime).isoformat()
             })
+        except FileNotFoundError:
+            file_info["file_exists"] = False
         
         return {
             "file_info": file_info,
@@ -547,36 +675,48 @@ def analyze_data_quality(project_name: str):
         
         total_issues = 0
         
-        for sheet_name in ["project_info", "dc_string_circuits", "dc_cn1_circuits", "ac_circuits", "mv_circuits"]:
+        for sheet_name in _SHEET_NAMES:
             try:
                 df = xl.parse(sheet_name)
                 
-                # Calculate completeness
+                # Empty sheet: nothing to measure, skip the pandas work
+                if df.empty:
+                    analysis["sheet_analysis"][sheet_name] = {
+                        "completeness": 0,
+                        "missing_fields": [],
+                        "outliers": [],
+                        "row_count": 0,
+                        "column_count": len(df.columns)
+                    }
+                    continue
+                
+                # Calculate completeness (one 2-D null mask, reduced in C)
+                null_mask = df.isna().to_numpy()
+                null_counts = null_mask.sum(axis=0)
                 total_cells = df.size
-                missing_cells = df.isnull().sum().sum()
+                missing_cells = int(np.count_nonzero(null_mask))
                 completeness = ((total_cells - missing_cells) / total_cells * 100) if total_cells > 0 else 0
-                
+
                 # Find missing fields (columns with >50% missing data)
-                missing_fields = []
-                for col in df.columns:
-                    missing_pct = (df[col].isnull().sum() / len(df) * 100) if len(df) > 0 else 0
-                    if missing_pct > 50:
-                        missing_fields.append(col)
-                        total_issues += 1
+                missing_pct = null_counts / max(len(df), 1) * 100
+                missing_fields = df.columns[missing_pct > 50].tolist()
+                total_issues += len(missing_fields)
                 
                 # Check for obvious outliers (very rough check)
+                # Quartiles are meaningless on a handful of rows (e.g. project_info)
                 outliers = []
-                numeric_cols = df.select_dtypes(include=[np.number]).columns
-                for col in numeric_cols:
-                    if len(df[col].dropna()) > 0:
-                        Q1 = df[col].quantile(0.25)
-                        Q3 = df[col].quantile(0.75)
-                        IQR = Q3 - Q1
-                        lower_bound = Q1 - 1.5 * IQR
-                        upper_bound = Q3 + 1.5 * IQR
-                        outlier_count = len(df[(df[col] < lower_bound) | (df[col] > upper_bound)])
-                        if outlier_count > 0:
-                            outliers.append({"column": col, "count": outlier_count})
+                if len(df) >= _MIN_ROWS_FOR_OUTLIERS:
+                    # All quartiles in one call; NaN is skipped by quantile and never counted
+                    numeric = df.select_dtypes(include=_NUMERIC_DTYPES)
+                    quartiles = numeric.quantile([0.25, 0.75])
+                    iqr = quartiles.loc[0.75] - quartiles.loc[0.25]
+                    lower_bound = quartiles.loc[0.25] - 1.5 * iqr
+                    upper_bound = quartiles.loc[0.75] + 1.5 * iqr
+                    outlier_counts = ((numeric < lower_bound) | (numeric > upper_bound)).sum()
+                    outliers = [
+                        {"column": col, "count": int(count)}
+                        for col, count in outlier_counts.items() if count > 0
+                    ]
                 
                 analysis["sheet_analysis"][sheet_name] = {
                     "completeness": round(completeness, 1),
@@ -652,7 +792,7 @@ def compare_sheet_consistency(project_name: str):
         
         # Load relevant sheets for comparison
         sheets_data = {}
-        for sheet_name in ["dc_string_circuits", "dc_cn1_circuits", "ac_circuits"]:
+        for sheet_name in _CONSISTENCY_SHEETS:
             try:
                 sheets_data[sheet_name] = xl.parse(sheet_name)
             except Exception:
@@ -666,18 +806,8 @@ def compare_sheet_consistency(project_name: str):
             dc_cn1 = sheets_data["dc_cn1_circuits"]
             
             # Look for common ID columns
-            string_ids = set()
-            cn1_ids = set()
-            
-            for col in dc_strings.columns:
-                if 'id' in col.lower() or 'string' in col.lower():
-                    string_ids.update(dc_strings[col].dropna().astype(str).tolist())
-                    break
-            
-            for col in dc_cn1.columns:
-                if 'id' in col.lower() or 'circuit' in col.lower():
-                    cn1_ids.update(dc_cn1[col].dropna().astype(str).tolist())
-                    break
+            string_ids = _first_column_values(dc_strings, "id|string")
+            cn1_ids = _first_column_values(dc_cn1, "id|circuit")
             
             if string_ids and cn1_ids:
                 missing_in_cn1 = string_ids - cn1_ids
@@ -726,7 +856,7 @@ def compare_sheet_consistency(project_name: str):
 # ============================================================================
 
 @router.get("/export-json/{project_name}")
-def export_project_data_as_json(project_name: str, pretty: bool = Query(True)):
+def export_project_data_as_json(project_name: str, request: Request, pretty: bool = Query(True)):
     """
     Exports complete project data as downloadable JSON file.
     
@@ -735,38 +865,42 @@ def export_project_data_as_json(project_name: str, pretty: bool = Query(True)):
         pretty: Whether to format JSON with indentation
         
     Returns:
-        JSON file download response
+        JSON file download response (304 if the client's ETag still matches)
     """
-    from fastapi.responses import JSONResponse
-    
+    etag = _project_file_etag(project_name)
+    if _is_not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
     success, xl_or_msg = read_project_excel(project_name)
     if not success:
         raise HTTPException(status_code=400, detail=xl_or_msg)
 
     xl = xl_or_msg
     try:
-        # Get complete data
-        export_data = {
-            "project_name": project_name,
-            "export_timestamp": pd.Timestamp.now().isoformat(),
-            "data": {
-                "project_info": xl.parse("project_info").fillna("").to_dict(orient="records"),
-                "dc_string_circuits": xl.parse("dc_string_circuits").fillna("").to_dict(orient="records"),
-                "dc_cn1_circuits": xl.parse("dc_cn1_circuits").fillna("").to_dict(orient="records"),
-                "ac_circuits": xl.parse("ac_circuits").fillna("").to_dict(orient="records"),
-                "mv_circuits": xl.parse("mv_circuits").fillna("").to_dict(orient="records"),
-            }
-        }
-        
+        # Resolve every sheet up front so missing sheets still fail with a 500
+        # before the response starts streaming
+        sheets = {sheet_name: xl.parse(sheet_name) for sheet_name in _SHEET_NAMES}
+        export_timestamp = pd.Timestamp.now().isoformat()
+
+        def generate_export():
+            # One sheet at a time: never holds the whole export as Python objects
+            yield (b'{"project_name":' + orjson.dumps(project_name)
+                   + b',"export_timestamp":' + orjson.dumps(export_timestamp) + b',"data":{')
+            for index, (sheet_name, df) in enumerate(sheets.items()):
+                yield (b"," if index else b"") + orjson.dumps(sheet_name) + b":" + _records_json(df)
+            yield b"}}"
+
         logger.info(f"JSON export completed for {project_name}")
         
         # Return as downloadable file
         headers = {
             "Content-Disposition": f"attachment; filename={project_name}_data.json"
         }
+        if etag:
+            headers["ETag"] = etag
         
-        return JSONResponse(
-            content=export_data,
+        return StreamingResponse(
+            generate_export(),
             headers=headers,
             media_type="application/json"
         )
@@ -837,7 +971,7 @@ def get_project_data_summary(project_name: str):
         total_rows = 0
         populated_sheets = 0
         
-        for sheet_name in ["dc_string_circuits", "dc_cn1_circuits", "ac_circuits", "mv_circuits"]:
+        for sheet_name in _CIRCUIT_SHEETS:
             try:
                 df = xl.parse(sheet_name)
                 if len(df) > 0:
@@ -846,16 +980,16 @@ def get_project_data_summary(project_name: str):
                     
                     # Add sheet-specific metrics
                     if sheet_name == "dc_string_circuits":
-                        numeric_cols = df.select_dtypes(include=[np.number]).columns
-                        if len(numeric_cols) > 0:
+                        numeric = df.select_dtypes(include=_NUMERIC_DTYPES)
+                        if len(numeric.columns) > 0:
                             summary["key_metrics"]["string_circuits"] = len(df)
                             
-                            # Look for current and voltage columns
-                            for col in df.columns:
-                                if 'current' in col.lower() and df[col].dtype in [np.float64, np.int64]:
-                                    avg_current = df[col].mean()
-                                    if not np.isnan(avg_current):
-                                        summary["key_metrics"]["avg_string_current"] = round(avg_current, 2)
+                            # Look for current columns: one mean() over all of them
+                            current_cols = numeric.columns[numeric.columns.str.contains("current", case=False, na=False)]
+                            current_means = numeric[current_cols].mean().dropna()
+                            if len(current_means) > 0:
+                                # Last matching column wins, as before
+                                summary["key_metrics"]["avg_string_current"] = round(float(current_means.iloc[-1]), 2)
                                         
             except Exception as e:
                 summary["warnings"].append(f"Could not analyze {sheet_name}: {str(e)}")
@@ -863,7 +997,7 @@ def get_project_data_summary(project_name: str):
         summary["data_overview"] = {
             "sheets_populated": populated_sheets,
             "total_data_rows": total_rows,
-            "sheets_available": 5
+            "sheets_available": len(_SHEET_NAMES)
         }
         
         # Calculate completeness estimate
@@ -69,16 +69,15 @@ Maintainer: Solar Engineering Team
 from fastapi import APIRouter, HTTPException, UploadFile, File, Query
 from pydantic import BaseModel, ConfigDict
 import pandas as pd
-from pathlib import Path
-BASE_DIR = Path(__file__).resolve().parent.parent.parent  # apunta a calcapp/
-PROJECTS_DIR = BASE_DIR / "projects"
 from typing import Dict, Any
 import logging
+import os
+import datetime
 import shutil
 
 # Project management imports
-from app.utils.filesystem import create_project_folder, save_excel_file
-from app.services.parsing.parser import read_project_excel
+from app.utils.filesystem import PROJECTS_DIR, create_project_folder, save_excel_file
+from app.services.parsing.parser import check_required_sheets, discard_sheet_cache, read_project_excel
 from app.services.loader.project_loader import extract_project_info
 
 logger = logging.getLogger(__name__)
@@ -205,32 +204,32 @@ def list_all_projects():
         projects = []
         summary = {"with_excel": 0, "without_excel": 0, "ready_for_calculation": 0}
         
-        for project_dir in project_root.iterdir():
-            if project_dir.is_dir():
-                project_info = {"name": project_dir.name}
+        # scandir: el tipo de cada entrada viene del propio listado, sin un stat por carpeta
+        with os.scandir(project_root) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                project_info = {"name": entry.name}
                 
-                # Check for Excel file
-                excel_path = project_dir / "input.xlsx"
-                project_info["has_excel"] = excel_path.exists()
+                # Check for Excel file (a single stat: existence, date and size)
+                excel_path = os.path.join(entry.path, "input.xlsx")
+                try:
+                    stat = os.stat(excel_path)
+                except FileNotFoundError:
+                    stat = None
+                project_info["has_excel"] = stat is not None
                 
-                if excel_path.exists():
+                if stat is not None:
                     summary["with_excel"] += 1
-                    import os
-                    import datetime
-                    stat = os.stat(excel_path)
                     project_info["last_modified"] = datetime.datetime.fromtimestamp(stat.st_mtime).isoformat()
                     project_info["file_size_mb"] = round(stat.st_size / (1024 * 1024), 2)
                     
-                    # Try to get project status
-                    try:
-                        # Quick check if project data is readable
-                        success, _ = read_project_excel(project_dir.name)
-                        if success:
-                            project_info["status"] = "ready_for_calculation"
-                            summary["ready_for_calculation"] += 1
-                        else:
-                            project_info["status"] = "excel_error"
-                    except Exception:
+                    # Status from the sheet names only (cached per file version): no sheet is parsed
+                    success, _ = check_required_sheets(excel_path, stat)
+                    if success:
+                        project_info["status"] = "ready_for_calculation"
+                        summary["ready_for_calculation"] += 1
+                    else:
                         project_info["status"] = "excel_error"
                 else:
                     summary["without_excel"] += 1
@@ -305,10 +304,12 @@ def delete_project_permanently(project_name: str, confirm: bool = Query(False)):
         # Log what will be deleted for audit trail
         deleted_items = []
         for item in project_path.rglob("*"):
-            if item.is_file():
+            # *.cache.pkl: derived caches (e.g. normativa.yaml), not project files
+            if item.is_file() and not item.name.endswith(".cache.pkl"):
                 deleted_items.append(str(item.relative_to(project_path)))
         
-        # Perform deletion
+        # Perform deletion (the parsed-sheet cache lives outside the project folder)
+        discard_sheet_cache(project_path / "input.xlsx")
         shutil.rmtree(project_path)
         
         import datetime
@@ -0,0 +1,101 @@
+"""
+Acceso a YAML para los servicios.
+
+Punto único donde se elige el parser: libyaml (extensión C) si PyYAML se
+compiló con ella; si no, el loader en Python puro. Expone la misma API que
+se usa en los módulos (safe_load, dump, YAMLError), más load_file para los
+archivos de configuración estáticos.
+"""
+
+import logging
+import mmap
+import os
+import pickle
+import tempfile
+
+import yaml
+from yaml import YAMLError, dump  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+# libyaml (extensión C) si está disponible; si no, el loader en Python puro
+try:
+    from yaml import CSafeLoader as SafeLoader
+    CYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader
+    CYAML_AVAILABLE = False
+
+# A partir de este tamaño el YAML se parsea desde un mmap en vez de leerlo a memoria.
+# Con los archivos actuales (~10 KB) el mmap es más lento que una lectura normal.
+YAML_MMAP_MIN_BYTES = 1024 * 1024
+
+
+def safe_load(stream):
+    """yaml.safe_load con el loader más rápido disponible"""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def load_file(path, stat: os.stat_result = None):
+    """
+    YAML de un archivo de configuración.
+
+    El resultado se guarda en un pickle junto al archivo (archivo.yaml.cache.pkl,
+    mismo formato que usa script_verificacion_corregido.py) ligado a su versión
+    (mtime + tamaño): en un proceso nuevo la configuración se carga sin parsear YAML.
+    """
+    path = os.fspath(path)
+    if stat is None:
+        stat = os.stat(path)
+
+    cached = _read_sidecar(path, stat)
+    if cached is not None:
+        return cached["data"]
+
+    # Binario: libyaml detecta la codificación (UTF-8/BOM) sin la capa de texto de Python
+    with open(path, "rb") as f:
+        if stat.st_size >= YAML_MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                data = safe_load(mapped)
+        else:
+            data = safe_load(f)
+
+    _write_sidecar(path, stat, data)
+    return data
+
+
+def _sidecar_path(path: str) -> str:
+    return f"{path}.cache.pkl"
+
+
+def _read_sidecar(path: str, stat: os.stat_result):
+    """Pickle junto al YAML si corresponde a esta versión del archivo; None si no"""
+    cache_path = _sidecar_path(path)
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignorando caché ilegible {cache_path}: {e}")
+        return None
+
+    if cached.get("mtime_ns") != stat.st_mtime_ns or cached.get("size") != stat.st_size:
+        return None
+    return cached
+
+
+def _write_sidecar(path: str, stat: os.stat_result, data) -> None:
+    """Guarda el YAML parseado de forma atómica (temporal + os.replace); los fallos solo se registran"""
+    cache_path = _sidecar_path(path)
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "data": data}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"No se pudo escribir la caché {cache_path}: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
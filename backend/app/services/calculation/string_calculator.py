@@ -1,28 +1,89 @@
-import yaml
+from app.services import _yaml as yaml
+from app.services._yaml import CYAML_AVAILABLE
 import math
+import bisect
 import json
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional
 import logging
 import os
 from datetime import datetime
 from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 
 # Configurar logging
 logger = logging.getLogger(__name__)
 
+# Numba es opcional: sin él, el kernel de caídas de tensión se evalúa con NumPy
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Por debajo de este número de filas NumPy es suficiente (el arranque de hilos de Numba no compensa)
+NUMBA_MIN_ROWS = 5000
+
 # Cargar configuración global
 from app.services.config_loader import load_yaml_config
 
+NORMATIVAS_FILE = "configs/normativas.yaml"
+MATERIALS_FILE = "configs/material_properties.yaml"
+
+# Caché de YAML parseados: ruta -> ((mtime_ns, tamaño), datos)
+_YAML_CACHE: Dict[str, tuple] = {}
+
+def _load_cached(path: str):
+    """
+    Carga un YAML una sola vez mientras el archivo no cambie (mtime + tamaño).
+    
+    Los datos devueltos se comparten entre llamadas: no modificarlos
+    (hacer deepcopy antes si hace falta editarlos).
+    """
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    # Primer uso en el proceso: el pickle junto al YAML evita parsearlo si no cambió
+    data = yaml.load_file(path, stat)
+    _YAML_CACHE[path] = (version, data)
+    return data
+
+def preload_yaml_configs(paths=(NORMATIVAS_FILE, MATERIALS_FILE)) -> None:
+    """
+    Deja en la caché los YAML de configuración leyéndolos a la vez.
+    
+    Solo se paraleliza con el parser C (libyaml), que libera el GIL durante el
+    parseo; con el loader en Python puro los hilos no aportan y se leen en serie.
+    Los errores no se propagan aquí: el primer uso real los reporta.
+    """
+    def _preload(path):
+        try:
+            _load_cached(path)
+        except Exception as e:
+            logger.debug(f"Precarga de {path} fallida: {e}")
+
+    if CYAML_AVAILABLE and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            list(executor.map(_preload, paths))
+    else:
+        for path in paths:
+            _preload(path)
+
 def load_custom_normativa_fixed(override_file: str, base_normativa: str = "IEC"):
     """
     ✅ FUNCIÓN CRÍTICA FALTANTE: Carga normativa personalizada manteniendo estructura completa
     """
     try:
         # 1. Cargar normativa base completa
-        with open("configs/normativas.yaml") as f:
-            yaml_data = yaml.safe_load(f)
+        yaml_data = _load_cached(NORMATIVAS_FILE)
         
         if base_normativa not in yaml_data["normativas"]:
             logger.error(f"Normativa base '{base_normativa}' no encontrada")
@@ -151,7 +212,7 @@ def diagnose_normativa_structure(normativa_name: str = None) -> dict:
     ✅ FUNCIÓN CRÍTICA FALTANTE: Diagnostica la estructura de la normativa activa
     """
     if not normativa_name:
-        normativa_name = SECTIONS_CONFIG.get("normativa_used", "IEC")
+        normativa_name = _get_sections_config().get("normativa_used", "IEC")
     
     diagnosis = {
         "normativa": normativa_name,
@@ -216,7 +277,12 @@ def diagnose_normativa_structure(normativa_name: str = None) -> dict:
     return diagnosis
 
 def validate_config_parameters(config: dict) -> dict:
-    """✅ NUEVA FUNCIÓN: Valida y sanitiza parámetros de configuración"""
+    """
+    ✅ NUEVA FUNCIÓN: Valida y sanitiza parámetros de configuración
+    
+    No modifica `config` ni sus secciones (pueden venir compartidas de la caché
+    de build_calculation_config): las correcciones se escriben en copias.
+    """
     validated_config = config.copy()
     
     # Validar caída de tensión
@@ -225,13 +291,13 @@ def validate_config_parameters(config: dict) -> dict:
     
     if not (0.1 <= max_percentage <= 10.0):
         logger.warning(f"Caída de tensión {max_percentage}% fuera de rango válido (0.1-10%), usando 1.5%")
-        validated_config.setdefault("voltage_drop", {})["max_percentage"] = 1.5
+        validated_config["voltage_drop"] = {**validated_config.get("voltage_drop", {}), "max_percentage": 1.5}
     
     # Validar tensión de referencia
     v_ref = voltage_drop.get("reference_voltage", 1500)
     if v_ref <= 0:
         logger.warning(f"Tensión de referencia inválida {v_ref}V, usando 1500V")
-        validated_config["voltage_drop"]["reference_voltage"] = 1500
+        validated_config["voltage_drop"] = {**validated_config["voltage_drop"], "reference_voltage": 1500}
     
     # Validar número de strings en paralelo
     num_strings = validated_config.get("number_of_parallel_strings", 1)
@@ -250,6 +316,98 @@ def validate_config_parameters(config: dict) -> dict:
     
     return validated_config
 
+# Tablas de factores ya elegidas por normativa: id(normativa) -> (normativa, {clave: tabla o factor}).
+# Se guarda la referencia al dict para que su id no se reutilice mientras esté en caché.
+_FACTOR_TABLES_CACHE: Dict[int, tuple] = {}
+_FACTOR_TABLES_CACHE_MAX = 64
+
+def _normativa_factor_cache(normativa_config: dict) -> dict:
+    """Caché de tablas/factores de una normativa concreta (las normativas cargadas no se modifican)"""
+    entry = _FACTOR_TABLES_CACHE.get(id(normativa_config))
+    if entry is None or entry[0] is not normativa_config:
+        if len(_FACTOR_TABLES_CACHE) >= _FACTOR_TABLES_CACHE_MAX:
+            _FACTOR_TABLES_CACHE.clear()
+        entry = (normativa_config, {})
+        _FACTOR_TABLES_CACHE[id(normativa_config)] = entry
+    return entry[1]
+
+def _group_table(normativa_config: dict, method: str, layout: Optional[str]) -> Optional[dict]:
+    """
+    Tabla de agrupamiento para (method, layout), memorizada por normativa:
+    en un lote (method, layout) casi nunca cambia.
+    Devuelve {"values": tabla} o None si el método no tiene tabla.
+    """
+    cache = _normativa_factor_cache(normativa_config)
+    key = ("group", method, layout)
+    if key in cache:
+        return cache[key]
+
+    grouping_corr = normativa_config.get("grouping_factors", {})
+    method_data = grouping_corr[method]
+    group_table = {}
+
+    # Extraer tabla de valores
+    if isinstance(method_data, dict):
+        if layout and layout in method_data and "values" in method_data[layout]:
+            group_table = method_data[layout]["values"]
+            logger.debug(f"Usando tabla de agrupamiento '{layout}' para método '{method}'")
+        elif "values" in method_data:
+            group_table = method_data["values"]
+            logger.debug(f"Usando tabla de agrupamiento directa para método '{method}'")
+        else:
+            # Buscar primera tabla disponible
+            for table_key, value in method_data.items():
+                if isinstance(value, dict) and "values" in value:
+                    group_table = value["values"]
+                    logger.info(f"Usando tabla de agrupamiento '{table_key}' para método '{method}'")
+                    break
+
+    cache[key] = {"values": group_table} if group_table else None
+    return cache[key]
+
+def _group_ranges(table: dict) -> tuple:
+    """
+    Umbrales de rango ("10+", "6+", ...) ordenados de menor a mayor con sus factores,
+    calculados una vez por tabla para buscar con bisect en vez de recorrer las claves
+    """
+    if "ranges" not in table:
+        ranges = []
+        for key, value in table["values"].items():
+            if isinstance(key, str) and "+" in key:
+                try:
+                    ranges.append((int(key.replace("+", "")), float(value)))
+                except ValueError:
+                    continue
+        ranges.sort()
+        table["ranges"] = ([threshold for threshold, _ in ranges], [factor for _, factor in ranges])
+    return table["ranges"]
+
+def _group_numeric_keys(table: dict) -> list:
+    """Pares (número de circuitos, factor) de las claves numéricas, para la búsqueda por aproximación"""
+    if "numeric" not in table:
+        numeric_keys = []
+        for key, value in table["values"].items():
+            try:
+                if isinstance(key, (str, int)) and "+" not in str(key):
+                    numeric_keys.append((int(key), float(value)))
+            except ValueError:
+                continue
+        table["numeric"] = numeric_keys
+    return table["numeric"]
+
+def _group_int_lookup(table: dict) -> dict:
+    """
+    Tabla con claves enteras (número de circuitos -> factor): el YAML trae claves
+    int (1: 1.00) o texto ("1": 1.00); se normalizan una vez por tabla para
+    buscar con un solo hash de int, sin str() por llamada
+    """
+    if "by_int" not in table:
+        by_int = {}
+        for circuits, factor in _group_numeric_keys(table):
+            by_int.setdefault(circuits, factor)
+        table["by_int"] = by_int
+    return table["by_int"]
+
 def get_grouping_factor_safe(normativa_config: dict, number_of_circuits: int, 
                            method: str, layout: str) -> float:
     """✅ FUNCIÓN CORREGIDA: Obtiene factor de agrupamiento de forma segura"""
@@ -262,29 +420,13 @@ def get_grouping_factor_safe(normativa_config: dict, number_of_circuits: int,
             logger.warning(f"Método de instalación '{method}' no encontrado o inválido, usando factor {default_factor}")
             return default_factor
         
-        method_data = grouping_corr[method]
-        group_table = {}
-        
-        # Extraer tabla de valores
-        if isinstance(method_data, dict):
-            # ✅ CORRECCIÓN: Verificar que layout sea string antes de usar 'in'
-            if layout and isinstance(layout, str) and layout in method_data and "values" in method_data[layout]:
-                group_table = method_data[layout]["values"]
-                logger.debug(f"Usando tabla de agrupamiento '{layout}' para método '{method}'")
-            elif "values" in method_data:
-                group_table = method_data["values"]
-                logger.debug(f"Usando tabla de agrupamiento directa para método '{method}'")
-            else:
-                # Buscar primera tabla disponible
-                for key, value in method_data.items():
-                    if isinstance(value, dict) and "values" in value:
-                        group_table = value["values"]
-                        logger.info(f"Usando tabla de agrupamiento '{key}' para método '{method}'")
-                        break
+        # ✅ CORRECCIÓN: Verificar que layout sea string antes de usar 'in'
+        table = _group_table(normativa_config, method, layout if isinstance(layout, str) else None)
         
-        if not group_table:
+        if table is None:
             logger.warning(f"No se encontró tabla de agrupamiento para método '{method}', usando factor {default_factor}")
             return default_factor
+        group_table = table["values"]
         
         # ✅ CORRECCIÓN: Asegurar que number_of_circuits sea entero
         try:
@@ -293,40 +435,23 @@ def get_grouping_factor_safe(normativa_config: dict, number_of_circuits: int,
             logger.error(f"Número de circuitos inválido: {number_of_circuits}, usando factor {default_factor}")
             return default_factor
         
-        # Búsqueda del factor
-        str_circuits = str(number_of_circuits)
-        
-        # 1. Búsqueda exacta
-        if str_circuits in group_table:
-            factor = float(group_table[str_circuits])
-            logger.debug(f"Factor de agrupamiento exacto: {factor} para {number_of_circuits} strings")
+        # 1. Búsqueda exacta (claves ya normalizadas a int)
+        factor = _group_int_lookup(table).get(number_of_circuits)
+        if factor is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Factor de agrupamiento exacto: {factor} para {number_of_circuits} strings")
             return factor
         
-        # 2. Búsqueda por rangos (ej: "10+", "6+")
-        applicable_ranges = []
-        for key in group_table.keys():
-            if isinstance(key, str) and "+" in key:
-                try:
-                    threshold = int(key.replace("+", ""))
-                    if number_of_circuits >= threshold:
-                        applicable_ranges.append((threshold, float(group_table[key])))
-                except ValueError:
-                    continue
-        
-        if applicable_ranges:
-            applicable_ranges.sort(reverse=True)
-            factor = applicable_ranges[0][1]
+        # 2. Búsqueda por rangos (ej: "10+", "6+"): el mayor umbral <= number_of_circuits
+        thresholds, range_factors = _group_ranges(table)
+        idx = bisect.bisect_right(thresholds, number_of_circuits)
+        if idx:
+            factor = range_factors[idx - 1]
             logger.info(f"Usando factor de agrupamiento {factor} para {number_of_circuits} strings (rango aplicable)")
             return factor
         
         # 3. Búsqueda por aproximación
-        numeric_keys = []
-        for key in group_table.keys():
-            try:
-                if isinstance(key, (str, int)) and "+" not in str(key):
-                    numeric_keys.append((int(key), float(group_table[key])))
-            except ValueError:
-                continue
+        numeric_keys = _group_numeric_keys(table)
         
         if numeric_keys:
             closest = min(numeric_keys, key=lambda x: abs(x[0] - number_of_circuits))
@@ -379,7 +504,7 @@ def diagnose_config(config: dict) -> dict:
             "voltage_drop_pct": max_pct,
             "reference_voltage": v_ref,
             "parallel_strings": num_strings,
-            "normativa": SECTIONS_CONFIG.get("normativa_used")
+            "normativa": _get_sections_config().get("normativa_used")
         }
         
         if diagnosis["errors"]:
@@ -393,12 +518,28 @@ def diagnose_config(config: dict) -> dict:
     
     return diagnosis
 
+def _load_normativas_yaml() -> dict:
+    """normativas.yaml parseado, con los mismos errores que reporta la validación"""
+    try:
+        return _load_cached(NORMATIVAS_FILE)
+    except FileNotFoundError:
+        raise FileNotFoundError("No se encontró el archivo configs/normativas.yaml")
+    except Exception as e:
+        raise ValueError(f"Error validando YAML de normativas: {str(e)}")
+
 def validate_normativas_yaml():
-    """Valida que el YAML de normativas tenga la estructura correcta"""
+    """
+    Valida que el YAML de normativas tenga la estructura correcta
+    
+    Usa el mismo parseo en caché que load_sections_config: no se hace una lectura
+    parcial de la cabecera porque la validación necesita las secciones de la primera
+    normativa y el parseo completo se reaprovecha de todos modos al cargar secciones.
+    """
+    return _validate_normativas_data(_load_normativas_yaml())
+
+def _validate_normativas_data(yaml_data: dict) -> str:
+    """Valida la estructura de un YAML de normativas ya parseado"""
     try:
-        with open("configs/normativas.yaml") as f:
-            yaml_data = yaml.safe_load(f)
-        
         # Verificar estructura básica
         if "normativas" not in yaml_data:
             raise ValueError("El YAML debe tener una clave 'normativas'")
@@ -445,22 +586,52 @@ def validate_normativas_yaml():
             
         return "normativas_structure"
             
-    except FileNotFoundError:
-        raise FileNotFoundError("No se encontró el archivo configs/normativas.yaml")
     except Exception as e:
         raise ValueError(f"Error validando YAML de normativas: {str(e)}")
 
-def load_sections_config(normativa: str = "IEC"):
+SECTION_TYPES = ("dc_strings", "level_1_dc", "ac_circuits", "mv_circuits", "cn1_inverter")
+
+def _add_section_arrays(sections_config: dict) -> dict:
+    """
+    Añade 'section_arrays': las listas de secciones (ya ordenadas) como arrays float64,
+    construidas una sola vez para búsquedas binarias sin copias en cada llamada
+    """
+    section_arrays = {}
+    for circuit_type in SECTION_TYPES:
+        array = np.asarray(sections_config[circuit_type], dtype=np.float64)
+        array.flags.writeable = False  # compartido entre llamadas
+        section_arrays[circuit_type] = array
+    sections_config["section_arrays"] = MappingProxyType(section_arrays)
+    return sections_config
+
+def load_sections_config(normativa: str = "IEC") -> Mapping:
     """
     Carga las secciones comerciales desde normativas.yaml
     
+    El resultado se memoriza por (normativa, versión del archivo): cambiar de
+    normativa con switch_normativa no vuelve a ordenar las listas. Es de solo
+    lectura (MappingProxyType) porque se comparte entre llamadas.
+    
     Args:
         normativa: Nombre de la normativa a usar ("IEC", "NEC", "PERSONALIZADA")
     """
-    structure_type = validate_normativas_yaml()
-    
-    with open("configs/normativas.yaml") as f:
-        yaml_data = yaml.safe_load(f)
+    try:
+        stat = os.stat(NORMATIVAS_FILE)
+    except OSError:
+        # Sin archivo no hay nada que memorizar: que la carga reporte el error
+        return MappingProxyType(_build_sections_config(normativa))
+    return _cached_sections_config(normativa, (stat.st_mtime_ns, stat.st_size))
+
+@lru_cache(maxsize=8)
+def _cached_sections_config(normativa: str, file_version: tuple) -> Mapping:
+    """Secciones de `normativa` para una versión concreta (mtime_ns, tamaño) de normativas.yaml"""
+    return MappingProxyType(_build_sections_config(normativa))
+
+def _build_sections_config(normativa: str) -> dict:
+    """Construye el dict de secciones de `normativa` (sin memorizar)"""
+    # Un solo parseo: la validación trabaja sobre los mismos datos
+    yaml_data = _load_normativas_yaml()
+    structure_type = _validate_normativas_data(yaml_data)
     
     normativas = yaml_data["normativas"]
     
@@ -494,17 +665,17 @@ def load_sections_config(normativa: str = "IEC"):
                 "description": normativa_data.get("description", ""),
                 "country": normativa_data.get("country", "")
             },
-            "metadata": yaml_data.get("metadata", {})
+            "metadata": deepcopy(yaml_data.get("metadata", {}))
         }
         
         # ✅ LOG PARA VERIFICAR QUE SE CARGÓ
         logger.info(f"Secciones CN1 cargadas: {len(result['cn1_inverter'])} secciones disponibles")
-        return result
+        return _add_section_arrays(result)
         
     elif "mm2" in sections:
         # Estructura legacy - usar las mismas secciones para todos los tipos
         standard_sections = sorted(sections["mm2"])
-        return {
+        return _add_section_arrays({
             "dc_strings": standard_sections,
             "level_1_dc": standard_sections,
             "ac_circuits": standard_sections,
@@ -519,13 +690,16 @@ def load_sections_config(normativa: str = "IEC"):
                 "country": normativa_data.get("country", "")
             },
             "metadata": {"version": "legacy"}
-        }
+        })
     else:
         raise ValueError(f"La normativa '{normativa}' no tiene estructura de secciones válida")
 
 def get_normativa_config_fixed(normativa: str = "IEC", project_name: str = None):
     """
     ✅ FUNCIÓN ACTUALIZADA: Prioriza normativa del proyecto
+    
+    El YAML se sirve desde la caché en memoria: el dict devuelto es compartido
+    y no debe modificarse.
     """
     try:
         # 1. Si hay proyecto, buscar su normativa específica
@@ -533,16 +707,14 @@ def get_normativa_config_fixed(normativa: str = "IEC", project_name: str = None)
             project_normative_file = f"projects/{project_name}/normativa.yaml"
             if os.path.exists(project_normative_file):
                 try:
-                    with open(project_normative_file) as f:
-                        project_data = yaml.safe_load(f)
+                    project_data = _load_cached(project_normative_file)
                     logger.info(f"Usando normativa específica del proyecto: {project_name}")
                     return project_data["normativa"]
                 except Exception as e:
                     logger.warning(f"Error cargando normativa del proyecto, usando base: {e}")
         
         # 2. Usar normativa base
-        with open("configs/normativas.yaml") as f:
-            yaml_data = yaml.safe_load(f)
+        yaml_data = _load_cached(NORMATIVAS_FILE)
         
         if normativa not in yaml_data["normativas"]:
             available = list(yaml_data["normativas"].keys())
@@ -562,8 +734,7 @@ def create_project_normative_copy(project_name: str, base_norm: str = "IEC"):
     """
     try:
         # 1. Cargar normativa base
-        with open("configs/normativas.yaml") as f:
-            yaml_data = yaml.safe_load(f)
+        yaml_data = _load_cached(NORMATIVAS_FILE)
         
         if base_norm not in yaml_data["normativas"]:
             raise ValueError(f"Normativa base '{base_norm}' no encontrada")
@@ -665,27 +836,55 @@ def get_normativa_config(normativa: str = "IEC"):
     """
     return get_normativa_config_fixed(normativa)
 
-# ===== INICIALIZAR VARIABLES GLOBALES =====
-# Agregar antes de las funciones que usan SECTIONS_CONFIG y MATERIALS
+# ===== CONFIGURACIÓN GLOBAL (carga diferida) =====
+# Secciones y materiales se cargan en el primer uso, no al importar el módulo
 
-# Cargar secciones al inicializar el módulo (usando IEC por defecto)
-try:
-    SECTIONS_CONFIG = load_sections_config("IEC")
-    logger.info(f"Secciones cargadas exitosamente: {SECTIONS_CONFIG['structure_type']} "
-                f"(normativa: {SECTIONS_CONFIG['normativa_used']})")
-except Exception as e:
-    logger.error(f"ERROR CRÍTICO: No se pudieron cargar las secciones comerciales: {e}")
-    # NO usar fallback - fallar explícitamente
-    raise RuntimeError(f"Error cargando secciones comerciales: {e}")
-
-# Cargar materiales
-try:
-    with open("configs/material_properties.yaml") as f:
-        MATERIALS = yaml.safe_load(f)["materials"]
+# Secciones de la normativa activa (IEC por defecto; switch_normativa la cambia)
+_sections_config = None
+
+def _get_sections_config() -> dict:
+    """Secciones comerciales de la normativa activa; se cargan la primera vez que se piden"""
+    global _sections_config
+    if _sections_config is None:
+        # Normativas y materiales se necesitan juntos: leerlos en paralelo
+        preload_yaml_configs()
+        try:
+            sections_config = load_sections_config("IEC")
+        except Exception as e:
+            logger.error(f"ERROR CRÍTICO: No se pudieron cargar las secciones comerciales: {e}")
+            # NO usar fallback - fallar explícitamente
+            raise RuntimeError(f"Error cargando secciones comerciales: {e}")
+        logger.info(f"Secciones cargadas exitosamente: {sections_config['structure_type']} "
+                    f"(normativa: {sections_config['normativa_used']})")
+        _sections_config = sections_config
+    return _sections_config
+
+@lru_cache(maxsize=1)
+def _get_materials() -> Mapping:
+    """Propiedades de materiales; se cargan la primera vez que se piden (solo lectura: compartidas)"""
+    try:
+        materials = _load_cached(MATERIALS_FILE)["materials"]
+    except Exception as e:
+        logger.error(f"ERROR CRÍTICO: No se pudieron cargar las propiedades de materiales: {e}")
+        raise RuntimeError(f"Error cargando propiedades de materiales: {e}")
     logger.info("Propiedades de materiales cargadas exitosamente")
-except Exception as e:
-    logger.error(f"ERROR CRÍTICO: No se pudieron cargar las propiedades de materiales: {e}")
-    raise RuntimeError(f"Error cargando propiedades de materiales: {e}")
+    return MappingProxyType(materials)
+
+@lru_cache(maxsize=1)
+def _material_rho_table() -> Mapping:
+    """Material -> (resistividad a 20°C, coeficiente de temperatura): una sola búsqueda por consulta"""
+    return MappingProxyType({
+        name: (props["resistivity_20C"], props["temp_coefficient"])
+        for name, props in _get_materials().items()
+    })
+
+def __getattr__(name: str):
+    """Compatibilidad: SECTIONS_CONFIG y MATERIALS siguen accesibles como atributos del módulo"""
+    if name == "SECTIONS_CONFIG":
+        return _get_sections_config()
+    if name == "MATERIALS":
+        return _get_materials()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ===== CORRECCIÓN EN apply_correction_factors =====
 # BUSCAR esta línea en tu función apply_correction_factors:
@@ -704,25 +903,38 @@ except Exception as e:
 
 def get_available_sections(circuit_type: str = "dc_strings") -> List[float]:
     """Obtiene las secciones disponibles para un tipo de circuito específico"""
-    if circuit_type not in SECTIONS_CONFIG:
-        available_types = [k for k in SECTIONS_CONFIG.keys() if isinstance(SECTIONS_CONFIG[k], list)]
+    sections_config = _get_sections_config()
+    if circuit_type not in sections_config:
+        available_types = [k for k in sections_config.keys() if isinstance(sections_config[k], list)]
         raise ValueError(f"Tipo de circuito '{circuit_type}' no válido. Disponibles: {available_types}")
     
-    return SECTIONS_CONFIG[circuit_type]
+    return sections_config[circuit_type]
+
+def get_available_sections_array(circuit_type: str = "dc_strings") -> np.ndarray:
+    """
+    Secciones disponibles como array float64 ordenado (compartido: no modificar).
+    Es la ruta usada en las búsquedas; get_available_sections sigue devolviendo la lista.
+    """
+    section_arrays = _get_sections_config()["section_arrays"]
+    if circuit_type not in section_arrays:
+        # Mismo mensaje de error que la versión lista
+        return np.asarray(get_available_sections(circuit_type), dtype=np.float64)
+    return section_arrays[circuit_type]
 
 def get_available_normativas() -> List[str]:
     """Obtiene la lista de normativas disponibles"""
     try:
-        with open("configs/normativas.yaml") as f:
-            yaml_data = yaml.safe_load(f)
+        yaml_data = _load_cached(NORMATIVAS_FILE)
         return list(yaml_data["normativas"].keys())
     except Exception as e:
         logger.error(f"Error obteniendo normativas disponibles: {e}")
         return ["IEC"]  # Fallback
 
+@lru_cache(maxsize=128)
 def get_material_resistivity(material_name: str, temp_operating: float) -> float:
     """
     Calcula la resistividad del material a la temperatura de operación
+    (memorizada: en un lote solo hay unos pocos pares material/temperatura)
     
     Args:
         material_name: Nombre del material (copper, aluminum, etc.)
@@ -731,133 +943,207 @@ def get_material_resistivity(material_name: str, temp_operating: float) -> float
     Returns:
         Resistividad en Ω·mm²/m
     """
-    print(f"DEBUG: Buscando material '{material_name}' a temperatura {temp_operating}°C")
-    print(f"DEBUG: MATERIALS disponibles: {list(MATERIALS.keys())}")
-    
-    if material_name not in MATERIALS:
-        available_materials = list(MATERIALS.keys())
+    rho_table = _material_rho_table()
+    if material_name not in rho_table:
+        available_materials = list(rho_table.keys())
         raise ValueError(f"Material '{material_name}' no encontrado. Disponibles: {available_materials}")
     
-    props = MATERIALS[material_name]
-    print(f"DEBUG: Propiedades de {material_name}: {props}")
-    
     # ✅ CORRECCIÓN: Usar directamente la resistividad del YAML (ahora corregida en Ω·mm²/m)
-    rho_20 = props["resistivity_20C"]  # Ω·mm²/m (valores ya corregidos en el YAML)
-    alpha = props["temp_coefficient"]  # 1/°C
+    # rho_20 en Ω·mm²/m (valores ya corregidos en el YAML), alpha en 1/°C
+    rho_20, alpha = rho_table[material_name]
     
     # Corrección por temperatura
     resistivity_temp = rho_20 * (1 + alpha * (temp_operating - 20))
     
-    print(f"DEBUG: Resistividad a {temp_operating}°C: {resistivity_temp:.6f} Ω·mm²/m")
     logger.debug(f"Resistividad {material_name} a {temp_operating}°C: {resistivity_temp:.6f} Ω·mm²/m")
     
     return resistivity_temp
 
-def apply_correction_factors(i_nominal: float, config: dict) -> float:
-    """✅ FUNCIÓN MEJORADA: Aplica factores de corrección de forma segura"""
-    try:
-        # Validar entrada
-        if i_nominal <= 0:
-            raise ValueError(f"Corriente nominal inválida: {i_nominal}A")
-        
-        # Cargar configuración de normativa
-        project_name = config.get("project_name") or config.get("_metadata", {}).get("project_name")
-        normativa_name = SECTIONS_CONFIG.get("normativa_used", "IEC")
+def reload_materials() -> None:
+    """
+    Descarta las propiedades de materiales y las resistividades memorizadas.
+    La siguiente consulta relee material_properties.yaml (si cambió en disco).
+    """
+    get_material_resistivity.cache_clear()
+    _material_rho_table.cache_clear()
+    _get_materials.cache_clear()
+    logger.info("Caché de materiales invalidada")
+
+def _temp_int_lookup(normativa_config: dict, temp_values: dict) -> dict:
+    """Tabla de temperaturas con claves int (°C -> factor), normalizada una vez por normativa"""
+    cache = _normativa_factor_cache(normativa_config)
+    if "temp_by_int" not in cache:
+        temps_by_int = {}
+        for key, value in temp_values.items():
+            try:
+                if isinstance(key, (str, int)) and not isinstance(key, bool):
+                    temps_by_int.setdefault(int(key), float(value))
+            except (ValueError, TypeError):
+                continue
+        cache["temp_by_int"] = temps_by_int
+    return cache["temp_by_int"]
 
-        # Usar normativa del proyecto para cálculos de strings
-        if normativa_name == "PERSONALIZADA" and project_name:
-            normativa_config = get_normativa_config_fixed(normativa_name, project_name)
+def _temp_factor(normativa_config: dict, current_ambient) -> float:
+    """
+    Factor de corrección por temperatura ambiente, memorizado por normativa y temperatura
+    (constante en todo un lote)
+    """
+    cache = _normativa_factor_cache(normativa_config)
+    # El tipo forma parte de la clave: 30 y 30.0 buscan claves de texto distintas ("30" / "30.0")
+    key = ("temp", type(current_ambient), current_ambient)
+    try:
+        if key in cache:
+            return cache[key]
+    except TypeError:
+        key = None  # temperatura no hashable: calcular sin memorizar
+    
+    temp_corr = normativa_config.get("temperature_correction", {})
+    temp_factor = 1.0
+    
+    if "values" in temp_corr and temp_corr["values"]:
+        temp_values = temp_corr["values"]
+        temps_by_int = _temp_int_lookup(normativa_config, temp_values)
+        
+        # Búsqueda exacta: claves int (como vienen del YAML) y, si no, la clave de texto
+        if isinstance(current_ambient, (int, float)) and current_ambient in temps_by_int:
+            temp_factor = temps_by_int[current_ambient]
+            logger.debug(f"Factor de temperatura exacto: {temp_factor} para {current_ambient}°C")
+        elif str(current_ambient) in temp_values:
+            temp_factor = float(temp_values[str(current_ambient)])
+            logger.debug(f"Factor de temperatura exacto: {temp_factor} para {current_ambient}°C")
         else:
-            normativa_config = get_normativa_config_fixed(normativa_name)
-
-        # Validar estructura si es personalizada
-        if SECTIONS_CONFIG.get("normativa_used") == "PERSONALIZADA":
-            if not validate_custom_normativa_structure(normativa_config):
-                logger.warning("Estructura de normativa personalizada inválida, usando factores por defecto")
-                return i_nominal * 1.25
-        
-        temp_corr = normativa_config.get("temperature_correction", {})
-        
-        # ✅ FACTOR DE TEMPERATURA MEJORADO
-        current_ambient = config.get("current_ambient", 
-                                   config.get("correction_factors", {}).get("ambient_temperature", {}).get("current_ambient", 
-                                   temp_corr.get("ambient_design", 30)))
-        temp_factor = 1.0
-        
-        if "values" in temp_corr and temp_corr["values"]:
-            temp_values = temp_corr["values"]
+            # Interpolación o valor más cercano
+            available_temps = []
+            for temp_str in temp_values.keys():
+                try:
+                    available_temps.append((int(temp_str), float(temp_values[temp_str])))
+                except ValueError:
+                    continue
             
-            # Búsqueda exacta
-            if str(current_ambient) in temp_values:
-                temp_factor = float(temp_values[str(current_ambient)])
-                logger.debug(f"Factor de temperatura exacto: {temp_factor} para {current_ambient}°C")
-            else:
-                # Interpolación o valor más cercano
-                available_temps = []
-                for temp_str in temp_values.keys():
-                    try:
-                        available_temps.append((int(temp_str), float(temp_values[temp_str])))
-                    except ValueError:
-                        continue
+            if available_temps:
+                available_temps.sort()
                 
-                if available_temps:
-                    available_temps.sort()
+                # Interpolación lineal si está entre dos valores
+                for i in range(len(available_temps) - 1):
+                    temp1, factor1 = available_temps[i]
+                    temp2, factor2 = available_temps[i + 1]
                     
-                    # Interpolación lineal si está entre dos valores
-                    for i in range(len(available_temps) - 1):
-                        temp1, factor1 = available_temps[i]
-                        temp2, factor2 = available_temps[i + 1]
-                        
-                        if temp1 <= current_ambient <= temp2:
-                            temp_factor = factor1 + (factor2 - factor1) * (current_ambient - temp1) / (temp2 - temp1)
-                            logger.info(f"Factor de temperatura interpolado: {temp_factor:.3f} para {current_ambient}°C")
-                            break
-                    else:
-                        # Usar el más cercano si no está en rango
-                        closest = min(available_temps, key=lambda x: abs(x[0] - current_ambient))
-                        temp_factor = closest[1]
-                        logger.warning(f"Temperatura {current_ambient}°C fuera de rango, usando factor {temp_factor} ({closest[0]}°C)")
-        else:
-            logger.warning(f"No hay tabla de temperatura, usando factor {temp_factor}")
-        
-        # ✅ FACTOR DE AGRUPAMIENTO MEJORADO
-        method = config.get("method", 
-                          config.get("installation", {}).get("method", 
-                          normativa_config.get("installation", {}).get("method", "conduit")))
-        layout = config.get("layout", 
-                          config.get("installation", {}).get("layout", 
-                          normativa_config.get("installation", {}).get("layout", "single_layer")))
-        number_of_circuits = config.get("number_of_parallel_strings", 1)
-        
-        # ✅ CORRECCIÓN: Asegurar tipos correctos
-        method = str(method) if method is not None else "conduit"
-        layout = str(layout) if layout is not None else "single_layer"
-        
-        try:
-            number_of_circuits = int(number_of_circuits)
-        except (ValueError, TypeError):
-            logger.warning(f"Número de strings inválido {number_of_circuits}, usando 1")
-            number_of_circuits = 1
-        
-        logger.debug(f"Parámetros de agrupamiento: method='{method}', layout='{layout}', circuits={number_of_circuits}")
-        
-        group_factor = get_grouping_factor_safe(normativa_config, number_of_circuits, method, layout)
-        
-        # Validación final
-        if temp_factor <= 0 or temp_factor > 2:
-            logger.error(f"Factor de temperatura inválido: {temp_factor}, usando 0.8")
-            temp_factor = 0.8
+                    if temp1 <= current_ambient <= temp2:
+                        temp_factor = factor1 + (factor2 - factor1) * (current_ambient - temp1) / (temp2 - temp1)
+                        logger.info(f"Factor de temperatura interpolado: {temp_factor:.3f} para {current_ambient}°C")
+                        break
+                else:
+                    # Usar el más cercano si no está en rango
+                    closest = min(available_temps, key=lambda x: abs(x[0] - current_ambient))
+                    temp_factor = closest[1]
+                    logger.warning(f"Temperatura {current_ambient}°C fuera de rango, usando factor {temp_factor} ({closest[0]}°C)")
+    else:
+        logger.warning(f"No hay tabla de temperatura, usando factor {temp_factor}")
+    
+    if key is not None:
+        cache[key] = temp_factor
+    return temp_factor
+
+def resolve_normativa_config(config: dict) -> dict:
+    """
+    Normativa que aplica a los cálculos de `config` (la del proyecto si la normativa
+    activa es PERSONALIZADA). No depende de la fila: resolver una vez por lote.
+    """
+    project_name = config.get("project_name") or config.get("_metadata", {}).get("project_name")
+    normativa_name = _get_sections_config().get("normativa_used", "IEC")
+
+    # Usar normativa del proyecto para cálculos de strings
+    if normativa_name == "PERSONALIZADA" and project_name:
+        return get_normativa_config_fixed(normativa_name, project_name)
+    return get_normativa_config_fixed(normativa_name)
+
+def precompute_correction_divisor(config: dict, normativa_config: dict = None) -> Optional[float]:
+    """
+    Divisor de corrección (temp_factor × group_factor) para `config`.
+    
+    Solo depende de la configuración y de la normativa, no de la fila: se calcula
+    una vez por lote y cada corriente se corrige con i_nominal / divisor.
+    Devuelve None si la normativa personalizada es inválida (corrección por defecto).
+    Los errores se propagan: apply_correction_factors aplica el factor de seguridad.
+    """
+    # Cargar configuración de normativa
+    if normativa_config is None:
+        normativa_config = resolve_normativa_config(config)
+
+    # Validar estructura si es personalizada
+    if _get_sections_config().get("normativa_used") == "PERSONALIZADA":
+        if not validate_custom_normativa_structure(normativa_config):
+            logger.warning("Estructura de normativa personalizada inválida, usando factores por defecto")
+            return None
+    
+    temp_corr = normativa_config.get("temperature_correction", {})
+    
+    # ✅ FACTOR DE TEMPERATURA MEJORADO
+    current_ambient = config.get("current_ambient", 
+                               config.get("correction_factors", {}).get("ambient_temperature", {}).get("current_ambient", 
+                               temp_corr.get("ambient_design", 30)))
+    temp_factor = _temp_factor(normativa_config, current_ambient)
+    
+    # ✅ FACTOR DE AGRUPAMIENTO MEJORADO
+    method = config.get("method", 
+                      config.get("installation", {}).get("method", 
+                      normativa_config.get("installation", {}).get("method", "conduit")))
+    layout = config.get("layout", 
+                      config.get("installation", {}).get("layout", 
+                      normativa_config.get("installation", {}).get("layout", "single_layer")))
+    number_of_circuits = config.get("number_of_parallel_strings", 1)
+    
+    # ✅ CORRECCIÓN: Asegurar tipos correctos
+    method = str(method) if method is not None else "conduit"
+    layout = str(layout) if layout is not None else "single_layer"
+    
+    try:
+        number_of_circuits = int(number_of_circuits)
+    except (ValueError, TypeError):
+        logger.warning(f"Número de strings inválido {number_of_circuits}, usando 1")
+        number_of_circuits = 1
+    
+    logger.debug(f"Parámetros de agrupamiento: method='{method}', layout='{layout}', circuits={number_of_circuits}")
+    
+    group_factor = get_grouping_factor_safe(normativa_config, number_of_circuits, method, layout)
+    
+    # Validación final
+    if temp_factor <= 0 or temp_factor > 2:
+        logger.error(f"Factor de temperatura inválido: {temp_factor}, usando 0.8")
+        temp_factor = 0.8
+    
+    if group_factor <= 0 or group_factor > 1.2:
+        logger.error(f"Factor de agrupamiento inválido: {group_factor}, usando 0.8")
+        group_factor = 0.8
+    
+    combined_factor = temp_factor * group_factor
+    logger.debug(f"Divisor de corrección: {combined_factor:.3f} "
+                 f"(temp_factor: {temp_factor:.3f}, group_factor: {group_factor:.3f})")
+    return combined_factor
+
+def apply_correction_factors(i_nominal: float, config: dict, normativa_config: dict = None,
+                             divisor: float = None) -> float:
+    """
+    ✅ FUNCIÓN MEJORADA: Aplica factores de corrección de forma segura
+    
+    `normativa_config` (de resolve_normativa_config) evita volver a resolver la
+    normativa en cada llamada; si no se pasa, se resuelve aquí.
+    `divisor` (de precompute_correction_divisor) evita además recalcular los factores.
+    """
+    try:
+        # Validar entrada
+        if i_nominal <= 0:
+            raise ValueError(f"Corriente nominal inválida: {i_nominal}A")
         
-        if group_factor <= 0 or group_factor > 1.2:
-            logger.error(f"Factor de agrupamiento inválido: {group_factor}, usando 0.8")
-            group_factor = 0.8
+        if divisor is None:
+            divisor = precompute_correction_divisor(config, normativa_config)
+            if divisor is None:
+                return i_nominal * 1.25
         
         # ✅ APLICAR CORRECCIÓN CORRECTAMENTE
-        combined_factor = temp_factor * group_factor
-        i_adjusted = i_nominal / combined_factor
+        i_adjusted = i_nominal / divisor
         
-        logger.info(f"Corrección de corriente: {i_nominal:.2f}A → {i_adjusted:.2f}A "
-                   f"(temp_factor: {temp_factor:.3f}, group_factor: {group_factor:.3f}, combined: {combined_factor:.3f})")
+        logger.info(f"Corrección de corriente: {i_nominal:.2f}A → {i_adjusted:.2f}A (combined: {divisor:.3f})")
         
         return i_adjusted
         
@@ -873,46 +1159,127 @@ def get_commercial_section(theoretical_section_mm2: float, circuit_type: str = "
     Encuentra la sección comercial inmediatamente superior a la teórica.
     Si no hay ninguna mayor, retorna la más grande disponible.
     """
-    available_sections = get_available_sections(circuit_type)
-    available_sections = sorted(available_sections)  # Asegura orden ascendente
-
-    for section in available_sections:
-        if section >= theoretical_section_mm2:
+    # load_sections_config ya deja las listas en orden ascendente: búsqueda binaria
+    available_sections = get_available_sections_array(circuit_type)
+
+    # NaN (celda vacía) o mayor que la máxima: igual que la versión en lote, se usa la sección máxima
+    idx = len(available_sections)
+    if available_sections.size and theoretical_section_mm2 <= available_sections[-1]:
+        idx = bisect.bisect_left(available_sections, theoretical_section_mm2)
+    if idx < len(available_sections):
+        section = float(available_sections[idx])
+        # Se llama por fila: el mensaje solo se arma si el nivel DEBUG está activo
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Sección seleccionada: {section}mm² para teórica {theoretical_section_mm2:.3f}mm² "
-                         f"(tipo: {circuit_type}, normativa: {SECTIONS_CONFIG['normativa_used']})")
-            return float(section)
+                         f"(tipo: {circuit_type}, normativa: {_get_sections_config()['normativa_used']})")
+        return section
 
     # Si ninguna sección disponible cumple, retornar la mayor disponible
-    if available_sections:
+    if available_sections.size:
         logger.warning(f"Sección teórica {theoretical_section_mm2:.3f}mm² excede máxima disponible "
-                       f"{available_sections[-1]}mm² para tipo {circuit_type} (normativa: {SECTIONS_CONFIG['normativa_used']}). "
+                       f"{available_sections[-1]}mm² para tipo {circuit_type} (normativa: {_get_sections_config()['normativa_used']}). "
                        f"Usando sección máxima disponible.")
         return float(available_sections[-1])
 
     logger.error(f"No hay secciones comerciales definidas para tipo {circuit_type}")
     return None
 
+def get_commercial_sections_batch(theoretical_sections_mm2: np.ndarray, circuit_type: str = "dc_strings") -> np.ndarray:
+    """
+    Versión en lote de get_commercial_section: una sola búsqueda (np.searchsorted)
+    para todo el array. Devuelve float64 con NaN donde no hay sección disponible.
+    """
+    theoretical = np.asarray(theoretical_sections_mm2, dtype=np.float64)
+    available = get_available_sections_array(circuit_type)
+
+    if available.size == 0:
+        logger.error(f"No hay secciones comerciales definidas para tipo {circuit_type}")
+        return np.full(theoretical.shape, np.nan, dtype=np.float64)
+
+    positions = np.searchsorted(available, theoretical, side="left")
+    exceeded = positions == available.size
+    if exceeded.any():
+        for value in theoretical[exceeded].tolist():
+            logger.warning(f"Sección teórica {value:.3f}mm² excede máxima disponible "
+                           f"{available[-1]}mm² para tipo {circuit_type} (normativa: {_get_sections_config()['normativa_used']}). "
+                           f"Usando sección máxima disponible.")
+    return available[np.minimum(positions, available.size - 1)]
+
+
+def log_project_normativa(project_name: Optional[str]) -> None:
+    """✅ DEBUG: Registra qué normativa (proyecto o base) se está usando"""
+    if not project_name:
+        return
+    project_normative_file = f"projects/{project_name}/normativa.yaml"
+    if os.path.exists(project_normative_file):
+        logger.info(f"🔥 USANDO NORMATIVA DEL PROYECTO: {project_normative_file}")
+        # Verificar algunos parámetros clave
+        project_data = _load_cached(project_normative_file)
+        normativa = project_data["normativa"]
+        logger.info(f"🔥 Parámetros del proyecto - ISC factor: {normativa.get('correction_factors', {}).get('isc_safety_factor', 'NO_FOUND')}")
+        logger.info(f"🔥 Parámetros del proyecto - Max voltage drop: {normativa.get('voltage_drop', {}).get('max_percentage', 'NO_FOUND')}%")
+    else:
+        logger.info(f"🔥 USANDO NORMATIVA BASE - No existe: {project_normative_file}")
+
+
+@dataclass(slots=True, frozen=True)
+class StringInvariants:
+    """Parámetros de un lote de strings que no dependen de la fila (acceso por atributo en el bucle)"""
+    i_nominal: float
+    i_adj: float
+    material: str
+    resistivity: float
+    max_percentage: float
+    v_ref: float
+    max_voltage_drop_v: float
+
 
-def calculate_string_section(row: pd.Series, config: dict, circuit_type: str = "dc_strings") -> dict:
-    """✅ FUNCIÓN MEJORADA: Calcula sección con validaciones robustas"""
+def precompute_string_params(config: dict, normativa_config: dict = None) -> StringInvariants:
+    """
+    Parámetros que no dependen de la fila: corriente ajustada, resistividad y caída máxima.
+    Se calculan una vez por lote; `config` debe venir ya validado (validate_config_parameters).
+    """
+    isc_safety_factor = config.get("isc_correction", 1.25)
+    i_nominal = config["isc_ref"] * isc_safety_factor
+    i_adj = apply_correction_factors(i_nominal, config, normativa_config)
+
+    material = config.get("cable", {}).get("material", "copper")
+    temp_operating = config.get("correction_factors", {}).get("ambient_temperature", {}).get("current_ambient", 30)
+    resistivity = get_material_resistivity(material, temp_operating)
+
+    max_percentage = config["voltage_drop"]["max_percentage"]
+    v_ref = config["voltage_drop"]["reference_voltage"]
+    max_voltage_drop_v = v_ref * (max_percentage / 100)
+
+    if max_voltage_drop_v <= 0:
+        raise ValueError(f"Caída de tensión máxima inválida: {max_voltage_drop_v}V")
+
+    return StringInvariants(
+        i_nominal=i_nominal,
+        i_adj=i_adj,
+        material=material,
+        resistivity=resistivity,
+        max_percentage=max_percentage,
+        v_ref=v_ref,
+        max_voltage_drop_v=max_voltage_drop_v,
+    )
+
+
+def calculate_string_section(row: pd.Series, config: dict, circuit_type: str = "dc_strings",
+                             normativa_config: dict = None, params: StringInvariants = None) -> dict:
+    """
+    ✅ FUNCIÓN MEJORADA: Calcula sección con validaciones robustas
+    
+    `normativa_config`: normativa ya resuelta (resolve_normativa_config), opcional.
+    `params`: invariantes de precompute_string_params sobre el config ya validado;
+    si se pasan, no se revalida el config ni se recalculan por fila.
+    """
     try:
-        # Validar configuración
-        config = validate_config_parameters(config)
-        # ✅ DEBUG: Verificar qué normativa se está usando
-        project_name = config.get("project_name")
-        if project_name:
-            project_normative_file = f"projects/{project_name}/normativa.yaml"
-            if os.path.exists(project_normative_file):
-                logger.info(f"🔥 USANDO NORMATIVA DEL PROYECTO: {project_normative_file}")
-                # Verificar algunos parámetros clave
-                with open(project_normative_file) as f:
-                    project_data = yaml.safe_load(f)
-                normativa = project_data["normativa"]
-                logger.info(f"🔥 Parámetros del proyecto - ISC factor: {normativa.get('correction_factors', {}).get('isc_safety_factor', 'NO_FOUND')}")
-                logger.info(f"🔥 Parámetros del proyecto - Max voltage drop: {normativa.get('voltage_drop', {}).get('max_percentage', 'NO_FOUND')}%")
-            else:
-                logger.info(f"🔥 USANDO NORMATIVA BASE - No existe: {project_normative_file}")
-        
+        if params is None:
+            # Validar configuración
+            config = validate_config_parameters(config)
+            log_project_normativa(config.get("project_name"))
+
         string_id = str(row.get("string_id", "UNKNOWN"))
         length_pos = float(row.get("length_pos_m", 0))
         length_neg = float(row.get("length_neg_m", 0))
@@ -924,31 +1291,20 @@ def calculate_string_section(row: pd.Series, config: dict, circuit_type: str = "
         if length_pos > 10000 or length_neg > 10000:
             raise ValueError(f"Longitudes excesivas: pos={length_pos}m, neg={length_neg}m (máximo 10km)")
 
-        # Cálculos con validación
-        isc_safety_factor = config.get("isc_correction", 1.25)
-        i_nominal = config["isc_ref"] * isc_safety_factor
-        
-        # Aplicar factores de corrección de forma segura
-        i_adj = apply_correction_factors(i_nominal, config)
-        
+        # Invariantes del lote (corriente ajustada, resistividad, caída máxima)
+        if params is None:
+            params = precompute_string_params(config, normativa_config)
+        i_nominal = params.i_nominal
+        i_adj = params.i_adj
+        material = params.material
+        resistivity_ohm_mm2_per_m = params.resistivity
+        max_percentage = params.max_percentage
+        v_ref = params.v_ref
+        max_voltage_drop_v = params.max_voltage_drop_v
+
         # Longitud total
         length_total = length_pos + length_neg
 
-        # Obtener resistividad
-        material = config.get("cable", {}).get("material", "copper")
-        temp_operating = config.get("correction_factors", {}).get("ambient_temperature", {}).get("current_ambient", 30)
-        resistivity_ohm_mm2_per_m = get_material_resistivity(material, temp_operating)
-
-        # Parámetros de caída de tensión validados
-        max_percentage = config["voltage_drop"]["max_percentage"]
-        v_ref = config["voltage_drop"]["reference_voltage"]
-        
-        max_voltage_drop_v = v_ref * (max_percentage / 100)
-        
-        # Validar antes de dividir
-        if max_voltage_drop_v <= 0:
-            raise ValueError(f"Caída de tensión máxima inválida: {max_voltage_drop_v}V")
-        
         # Cálculo de sección teórica
         numerator = 2 * resistivity_ohm_mm2_per_m * length_total * i_adj
         s_teorica_mm2 = numerator / max_voltage_drop_v
@@ -1002,7 +1358,7 @@ def calculate_string_section(row: pd.Series, config: dict, circuit_type: str = "
             "max_vdrop_pct": max_percentage,
             "voltage_status": voltage_status,
             "circuit_type": circuit_type,
-            "normativa": SECTIONS_CONFIG["normativa_used"],
+            "normativa": _get_sections_config()["normativa_used"],
             "cable_material": material,
             "calculation_status": "SUCCESS"
         }
@@ -1016,61 +1372,305 @@ def calculate_string_section(row: pd.Series, config: dict, circuit_type: str = "
             "string_id": str(row.get("string_id", "UNKNOWN")),
             "error": str(e),
             "calculation_status": "ERROR",
-            "normativa": SECTIONS_CONFIG.get("normativa_used", "UNKNOWN")
+            "normativa": _get_sections_config().get("normativa_used", "UNKNOWN")
         }
 
+def _column_as_float(df: pd.DataFrame, column: str) -> tuple:
+    """
+    Extrae una columna como array float64 contiguo.
+    Devuelve (valores, errores_por_fila) replicando float(row.get(column, 0)).
+    """
+    n = len(df)
+    if column not in df.columns:
+        return np.zeros(n, dtype=np.float64), {}
+
+    series = df[column]
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy(dtype=np.float64), {}
+
+    values = np.empty(n, dtype=np.float64)
+    errors = {}
+    for i, value in enumerate(series.tolist()):
+        try:
+            values[i] = float(value)
+        except (TypeError, ValueError) as e:
+            values[i] = np.nan
+            errors[i] = str(e)
+    return values, errors
+
+
+def _theoretical_sections_numpy(length_total, resistivity, i_adj, max_voltage_drop_v):
+    """Sección teórica por caída de tensión para todas las filas a la vez"""
+    return (2 * resistivity * length_total * i_adj) / max_voltage_drop_v
+
+
+def _string_drops_numpy(length_total, s_comercial, i_adj, resistivity, v_ref):
+    """Caída de tensión, resistencia y pérdidas Joule para todas las filas a la vez"""
+    v_drop_real = (2 * resistivity * length_total * i_adj) / s_comercial
+    v_drop_pct = (v_drop_real / v_ref) * 100
+    resistance_total = (2 * resistivity * length_total) / s_comercial
+    joule_losses = (i_adj ** 2) * resistance_total
+    return v_drop_real, v_drop_pct, resistance_total, joule_losses
+
+
+if NUMBA_AVAILABLE:
+    # cache=True: el código máquina se guarda en disco y no se recompila en cada proceso.
+    # Sin fastmath, para que los resultados coincidan bit a bit con la ruta NumPy.
+    # La sección comercial no entra en el kernel: get_commercial_sections_batch ya es una
+    # sola np.searchsorted y tiene que registrar por fila las secciones que exceden el máximo.
+    @njit(parallel=True, cache=True)
+    def _theoretical_sections_kernel(length_total, resistivity, i_adj, max_voltage_drop_v, out_s):
+        for i in prange(length_total.shape[0]):
+            out_s[i] = (2 * resistivity * length_total[i] * i_adj) / max_voltage_drop_v
+
+    @njit(parallel=True, cache=True)
+    def _string_drops_kernel(length_total, s_comercial, i_adj, resistivity, v_ref,
+                             out_vdrop, out_pct, out_resistance, out_joule):
+        for i in prange(length_total.shape[0]):
+            out_vdrop[i] = (2 * resistivity * length_total[i] * i_adj) / s_comercial[i]
+            out_pct[i] = (out_vdrop[i] / v_ref) * 100
+            out_resistance[i] = (2 * resistivity * length_total[i]) / s_comercial[i]
+            out_joule[i] = (i_adj ** 2) * out_resistance[i]
+
+
+def compute_theoretical_sections(length_total: np.ndarray, resistivity: float, i_adj: float,
+                                 max_voltage_drop_v: float) -> np.ndarray:
+    """
+    Sección teórica (mm²) de cada fila sobre un array float64 de longitudes totales.
+    Usa el kernel compilado con Numba en lotes grandes; si no, NumPy vectorizado.
+    """
+    if not NUMBA_AVAILABLE or length_total.shape[0] < NUMBA_MIN_ROWS:
+        return _theoretical_sections_numpy(length_total, resistivity, i_adj, max_voltage_drop_v)
+
+    out_s = np.empty(length_total.shape[0], dtype=np.float64)
+    _theoretical_sections_kernel(np.ascontiguousarray(length_total, dtype=np.float64), float(resistivity),
+                                 float(i_adj), float(max_voltage_drop_v), out_s)
+    return out_s
+
+
+def compute_string_drops(length_total: np.ndarray, s_comercial: np.ndarray, i_adj: float,
+                         resistivity: float, v_ref: float) -> tuple:
+    """
+    Calcula (v_drop_real, v_drop_pct, resistance_total, joule_losses) sobre arrays float64.
+    Usa el kernel compilado con Numba en lotes grandes; si no, NumPy vectorizado.
+    """
+    if not NUMBA_AVAILABLE or length_total.shape[0] < NUMBA_MIN_ROWS:
+        return _string_drops_numpy(length_total, s_comercial, i_adj, resistivity, v_ref)
+
+    n = length_total.shape[0]
+    out_vdrop = np.empty(n, dtype=np.float64)
+    out_pct = np.empty(n, dtype=np.float64)
+    out_resistance = np.empty(n, dtype=np.float64)
+    out_joule = np.empty(n, dtype=np.float64)
+    _string_drops_kernel(length_total, s_comercial, float(i_adj), float(resistivity), float(v_ref),
+                         out_vdrop, out_pct, out_resistance, out_joule)
+    return out_vdrop, out_pct, out_resistance, out_joule
+
+
 def calculate_all_strings(df: pd.DataFrame, config: dict, circuit_type: str = "dc_strings") -> List[dict]:
-    """Calcula todas las strings del DataFrame usando configuración de normativa"""
+    """
+    Calcula todas las strings del DataFrame usando configuración de normativa.
+    Produce los mismos resultados que calculate_string_section fila a fila, pero
+    los parámetros invariantes se calculan una sola vez y la aritmética se hace
+    sobre arrays extraídos del DataFrame.
+    """
     
     logger.info(f"Iniciando cálculo de {len(df)} strings con tipo de circuito: {circuit_type}, "
-                f"normativa: {SECTIONS_CONFIG['normativa_used']}")
+                f"normativa: {_get_sections_config()['normativa_used']}")
     
+    n = len(df)
+    if "string_id" in df.columns:
+        string_ids = [str(value) for value in df["string_id"].tolist()]
+    else:
+        string_ids = ["UNKNOWN"] * n
+    errors = [None] * n
+
+    # 1. Validación de configuración (afecta a todas las filas)
+    try:
+        config = validate_config_parameters(config)
+        log_project_normativa(config.get("project_name"))
+    except Exception as e:
+        errors = [str(e)] * n
+
+    # 2. Extracción y validación de longitudes
+    length_pos, pos_errors = _column_as_float(df, "length_pos_m")
+    length_neg, neg_errors = _column_as_float(df, "length_neg_m")
+    invalid = (length_pos <= 0) | (length_neg <= 0)
+    excessive = (length_pos > 10000) | (length_neg > 10000)
+
+    # Solo se recorren las filas marcadas; el resto ya es válido
+    flagged = set(pos_errors) | set(neg_errors) | set(np.flatnonzero(invalid | excessive).tolist())
+    for i in sorted(flagged):
+        if errors[i] is not None:
+            continue
+        if i in pos_errors:
+            errors[i] = pos_errors[i]
+        elif i in neg_errors:
+            errors[i] = neg_errors[i]
+        elif invalid[i]:
+            errors[i] = f"Longitudes inválidas: pos={float(length_pos[i])}m, neg={float(length_neg[i])}m"
+        elif excessive[i]:
+            errors[i] = f"Longitudes excesivas: pos={float(length_pos[i])}m, neg={float(length_neg[i])}m (máximo 10km)"
+
+    # 3. Parámetros invariantes (una sola vez para todo el lote)
+    pending = [i for i in range(n) if errors[i] is None]
+    params = None
+    if pending:
+        try:
+            params = precompute_string_params(config)
+        except Exception as e:
+            for i in pending:
+                errors[i] = str(e)
+            pending = []
+
+    # 4. Sección teórica y comercial
+    length_total = length_pos + length_neg
+    s_comercial = np.full(n, np.nan, dtype=np.float64)
+    s_teorica = np.full(n, np.nan, dtype=np.float64)
+    if pending:
+        s_teorica = compute_theoretical_sections(length_total, params.resistivity, params.i_adj,
+                                                 params.max_voltage_drop_v)
+        pending_idx = np.asarray(pending)
+        s_pending = s_teorica[pending_idx]
+
+        invalid_section = s_pending <= 0
+        for i in pending_idx[invalid_section].tolist():
+            errors[i] = f"Sección teórica inválida: {float(s_teorica[i])}mm²"
+        for i in pending_idx[s_pending > 1000].tolist():
+            logger.warning(f"Sección teórica muy alta: {s_teorica[i]:.1f}mm² para string {string_ids[i]}")
+
+        # Sección comercial de todas las filas válidas en una sola búsqueda
+        valid_idx = pending_idx[~invalid_section]
+        if valid_idx.size:
+            try:
+                sections = get_commercial_sections_batch(s_teorica[valid_idx], circuit_type)
+            except Exception as e:
+                for i in valid_idx.tolist():
+                    errors[i] = str(e)
+            else:
+                s_comercial[valid_idx] = np.where(sections > 0, sections, np.nan)
+
+    # 5. Caídas de tensión y pérdidas (kernel sobre arrays)
+    if params is not None:
+        has_section = ~np.isnan(s_comercial)
+        v_drop_real = np.full(n, np.nan, dtype=np.float64)
+        v_drop_pct = np.full(n, np.nan, dtype=np.float64)
+        resistance_total = np.full(n, np.nan, dtype=np.float64)
+        joule_losses = np.full(n, np.nan, dtype=np.float64)
+        if has_section.any():
+            drops = compute_string_drops(
+                np.ascontiguousarray(length_total[has_section]),
+                np.ascontiguousarray(s_comercial[has_section]),
+                params.i_adj, params.resistivity, params.v_ref
+            )
+            v_drop_real[has_section], v_drop_pct[has_section], resistance_total[has_section], joule_losses[has_section] = drops
+
+    # 6. Redondeo de presentación: una pasada por columna y los invariantes una vez por lote.
+    # round() de Python y no np.round, que redondea distinto los casos casi al medio (49.105 → 49.1)
+    length_total_r = [round(x, 2) for x in length_total.tolist()]
+    s_teorica_r = [round(x, 3) for x in s_teorica.tolist()]
+    if params is not None:
+        v_drop_real_r = [round(x, 3) for x in v_drop_real.tolist()]
+        v_drop_pct_r = [round(x, 3) for x in v_drop_pct.tolist()]
+        joule_losses_r = [round(x, 2) for x in joule_losses.tolist()]
+        resistance_total_r = [round(x, 6) for x in resistance_total.tolist()]
+        i_nominal_r = round(params.i_nominal, 2)
+        i_adj_r = round(params.i_adj, 2)
+        resistivity_r = round(params.resistivity, 6)
+        max_voltage_drop_r = round(params.max_voltage_drop_v, 3)
+
+    # 7. Ensamblado de resultados
+    normativa_used = _get_sections_config().get("normativa_used", "UNKNOWN")
     results = []
     success_count = 0
     error_count = 0
-    
-    for index, row in df.iterrows():
-        try:
-            result = calculate_string_section(row, config, circuit_type)
-            results.append(result)
-            
-            if "error" not in result:
-                success_count += 1
-            else:
+
+    if params is None:
+        for string_id, error in zip(string_ids, errors):
+            logger.error(f"Error calculando string {string_id}: {error}")
+            results.append({
+                "string_id": string_id,
+                "error": error,
+                "calculation_status": "ERROR",
+                "normativa": normativa_used
+            })
+        error_count = n
+    else:
+        # Columnas como listas de Python: el bucle solo toca floats nativos, no escalares numpy
+        max_percentage = params.max_percentage
+        warning_percentage = max_percentage * 1.1
+        rows = zip(string_ids, errors, length_total_r, s_teorica_r, s_comercial.tolist(),
+                   v_drop_pct.tolist(), v_drop_real_r, v_drop_pct_r, resistance_total_r, joule_losses_r)
+        for (string_id, error, length_i, s_teorica_i, s_comercial_i, v_drop_pct_raw,
+             v_drop_real_i, v_drop_pct_i, resistance_i, joule_i) in rows:
+            if error is not None:
+                logger.error(f"Error calculando string {string_id}: {error}")
+                results.append({
+                    "string_id": string_id,
+                    "error": error,
+                    "calculation_status": "ERROR",
+                    "normativa": normativa_used
+                })
                 error_count += 1
-                
-        except Exception as e:
-            logger.error(f"Error fatal en fila {index}: {e}")
-            error_result = {
-                "string_id": str(row.get("string_id", f"ROW_{index}")),
-                "error": f"Error fatal: {str(e)}",
-                "status": "FATAL_ERROR",
-                "normativa": SECTIONS_CONFIG.get("normativa_used", "UNKNOWN")
-            }
-            results.append(error_result)
-            error_count += 1
+                continue
+
+            if math.isnan(s_comercial_i):
+                s_comercial_i = None
+                v_drop_real_i = v_drop_pct_i = joule_i = resistance_i = None
+                voltage_status = "NO_SECTION"
+            # El estado se evalúa sobre la caída sin redondear
+            elif v_drop_pct_raw <= max_percentage:
+                voltage_status = "OK"
+            elif v_drop_pct_raw <= warning_percentage:
+                voltage_status = "WARNING"
+            else:
+                voltage_status = "CRITICAL"
+
+            results.append({
+                "string_id": string_id,
+                "length_total_m": length_i,
+                "i_nominal": i_nominal_r,
+                "i_adjusted": i_adj_r,
+                "resistivity_ohm_mm2_per_m": resistivity_r,
+                "s_teorica_mm2": s_teorica_i,
+                "s_comercial_mm2": s_comercial_i,
+                "v_drop_real_volts": v_drop_real_i,
+                "v_drop_real_pct": v_drop_pct_i,
+                "v_drop_max_volts": max_voltage_drop_r,
+                "joule_losses_w": joule_i,
+                "resistance_total_ohm": resistance_i,
+                "reference_voltage": params.v_ref,
+                "max_vdrop_pct": max_percentage,
+                "voltage_status": voltage_status,
+                "circuit_type": circuit_type,
+                "normativa": normativa_used,
+                "cable_material": params.material,
+                "calculation_status": "SUCCESS"
+            })
+            success_count += 1
     
     logger.info(f"Cálculo completado: {success_count} exitosos, {error_count} errores "
-                f"(normativa: {SECTIONS_CONFIG['normativa_used']})")
+                f"(normativa: {_get_sections_config()['normativa_used']})")
     
     return results
 
 # Función de utilidad para verificar configuración
 def get_sections_info():
     """Devuelve información sobre las secciones configuradas"""
+    sections_config = _get_sections_config()
     return {
-        "structure_type": SECTIONS_CONFIG.get("structure_type", "unknown"),
-        "normativa_used": SECTIONS_CONFIG.get("normativa_used", "unknown"),
-        "normativa_info": SECTIONS_CONFIG.get("normativa_info", {}),
-        "available_circuit_types": [k for k in SECTIONS_CONFIG.keys() 
-                                  if k not in ["structure_type", "metadata", "normativa_used", "normativa_info"]],
+        "structure_type": sections_config.get("structure_type", "unknown"),
+        "normativa_used": sections_config.get("normativa_used", "unknown"),
+        "normativa_info": sections_config.get("normativa_info", {}),
+        "available_circuit_types": [k for k in sections_config.keys() 
+                                  if k not in ["structure_type", "metadata", "normativa_used", "normativa_info", "section_arrays"]],
         "sections_count": {
             circuit_type: len(sections) 
-            for circuit_type, sections in SECTIONS_CONFIG.items() 
+            for circuit_type, sections in sections_config.items() 
             if isinstance(sections, list)
         },
         "available_normativas": get_available_normativas(),
-        "metadata": SECTIONS_CONFIG.get("metadata", {})
+        "metadata": sections_config.get("metadata", {})
     }
 
 def switch_normativa(normativa: str):
@@ -1080,9 +1680,9 @@ def switch_normativa(normativa: str):
     Args:
         normativa: Nombre de la nueva normativa ("IEC", "NEC", "PERSONALIZADA")
     """
-    global SECTIONS_CONFIG
+    global _sections_config
     try:
-        SECTIONS_CONFIG = load_sections_config(normativa)
+        _sections_config = load_sections_config(normativa)
         logger.info(f"Normativa cambiada exitosamente a: {normativa}")
         return True
     except Exception as e:
@@ -1152,10 +1752,15 @@ def test_custom_normativa():
 
 # REEMPLAZAR la función calculate_cn1_section existente en string_calculator.py con esta versión corregida:
 
-def calculate_cn1_section(row: pd.Series, config: dict, circuit_type: str = "cn1_inverter") -> dict:
+def calculate_cn1_section(row: Mapping, config: dict, circuit_type: str = "cn1_inverter",
+                          normativa_config: dict = None, correction_divisor: float = None) -> dict:
     """
     Calcula sección CN1 con corriente combinada de múltiples strings
     CORREGIDO: Usa normalización correcta para mapeo de strings en paralelo
+    
+    `row`: pd.Series o dict (columna -> valor).
+    `normativa_config`: normativa ya resuelta (resolve_normativa_config), opcional.
+    `correction_divisor`: divisor ya calculado (precompute_correction_divisor), opcional.
     """
     try:
         # Validar configuración
@@ -1200,7 +1805,7 @@ def calculate_cn1_section(row: pd.Series, config: dict, circuit_type: str = "cn1
                    f"nominal: {i_nominal:.2f}A")
 
         # Aplicar factores de corrección (temperatura, agrupamiento)
-        i_adj = apply_correction_factors(i_nominal, config)
+        i_adj = apply_correction_factors(i_nominal, config, normativa_config, correction_divisor)
         
         # LONGITUDES: NO MULTIPLICAR - ya están dadas correctamente en el Excel
         length_total = length_pos + length_neg  # Distancia real del cable CN1
@@ -1273,7 +1878,7 @@ def calculate_cn1_section(row: pd.Series, config: dict, circuit_type: str = "cn1
             "max_vdrop_pct": max_percentage,
             "voltage_status": voltage_status,
             "circuit_type": circuit_type,
-            "normativa": SECTIONS_CONFIG["normativa_used"],
+            "normativa": _get_sections_config()["normativa_used"],
             "cable_material": material,
             "calculation_status": "SUCCESS",
             "calculation_type": "CN1_COMBINED"
@@ -1289,7 +1894,7 @@ def calculate_cn1_section(row: pd.Series, config: dict, circuit_type: str = "cn1
             "error": str(e),
             "calculation_status": "ERROR",
             "calculation_type": "CN1_COMBINED",
-            "normativa": SECTIONS_CONFIG.get("normativa_used", "UNKNOWN")
+            "normativa": _get_sections_config().get("normativa_used", "UNKNOWN")
         }
 
 def calculate_all_cn1_circuits(df: pd.DataFrame, config: dict, circuit_type: str = "cn1_inverter") -> List[dict]:
@@ -1301,14 +1906,33 @@ def calculate_all_cn1_circuits(df: pd.DataFrame, config: dict, circuit_type: str
     logger.info(f"Iniciando cálculo CN1 de {len(df)} circuits con corriente combinada")
     logger.info(f"Mappings disponibles: {len(parallel_mapping)} circuits con strings en paralelo")
     
+    # La normativa no depende de la fila: se resuelve una vez para todo el lote
+    try:
+        normativa_config = resolve_normativa_config(config)
+    except Exception as e:
+        logger.warning(f"No se pudo resolver la normativa para el lote CN1, se resolverá por circuito: {e}")
+        normativa_config = None
+    
+    # Los factores de corrección tampoco dependen de la fila: un único divisor para el lote
+    # (sobre la config validada, igual que la usa calculate_cn1_section)
+    correction_divisor = None
+    if normativa_config is not None:
+        try:
+            correction_divisor = precompute_correction_divisor(validate_config_parameters(config), normativa_config)
+        except Exception as e:
+            logger.warning(f"No se pudo precalcular el divisor de corrección CN1, se calculará por circuito: {e}")
+    
     results = []
     success_count = 0
     error_count = 0
     
-    for index, row in df.iterrows():
+    # Filas como dicts (itertuples): sin construir un pd.Series por fila como iterrows
+    columns = list(df.columns)
+    for index, values in zip(df.index, df.itertuples(index=False, name=None)):
+        row = dict(zip(columns, values))
         try:
             # Usar función específica para CN1
-            result = calculate_cn1_section(row, config, circuit_type)
+            result = calculate_cn1_section(row, config, circuit_type, normativa_config, correction_divisor)
             results.append(result)
             
             if "error" not in result:
@@ -1328,7 +1952,7 @@ def calculate_all_cn1_circuits(df: pd.DataFrame, config: dict, circuit_type: str
                 "error": f"Error fatal: {str(e)}",
                 "calculation_status": "FATAL_ERROR",
                 "calculation_type": "CN1_COMBINED",
-                "normativa": SECTIONS_CONFIG.get("normativa_used", "UNKNOWN")
+                "normativa": _get_sections_config().get("normativa_used", "UNKNOWN")
             }
             results.append(error_result)
             error_count += 1
@@ -1,6 +1,9 @@
+import copy
 import os
-import yaml
-from typing import Dict, Any, Optional, Tuple
+from app.services import _yaml as yaml
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from pathlib import Path
 import logging
 
@@ -14,18 +17,24 @@ NORMATIVAS_PATH = CONFIGS_DIR / "normativas.yaml"
 PANELS_PATH = CONFIGS_DIR / "panel_database.yaml"
 
 def load_yaml_config(file_path: str) -> dict:
-    """Función legacy para compatibilidad"""
-    if not os.path.exists(file_path):
+    """Función legacy para compatibilidad (con la misma caché .cache.pkl que el resto de configs)"""
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Config file not found: {file_path}")
     
-    with open(file_path, 'r') as f:
-        return yaml.safe_load(f)
+    return yaml.load_file(file_path, stat)
 
+@lru_cache(maxsize=1)
 def load_panel_database() -> Dict[str, Any]:
-    """Carga la base de datos de paneles"""
+    """
+    Carga la base de datos de paneles (una sola vez por proceso)
+    
+    El dict devuelto se comparte entre llamadas: no modificarlo.
+    invalidate_config_cache() fuerza una nueva lectura.
+    """
     try:
-        with open(PANELS_PATH, 'r', encoding='utf-8') as file:
-            config = yaml.safe_load(file)
+        config = yaml.load_file(PANELS_PATH)
         
         logger.info(f"Base de datos de paneles cargada exitosamente desde {PANELS_PATH}")
         return config
@@ -106,11 +115,16 @@ def get_panel_data(panel_model: str) -> Dict[str, Any]:
         logger.error(f"❌ Error obteniendo datos del panel '{panel_model}': {e}")
         raise
 
+@lru_cache(maxsize=1)
 def load_normativas_config() -> Dict[str, Any]:
-    """Carga las configuraciones de normativas"""
+    """
+    Carga las configuraciones de normativas (una sola vez por proceso)
+    
+    El dict devuelto se comparte entre llamadas: no modificarlo.
+    invalidate_config_cache() fuerza una nueva lectura.
+    """
     try:
-        with open(NORMATIVAS_PATH, 'r', encoding='utf-8') as file:
-            config = yaml.safe_load(file)
+        config = yaml.load_file(NORMATIVAS_PATH)
         
         logger.info(f"Normativas cargadas exitosamente desde {NORMATIVAS_PATH}")
         return config
@@ -122,27 +136,43 @@ def load_normativas_config() -> Dict[str, Any]:
         logger.error(f"Error parseando YAML de normativas: {e}")
         raise ValueError(f"Error parsing normativas YAML: {e}")
 
-def get_available_normativas() -> Dict[str, str]:
-    """Obtiene la lista de normativas disponibles"""
+def invalidate_config_cache() -> None:
+    """Descarta los YAML de configuración en caché (tests o recarga tras editar los archivos)"""
+    load_panel_database.cache_clear()
+    load_normativas_config.cache_clear()
+    _load_available_normativas.cache_clear()
+    _load_available_panels.cache_clear()
+    _build_base_calculation_config.cache_clear()
+
+# Listado de respaldo si el YAML no se puede leer (mismo tipo que el listado normal)
+_FALLBACK_NORMATIVAS = MappingProxyType({
+    'IEC': MappingProxyType({'name': 'IEC (Fallback)', 'description': 'Configuración por defecto', 'country': 'Internacional'}),
+    'PERSONALIZADA': MappingProxyType({'name': 'Personalizada (Fallback)', 'description': 'Configuración personalizada', 'country': 'Personalizado'})
+})
+
+@lru_cache(maxsize=1)
+def _load_available_normativas() -> Mapping[str, Mapping[str, str]]:
+    """Construye (una sola vez por proceso) el listado de normativas del YAML, de solo lectura"""
+    config = load_normativas_config()
+    normativas = {}
+    
+    for key, value in config.get('normativas', {}).items():
+        normativas[key] = MappingProxyType({
+            'name': value.get('name', key),
+            'description': value.get('description', ''),
+            'country': value.get('country', '')
+        })
+    
+    return MappingProxyType(normativas)
+
+def get_available_normativas() -> Mapping[str, Mapping[str, str]]:
+    """Obtiene la lista de normativas disponibles (vista de solo lectura compartida)"""
     try:
-        config = load_normativas_config()
-        normativas = {}
-        
-        for key, value in config.get('normativas', {}).items():
-            normativas[key] = {
-                'name': value.get('name', key),
-                'description': value.get('description', ''),
-                'country': value.get('country', '')
-            }
-        
-        return normativas
+        return _load_available_normativas()
     
     except Exception as e:
         logger.error(f"Error obteniendo normativas: {e}")
-        return {
-            'IEC': {'name': 'IEC (Fallback)', 'description': 'Configuración por defecto', 'country': 'Internacional'},
-            'PERSONALIZADA': {'name': 'Personalizada (Fallback)', 'description': 'Configuración personalizada', 'country': 'Personalizado'}
-        }
+        return _FALLBACK_NORMATIVAS
 
 # En tu archivo app/services/config_loader.py
 # Buscar la función get_normativa_config y cambiar el final:
@@ -217,116 +247,40 @@ def build_calculation_config(
     2. Aplica overrides ANTES de construir la configuración final
     3. Agrega logs detallados para debugging
     4. Marca correctamente cuando se aplican overrides
+    
+    La parte que solo depende de (panel, normativa, archivo de overrides) se
+    memoriza: el dict devuelto es nuevo en el primer nivel y en _metadata, pero
+    las secciones anidadas (cable, voltage_drop, ...) se comparten entre
+    llamadas y no deben modificarse en sitio.
     """
     try:
         logger.info(f"🔧 Construyendo config para proyecto: {project_name}, normativa: {normativa}")
         
-        # 1. Obtener datos del panel
         panel_model = project_info.get('panel_model', 'Panel Personalizado')
-        panel_data = get_panel_data(panel_model)
-        logger.info(f"📋 Panel cargado: {panel_model} (ISC: {panel_data['electrical_stc']['isc']}A)")
-        
-        # 2. Obtener configuración de normativa BASE
-        normativa_config = get_normativa_config(normativa)
-        logger.info(f"📋 Normativa base cargada: {normativa}")
-        
-        # 🔥 3. CARGAR Y APLICAR OVERRIDES DEL PROYECTO PARA dc_strings
-        overrides_applied = False
-        override_details = {}
         
+        # Versión del archivo de overrides (mtime + tamaño): editarlo invalida la caché
+        override_path = None
+        override_version = None
         if project_name:
             dc_strings_yaml_path = f"projects/{project_name}/normativas/dc_strings.yaml"
             logger.info(f"🔍 Buscando overrides en: {dc_strings_yaml_path}")
-            
-            if os.path.exists(dc_strings_yaml_path):
-                try:
-                    with open(dc_strings_yaml_path, 'r', encoding='utf-8') as f:
-                        stage_overrides = yaml.safe_load(f)
-                    
-                    logger.info(f"🔥 ARCHIVO YAML ENCONTRADO - Aplicando overrides...")
-                    
-                    # Aplicar cada override directamente a normativa_config
-                    for section, values in stage_overrides.items():
-                        if section.startswith('_'):  # Skip metadata
-                            continue
-                        
-                        if section in normativa_config:
-                            original_values = normativa_config[section].copy()
-                            
-                            if isinstance(values, dict) and isinstance(normativa_config[section], dict):
-                                # Merge profundo para diccionarios
-                                normativa_config[section].update(values)
-                                logger.info(f"🔥 Override MERGE - {section}:")
-                                logger.info(f"     Antes: {original_values}")
-                                logger.info(f"     Después: {normativa_config[section]}")
-                            else:
-                                # Reemplazo directo para valores simples
-                                normativa_config[section] = values
-                                logger.info(f"🔥 Override REPLACE - {section}: {original_values} → {values}")
-                            
-                            override_details[section] = {
-                                'before': original_values,
-                                'after': normativa_config[section]
-                            }
-                        else:
-                            logger.warning(f"⚠️ Sección no encontrada en normativa base: {section}")
-                    
-                    overrides_applied = True
-                    logger.info(f"✅ Overrides aplicados exitosamente - {len(override_details)} secciones modificadas")
-                    
-                except Exception as e:
-                    logger.error(f"❌ Error cargando overrides: {e}")
-                    raise
-            else:
+            try:
+                stat = os.stat(dc_strings_yaml_path)
+                override_path = dc_strings_yaml_path
+                override_version = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
                 logger.info(f"ℹ️ No hay archivo de overrides: {dc_strings_yaml_path}")
         
-        # 4. Construir configuración combinada (AHORA CON OVERRIDES APLICADOS)
-        combined_config = {
-            # Parámetros del panel (fijos)
-            "isc_ref": panel_data['electrical_stc']['isc'],
-            "voc_ref": panel_data['electrical_stc']['voc'],
-            "power_stc": panel_data['power_stc'],
-            
-            # 🔥 Factores normativos (AHORA CON OVERRIDES APLICADOS)
-            "isc_correction": normativa_config['correction_factors']['isc_safety_factor'],
-            "number_of_parallel_strings": normativa_config['correction_factors']['parallel_strings'],
-            
-            # 🔥 Configuración de cable (AHORA CON OVERRIDES APLICADOS)
-            "cable": normativa_config['cable'].copy(),
-            
-            # 🔥 Configuración de instalación (AHORA CON OVERRIDES APLICADOS)
-            "installation": normativa_config['installation'].copy(),
-            
-            # 🔥 Factores de corrección (AHORA CON OVERRIDES APLICADOS)
-            "correction_factors": {
-                "ambient_temperature": {
-                    "current_ambient": normativa_config['temperature_correction']['ambient_design'],
-                    "values": normativa_config['temperature_correction']['values']
-                },
-                "grouping": normativa_config['grouping_factors']
-            },
-            
-            # 🔥 Caída de tensión (AHORA CON OVERRIDES APLICADOS)
-            "voltage_drop": normativa_config['voltage_drop'].copy(),
-            
-            # Metadatos detallados
-            "_metadata": {
-                "panel_model": panel_model,
-                "panel_data": panel_data,
-                "normativa": normativa,
-                "normativa_config": {
-                    "has_project_overrides": overrides_applied,
-                    "override_file": dc_strings_yaml_path if overrides_applied else None,
-                    "overrides_info": {
-                        "modified_count": len(override_details),
-                        "modified_sections": list(override_details.keys()),
-                        "details": override_details
-                    } if overrides_applied else {}
-                },
-                "has_custom_params": custom_params is not None,
-                "project_info": project_info,
-                "project_name": project_name
-            }
+        cached_config = _build_base_calculation_config(panel_model, normativa, override_path, override_version)
+        overrides_applied = cached_config["_metadata"]["normativa_config"]["has_project_overrides"]
+        
+        # Copia de primer nivel: los llamadores añaden claves (project_name, cn1_parallel_mapping...)
+        combined_config = dict(cached_config)
+        combined_config["_metadata"] = {
+            **cached_config["_metadata"],
+            "has_custom_params": custom_params is not None,
+            "project_info": project_info,
+            "project_name": project_name
         }
         
         # 5. Aplicar parámetros personalizados legacy si existen
@@ -356,12 +310,129 @@ def build_calculation_config(
     except Exception as e:
         logger.error(f"❌ Error construyendo configuración de cálculo: {e}")
         raise
+
+@lru_cache(maxsize=64)
+def _build_base_calculation_config(
+    panel_model: str,
+    normativa: str,
+    dc_strings_yaml_path: Optional[str],
+    override_version: Optional[Tuple[int, int]]
+) -> Mapping[str, Any]:
+    """
+    Parte de build_calculation_config que no depende de la petición: panel,
+    normativa y overrides del proyecto. Compartida entre llamadas (MappingProxyType).
+    `override_version` solo forma parte de la clave de caché.
+    """
+    # 1. Obtener datos del panel
+    panel_data = get_panel_data(panel_model)
+    logger.info(f"📋 Panel cargado: {panel_model} (ISC: {panel_data['electrical_stc']['isc']}A)")
+    
+    # 2. Obtener configuración de normativa BASE
+    normativa_config = get_normativa_config(normativa)
+    logger.info(f"📋 Normativa base cargada: {normativa}")
+    
+    # 🔥 3. CARGAR Y APLICAR OVERRIDES DEL PROYECTO PARA dc_strings
+    overrides_applied = False
+    override_details = {}
+    
+    if dc_strings_yaml_path:
+        try:
+            with open(dc_strings_yaml_path, 'r', encoding='utf-8') as f:
+                stage_overrides = yaml.safe_load(f)
+            
+            logger.info(f"🔥 ARCHIVO YAML ENCONTRADO - Aplicando overrides...")
+            
+            # Aplicar cada override directamente a normativa_config
+            for section, values in stage_overrides.items():
+                if section.startswith('_'):  # Skip metadata
+                    continue
+                
+                if section in normativa_config:
+                    original_values = normativa_config[section].copy()
+                    
+                    if isinstance(values, dict) and isinstance(normativa_config[section], dict):
+                        # Merge sobre una copia: la sección original pertenece a la normativa en caché
+                        normativa_config[section] = {**normativa_config[section], **values}
+                        logger.info(f"🔥 Override MERGE - {section}:")
+                        logger.info(f"     Antes: {original_values}")
+                        logger.info(f"     Después: {normativa_config[section]}")
+                    else:
+                        # Reemplazo directo para valores simples
+                        normativa_config[section] = values
+                        logger.info(f"🔥 Override REPLACE - {section}: {original_values} → {values}")
+                    
+                    override_details[section] = {
+                        'before': original_values,
+                        'after': normativa_config[section]
+                    }
+                else:
+                    logger.warning(f"⚠️ Sección no encontrada en normativa base: {section}")
+            
+            overrides_applied = True
+            logger.info(f"✅ Overrides aplicados exitosamente - {len(override_details)} secciones modificadas")
+            
+        except Exception as e:
+            logger.error(f"❌ Error cargando overrides: {e}")
+            raise
+    
+    # 4. Construir configuración combinada (AHORA CON OVERRIDES APLICADOS)
+    # Sin copias de las secciones: nadie las modifica en sitio (merge_custom_params y
+    # validate_config_parameters copian lo que escriben); el primer nivel es de solo lectura
+    return MappingProxyType({
+        # Parámetros del panel (fijos)
+        "isc_ref": panel_data['electrical_stc']['isc'],
+        "voc_ref": panel_data['electrical_stc']['voc'],
+        "power_stc": panel_data['power_stc'],
+        
+        # 🔥 Factores normativos (AHORA CON OVERRIDES APLICADOS)
+        "isc_correction": normativa_config['correction_factors']['isc_safety_factor'],
+        "number_of_parallel_strings": normativa_config['correction_factors']['parallel_strings'],
+        
+        # 🔥 Configuración de cable (AHORA CON OVERRIDES APLICADOS)
+        "cable": normativa_config['cable'],
+        
+        # 🔥 Configuración de instalación (AHORA CON OVERRIDES APLICADOS)
+        "installation": normativa_config['installation'],
+        
+        # 🔥 Factores de corrección (AHORA CON OVERRIDES APLICADOS)
+        "correction_factors": {
+            "ambient_temperature": {
+                "current_ambient": normativa_config['temperature_correction']['ambient_design'],
+                "values": normativa_config['temperature_correction']['values']
+            },
+            "grouping": normativa_config['grouping_factors']
+        },
+        
+        # 🔥 Caída de tensión (AHORA CON OVERRIDES APLICADOS)
+        "voltage_drop": normativa_config['voltage_drop'],
+        
+        # Metadatos detallados (los de la petición los añade build_calculation_config)
+        "_metadata": {
+            "panel_model": panel_model,
+            "panel_data": panel_data,
+            "normativa": normativa,
+            "normativa_config": {
+                "has_project_overrides": overrides_applied,
+                "override_file": dc_strings_yaml_path if overrides_applied else None,
+                "overrides_info": {
+                    "modified_count": len(override_details),
+                    "modified_sections": list(override_details.keys()),
+                    "details": override_details
+                } if overrides_applied else {}
+            }
+        }
+    })
     
 def merge_custom_params(base_config: Dict[str, Any], custom_params: Dict[str, Any]) -> Dict[str, Any]:
-    """Combina configuración base con parámetros personalizados"""
+    """
+    Combina configuración base con parámetros personalizados
+    
+    Sin deepcopy: solo se copian los dicts del camino de cada parámetro escrito
+    (copy-on-write), el resto del árbol se comparte con base_config.
+    """
     try:
-        import copy
-        merged_config = copy.deepcopy(base_config)
+        merged_config = dict(base_config)
+        copied_paths = set()
         
         # Mapeo de parámetros editables
         param_mapping = {
@@ -394,10 +465,14 @@ def merge_custom_params(base_config: Dict[str, Any], custom_params: Dict[str, An
                 path = param_mapping[param_key]
                 current_level = merged_config
                 
-                # Navegar hasta el penúltimo nivel
-                for key in path[:-1]:
+                # Navegar hasta el penúltimo nivel, copiando cada dict la primera vez que se pisa
+                for depth, key in enumerate(path[:-1], start=1):
+                    prefix = tuple(path[:depth])
                     if key not in current_level:
                         current_level[key] = {}
+                    elif prefix not in copied_paths:
+                        current_level[key] = dict(current_level[key])
+                    copied_paths.add(prefix)
                     current_level = current_level[key]
                 
                 # Asignar el valor final
@@ -407,6 +482,7 @@ def merge_custom_params(base_config: Dict[str, Any], custom_params: Dict[str, An
                 logger.warning(f"Parámetro personalizado no reconocido: {param_key}")
         
         # Marcar como personalizado
+        merged_config['_metadata'] = dict(merged_config['_metadata'])
         merged_config['_metadata']['custom_params'] = custom_params
         merged_config['_metadata']['is_custom'] = True
         
@@ -416,25 +492,35 @@ def merge_custom_params(base_config: Dict[str, Any], custom_params: Dict[str, An
         logger.error(f"Error aplicando parámetros personalizados: {e}")
         raise
 
-def get_available_panels() -> Dict[str, str]:
-    """Obtiene la lista de paneles disponibles en la base de datos"""
+@lru_cache(maxsize=1)
+def _load_available_panels() -> Mapping[str, Mapping[str, Any]]:
+    """Construye (una sola vez por proceso) el listado de paneles de la base de datos, de solo lectura"""
+    panel_db = load_panel_database()
+    panels = {}
+    
+    for key, value in panel_db.get('panels', {}).items():
+        panels[key] = MappingProxyType({
+            'manufacturer': value.get('manufacturer', ''),
+            'model': value.get('model', key),
+            'power': value.get('power_stc', 0),
+            'technology': value.get('technology', '')
+        })
+    
+    return MappingProxyType(panels)
+
+# Listado de respaldo si la base de datos no se puede leer
+_FALLBACK_PANELS = MappingProxyType({
+    "Panel Personalizado": MappingProxyType({"manufacturer": "Personalizado", "model": "Definido por usuario", "power": 400})
+})
+
+def get_available_panels() -> Mapping[str, Mapping[str, Any]]:
+    """Obtiene la lista de paneles disponibles en la base de datos (vista de solo lectura compartida)"""
     try:
-        panel_db = load_panel_database()
-        panels = {}
-        
-        for key, value in panel_db.get('panels', {}).items():
-            panels[key] = {
-                'manufacturer': value.get('manufacturer', ''),
-                'model': value.get('model', key),
-                'power': value.get('power_stc', 0),
-                'technology': value.get('technology', '')
-            }
-        
-        return panels
+        return _load_available_panels()
     
     except Exception as e:
         logger.error(f"Error obteniendo paneles disponibles: {e}")
-        return {"Panel Personalizado": {"manufacturer": "Personalizado", "model": "Definido por usuario", "power": 400}}
+        return _FALLBACK_PANELS
 
 # Agregar al final de backend/app/services/config_loader.py
 
@@ -686,7 +772,6 @@ def apply_overrides_to_config(base_config: Dict[str, Any], overrides: Dict[str,
     Returns:
         Configuración con overrides aplicados
     """
-    import copy
     result = copy.deepcopy(base_config)
     
     for param_path, new_value in overrides.items():
@@ -1,10 +1,10 @@
 # backend/services/project_loader.py
 
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import logging
 
-from app.services.parsing.parser import read_project_excel
+from app.services.parsing.parser import ParsedWorkbook, read_project_excel
 
 
 logger = logging.getLogger(__name__)
@@ -25,13 +25,53 @@ def extract_project_info(project_name: str) -> Dict[str, Any]:
     Raises:
         ValueError: If Excel cannot be read or project_info sheet is invalid
     """
-    success, xl_or_msg = read_project_excel(project_name)
-    if not success:
-        raise ValueError(f"Error reading Excel: {xl_or_msg}")
+    xl = _open_project_excel(project_name)
+    return extract_project_info_from(_parse_project_info(xl), project_name)
+
+
+def extract_project_info_and_sheet(project_name: str, sheet_name: str) -> Tuple[Dict[str, Any], pd.DataFrame]:
+    """
+    Opens the project Excel once and returns both the project information and
+    the requested circuit sheet, instead of calling extract_project_info()
+    and load_excel_sheet() (two workbook opens) back to back.
     
-    xl = xl_or_msg
+    Args:
+        project_name: Name of the project
+        sheet_name: Circuit sheet to load (e.g. "dc_string_circuits")
+        
+    Returns:
+        Tuple (project_info, circuit DataFrame); the DataFrame is the
+        caller's own copy and can be modified
+        
+    Raises:
+        ValueError: If Excel cannot be read or project_info sheet is invalid
+        RuntimeError: If the circuit sheet cannot be parsed
+    """
+    xl = _open_project_excel(project_name)
+    project_info = extract_project_info_from(_parse_project_info(xl), project_name)
+    try:
+        # Copy, as in load_excel_sheet: the parsed sheets are cached and shared between requests
+        df = xl.parse(sheet_name).copy()
+    except Exception as e:
+        raise RuntimeError(f"Error al cargar hoja '{sheet_name}' del archivo: {e}")
+    return project_info, df
+
+
+def extract_project_info_from(df: pd.DataFrame, project_name: str = "") -> Dict[str, Any]:
+    """
+    Converts an already-parsed project_info sheet into a clean dictionary.
+    
+    Args:
+        df: DataFrame of the project_info sheet
+        project_name: Name of the project (only used for logging)
+        
+    Returns:
+        Dict containing cleaned project information
+        
+    Raises:
+        ValueError: If the project_info sheet is empty or invalid
+    """
     try:
-        df = xl.parse("project_info")
         if len(df) == 0:
             raise ValueError("The project_info sheet is empty")
         
@@ -58,4 +98,21 @@ def extract_project_info(project_name: str) -> Dict[str, Any]:
     
     except Exception as e:
         logger.error(f"Error extracting project_info: {e}")
-        raise ValueError(f"Error processing project_info: {str(e)}")
\ No newline at end of file
+        raise ValueError(f"Error processing project_info: {str(e)}")
+
+
+def _open_project_excel(project_name: str) -> ParsedWorkbook:
+    """Opens the project workbook or raises ValueError with the parser message"""
+    success, xl_or_msg = read_project_excel(project_name)
+    if not success:
+        raise ValueError(f"Error reading Excel: {xl_or_msg}")
+    return xl_or_msg
+
+
+def _parse_project_info(xl: ParsedWorkbook) -> pd.DataFrame:
+    """Parses the project_info sheet, wrapping failures like extract_project_info always did"""
+    try:
+        return xl.parse("project_info")
+    except Exception as e:
+        logger.error(f"Error extracting project_info: {e}")
+        raise ValueError(f"Error processing project_info: {str(e)}")
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 from ...models.norm_params import ProjectNormOverrides
 from ..config_loader import format_norm_parameters_for_ui
+from .. import _yaml as yaml
 
 logger = logging.getLogger(__name__)
 
@@ -9,8 +9,10 @@ leaving detailed content validation to specialized validators.
 
 === RESPONSIBILITIES ===
 - Check if Excel file exists and is readable
-- Verify required sheets are present
-- Return ExcelFile object for further processing
+- Verify required sheets are present (check_required_sheets: names only)
+- Return a parsed workbook object for further processing
+- Cache parsed sheets per file version (mtime + size), in memory and
+  in a pickle under CACHE_DIR/sheets (outside the project folders)
 - Basic logging and error reporting
 
 === NOT RESPONSIBLE FOR ===
@@ -26,10 +28,37 @@ Maintainer: Solar Engineering Team
 
 import pandas as pd
 import os
+import hashlib
 import logging
+import pickle
+import tempfile
+import atexit
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+from app.utils import filesystem
+from app.utils.filesystem import project_excel_path
 
 logger = logging.getLogger(__name__)
 
+# python-calamine (Rust reader) is much faster and lighter than openpyxl; optional
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None  # pandas default: openpyxl (already read_only/data_only)
+
+# Workbooks above this size parse their sheets in parallel worker processes.
+# openpyxl/calamine parsing holds the GIL, so threads give no speedup; below
+# the threshold the process start-up cost outweighs the gain.
+PARALLEL_PARSE_MIN_BYTES = 2 * 1024 * 1024
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
 # Required sheets - only checking existence, not content
 REQUIRED_SHEETS = [
     "project_info",
@@ -43,6 +72,209 @@ OPTIONAL_SHEETS = [
     "ac_circuits"
 ]
 
+class ParsedWorkbook:
+    """
+    Read-only view over already-parsed sheets.
+    
+    Exposes the subset of the pd.ExcelFile API used by the routes
+    (`sheet_names` and `parse(...)`) but serves DataFrames from memory.
+    The returned DataFrames are shared between requests: callers must
+    not modify them in place.
+    """
+
+    def __init__(self, sheets: dict):
+        self._sheets = sheets
+
+    @property
+    def sheet_names(self) -> list:
+        return list(self._sheets)
+
+    def parse(self, sheet_name=0, nrows: int = None):
+        if isinstance(sheet_name, (list, tuple)):
+            return {name: self.parse(name, nrows=nrows) for name in sheet_name}
+        if isinstance(sheet_name, int):
+            sheet_name = self.sheet_names[sheet_name]
+        if sheet_name not in self._sheets:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+
+        df = self._sheets[sheet_name]
+        if isinstance(df, Exception):
+            raise df
+        return df.head(nrows) if nrows is not None else df
+
+@lru_cache(maxsize=32)
+def _load_all_sheets(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Opens the workbook once and parses every sheet.
+    
+    Keyed on (path, mtime, size) so a re-uploaded file is parsed again
+    while repeated requests on the same file are served from memory.
+    Sheets that fail to parse keep their exception so the error is
+    reported when (and only if) that sheet is requested.
+    
+    A pickle cache under CACHE_DIR lets a fresh worker skip the
+    openpyxl parse entirely after the first request.
+    """
+    sheets = _read_sidecar_cache(path, mtime_ns, size)
+    if sheets is not None:
+        return sheets
+
+    # Large workbooks: the names come from the cached index lookup, so the
+    # parent does not load the workbook itself before the workers do
+    sheets = None
+    if size >= PARALLEL_PARSE_MIN_BYTES and (os.cpu_count() or 1) >= 2:
+        sheets = _parse_sheets_parallel(path, size, list(_sheet_names(path, mtime_ns, size)))
+
+    if sheets is None:
+        sheets = {}
+        with pd.ExcelFile(path, engine=EXCEL_ENGINE) as xl:
+            for sheet_name in xl.sheet_names:
+                try:
+                    sheets[sheet_name] = xl.parse(sheet_name)
+                except Exception as e:
+                    sheets[sheet_name] = e.with_traceback(None)
+
+    _write_sidecar_cache(path, mtime_ns, size, sheets)
+    return sheets
+
+def _get_parse_pool():
+    """Lazily created process pool shared by every workbook parse"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(_parse_pool.shutdown)
+        return _parse_pool
+
+def _parse_sheet(path: str, sheet_name: str):
+    """Worker: opens its own handle on the workbook and parses one sheet"""
+    try:
+        with pd.ExcelFile(path, engine=EXCEL_ENGINE) as xl:
+            return xl.parse(sheet_name)
+    except Exception as e:
+        return e.with_traceback(None)
+
+def _parse_sheets_parallel(path: str, size: int, sheet_names: list):
+    """
+    Parses the sheets of a large workbook concurrently, one per worker process.
+    
+    Returns None when the workbook is small, there is a single sheet or CPU,
+    or the pool is unavailable, so the caller falls back to sequential parsing.
+    """
+    if size < PARALLEL_PARSE_MIN_BYTES or len(sheet_names) < 2 or (os.cpu_count() or 1) < 2:
+        return None
+
+    global _parse_pool
+    try:
+        pool = _get_parse_pool()
+        futures = {name: pool.submit(_parse_sheet, path, name) for name in sheet_names}
+        return {name: future.result() for name, future in futures.items()}
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning(f"Parallel sheet parsing unavailable, parsing sequentially: {e}")
+        with _parse_pool_lock:
+            _parse_pool = None
+        return None
+
+def _sidecar_cache_path(path: str) -> str:
+    """
+    Pickle cache of a workbook, under CACHE_DIR/sheets and named after the
+    workbook's absolute path. Never inside the project folder: it must not
+    show up in project listings/deletions, and the pickle is only loaded
+    from a directory the app owns, not from the upload folder.
+    """
+    digest = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()
+    return os.path.join(filesystem.CACHE_DIR, "sheets", f"{digest}.pkl")
+
+def discard_sheet_cache(path) -> None:
+    """Removes the on-disk sheet cache of a workbook (when the workbook is discarded or deleted)"""
+    try:
+        os.remove(_sidecar_cache_path(os.fspath(path)))
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove sheet cache for {path}: {e}")
+
+def _read_sidecar_cache(path: str, mtime_ns: int, size: int):
+    """
+    Loads the pre-parsed sheets from disk if the sidecar was written for
+    this exact version of the workbook; returns None otherwise.
+    """
+    cache_path = _sidecar_cache_path(path)
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable sheet cache {cache_path}: {e}")
+        return None
+
+    if cached.get("mtime_ns") != mtime_ns or cached.get("size") != size:
+        return None
+
+    logger.debug(f"Loaded parsed sheets from cache: {cache_path}")
+    return cached["sheets"]
+
+def _write_sidecar_cache(path: str, mtime_ns: int, size: int, sheets: dict) -> None:
+    """Writes the parsed sheets atomically (temp file + rename); failures are only logged"""
+    if any(isinstance(df, Exception) for df in sheets.values()):
+        return
+
+    cache_path = _sidecar_cache_path(path)
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump({"mtime_ns": mtime_ns, "size": size, "sheets": sheets}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not write sheet cache {cache_path}: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def load_workbook(path) -> ParsedWorkbook:
+    """
+    Parsed view of the workbook at path, served from the per-version cache
+    while the file is unchanged. Raises FileNotFoundError if it does not exist.
+    """
+    path = os.fspath(path)
+    stat = os.stat(path)
+    return ParsedWorkbook(_load_all_sheets(path, stat.st_mtime_ns, stat.st_size))
+
+@lru_cache(maxsize=256)
+def _sheet_names(path: str, mtime_ns: int, size: int) -> tuple:
+    """Sheet names only, read from the workbook index without parsing any sheet"""
+    with pd.ExcelFile(path, engine=EXCEL_ENGINE) as xl:
+        return tuple(xl.sheet_names)
+
+def check_required_sheets(path, stat: os.stat_result = None):
+    """
+    Cheap structure check for listings: are the required sheets present?
+    
+    Only the sheet names are read (cached per file version), so no sheet
+    is parsed. read_project_excel remains the full check.
+    
+    Returns:
+        Tuple[bool, str]: (ok, error_message)
+    """
+    path = os.fspath(path)
+    if stat is None:
+        stat = os.stat(path)
+    try:
+        found_sheets = _sheet_names(path, stat.st_mtime_ns, stat.st_size)
+    except Exception as e:
+        return False, f"Error reading Excel file: {str(e)}"
+
+    missing_sheets = [sheet for sheet in REQUIRED_SHEETS if sheet not in found_sheets]
+    if missing_sheets:
+        return False, f"Missing required sheets: {', '.join(missing_sheets)}"
+    return True, ""
+
 def read_project_excel(project_name: str):
     """
     Reads Excel file and performs basic structure validation.
@@ -58,9 +290,9 @@ def read_project_excel(project_name: str):
         project_name: Name of the project
         
     Returns:
-        Tuple[bool, Union[pd.ExcelFile, str]]: (success, excel_file_or_error_message)
+        Tuple[bool, Union[ParsedWorkbook, str]]: (success, workbook_or_error_message)
     """
-    excel_path = f"projects/{project_name}/input.xlsx"
+    excel_path = project_excel_path(project_name)
 
     # Check if file exists
     if not os.path.exists(excel_path):
@@ -68,8 +300,8 @@ def read_project_excel(project_name: str):
         return False, "Excel file not found."
 
     try:
-        # Try to open the Excel file
-        xl = pd.ExcelFile(excel_path)
+        # Open the Excel file (served from cache while the file is unchanged)
+        xl = load_workbook(excel_path)
         found_sheets = xl.sheet_names
         
         logger.info(f"Found sheets in {project_name}: {found_sheets}")
@@ -114,13 +346,14 @@ def get_sheet_info(project_name: str) -> dict:
     Returns:
         Dictionary with sheet information
     """
-    excel_path = f"projects/{project_name}/input.xlsx"
+    excel_path = project_excel_path(project_name)
     
     if not os.path.exists(excel_path):
         return {"error": "Excel file not found", "sheets": []}
     
     try:
-        xl = pd.ExcelFile(excel_path)
+        # Same cached parse as read_project_excel: the workbook is not opened again
+        xl = load_workbook(excel_path)
         sheet_info = {}
         
         for sheet_name in xl.sheet_names:
@@ -33,8 +33,14 @@ import numpy as np # type: ignore
 from typing import List, Dict, Any, Tuple, Optional
 import logging
 
+from .validation_utils import numeric_column, matches_pattern, RowCheck, field_check, validate_rows
+
 logger = logging.getLogger(__name__)
 
+# ID patterns compiled once at import (they are checked on every row)
+_CN1_ID_RE = re.compile(r"^cn1-\d+$")
+_INVERTER_ID_RE = re.compile(r"^INV-\d+$")
+
 # ============================================================================
 # DC CN1 VALIDATION RULES
 # ============================================================================
@@ -109,8 +115,7 @@ def validate_cn1_circuit_id(value: Any, row_num: int = 0) -> Tuple[bool, str]:
         return False, f"Fila {row_num}: circuit_id debe ser texto -> {value}"
     
     # Check format: cn1-X (lowercase, hyphen, number)
-    pattern = r"^cn1-\d+$"
-    if not re.match(pattern, value):
+    if not _CN1_ID_RE.match(value):
         return False, f"Fila {row_num}: circuit_id formato inválido '{value}' (esperado: cn1-X)"
     
     return True, ""
@@ -173,8 +178,7 @@ def validate_cn1_inverter_id(value: Any, row_num: int = 0) -> Tuple[bool, str]:
         return False, f"Fila {row_num}: inverter_id debe ser texto -> {value}"
     
     # Check format: INV-X
-    pattern = r"^INV-\d+$"
-    if not re.match(pattern, value):
+    if not _INVERTER_ID_RE.match(value):
         return False, f"Fila {row_num}: inverter_id formato inválido '{value}' (esperado: INV-X)"
     
     return True, ""
@@ -200,10 +204,9 @@ def validate_cn1_length_symmetry(df: pd.DataFrame) -> List[str]:
     if "length_pos_m" not in df.columns or "length_neg_m" not in df.columns:
         return warnings
     
-    for index, row in df.iterrows():
+    # Plain tuples (index, pos, neg): no Series built per row
+    for index, pos_length, neg_length in df[["length_pos_m", "length_neg_m"]].itertuples(name=None):
         row_num = index + 2
-        pos_length = row["length_pos_m"]
-        neg_length = row["length_neg_m"]
         
         if pd.isna(pos_length) or pd.isna(neg_length):
             continue
@@ -307,9 +310,7 @@ def validate_cn1_length_precision(df: pd.DataFrame) -> List[str]:
     high_precision_count = 0
     total_valid_rows = 0
     
-    for index, row in df.iterrows():
-        pos_length = row["length_pos_m"]
-        neg_length = row["length_neg_m"]
+    for pos_length, neg_length in df[["length_pos_m", "length_neg_m"]].itertuples(index=False, name=None):
         
         if pd.isna(pos_length) or pd.isna(neg_length):
             continue
@@ -335,6 +336,34 @@ def validate_cn1_length_precision(df: pd.DataFrame) -> List[str]:
     
     return info_messages
 
+# ============================================================================
+# ROW SCHEMA
+# ============================================================================
+
+def _cn1_length_passes(column: str):
+    """
+    Mask builder: lengths that validate_cn1_cable_length accepts without logging,
+    inside the typical range and with at most 3 decimals (x == round(x, 3) holds
+    exactly when str(x) has no more than 3 decimals).
+    """
+    def passes(df: pd.DataFrame) -> np.ndarray:
+        min_typical, max_typical = DC_CN1_BUSINESS_RULES["typical_length_range_m"]
+        lengths = numeric_column(df[column])
+        return (lengths >= min_typical) & (lengths <= max_typical) & (np.round(lengths, 3) == lengths)
+    return passes
+
+# Field checks in message order (see validation_utils.validate_rows)
+DC_CN1_ROW_SCHEMA = (
+    RowCheck(lambda df: matches_pattern(df["circuit_id"], _CN1_ID_RE),
+             field_check("circuit_id", validate_cn1_circuit_id)),
+    RowCheck(_cn1_length_passes("length_pos_m"),
+             field_check("length_pos_m", lambda value, row_num: validate_cn1_cable_length(value, "length_pos_m", row_num))),
+    RowCheck(_cn1_length_passes("length_neg_m"),
+             field_check("length_neg_m", lambda value, row_num: validate_cn1_cable_length(value, "length_neg_m", row_num))),
+    RowCheck(lambda df: matches_pattern(df["inverter_id"], _INVERTER_ID_RE),
+             field_check("inverter_id", validate_cn1_inverter_id)),
+)
+
 # ============================================================================
 # MAIN VALIDATION FUNCTION
 # ============================================================================
@@ -361,29 +390,8 @@ def validate_dc_cn1_circuits(df: pd.DataFrame) -> List[str]:
     if missing_columns:
         return [f"DC CN1 Circuits: Columnas faltantes: {', '.join(missing_columns)}"]
     
-    # Validate each row
-    for index, row in df.iterrows():
-        row_num = index + 2  # Excel row number (accounting for header)
-        
-        # Validate circuit_id
-        is_valid, error_msg = validate_cn1_circuit_id(row["circuit_id"], row_num)
-        if not is_valid:
-            errors.append(f"DC CN1 Circuits: {error_msg}")
-        
-        # Validate length_pos_m
-        is_valid, error_msg = validate_cn1_cable_length(row["length_pos_m"], "length_pos_m", row_num)
-        if not is_valid:
-            errors.append(f"DC CN1 Circuits: {error_msg}")
-        
-        # Validate length_neg_m
-        is_valid, error_msg = validate_cn1_cable_length(row["length_neg_m"], "length_neg_m", row_num)
-        if not is_valid:
-            errors.append(f"DC CN1 Circuits: {error_msg}")
-        
-        # Validate inverter_id
-        is_valid, error_msg = validate_cn1_inverter_id(row["inverter_id"], row_num)
-        if not is_valid:
-            errors.append(f"DC CN1 Circuits: {error_msg}")
+    # Field checks: column-wise masks, per-row validators only on flagged rows
+    errors.extend(validate_rows(df, DC_CN1_ROW_SCHEMA, "DC CN1 Circuits"))
     
     # Business logic validations
     duplicate_warnings = validate_duplicate_cn1_circuits(df)
@@ -34,8 +34,15 @@ import numpy as np # type: ignore
 from typing import List, Dict, Any, Tuple, Optional
 import logging
 
+from .validation_utils import numeric_column, matches_pattern, RowCheck, field_check, validate_rows
+
 logger = logging.getLogger(__name__)
 
+# ID patterns compiled once at import (they are checked on every row)
+_STRING_ID_RE = re.compile(r"^str-\d+-\d+-CN1-\d+-\d+$")
+_CN1_ID_RE = re.compile(r"^CN1-\d+$")
+_INVERTER_ID_RE = re.compile(r"^INV-\d+$")
+
 # ============================================================================
 # DC STRING VALIDATION RULES
 # ============================================================================
@@ -117,8 +124,7 @@ def validate_string_id(value: Any, row_num: int = 0) -> Tuple[bool, str]:
         return False, f"Fila {row_num}: string_id debe ser texto -> {value}"
     
     # Check format: str-XX-XX-CN1-XX-XX
-    pattern = r"^str-\d+-\d+-CN1-\d+-\d+$"
-    if not re.match(pattern, value):
+    if not _STRING_ID_RE.match(value):
         return False, f"Fila {row_num}: string_id formato inválido '{value}' (esperado: str-XX-XX-CN1-XX-XX)"
     
     # Extract components for additional validation
@@ -179,8 +185,7 @@ def validate_cn1_id(value: Any, row_num: int = 0) -> Tuple[bool, str]:
         return False, f"Fila {row_num}: cn1_id debe ser texto -> {value}"
     
     # Check format: CN1-XX
-    pattern = r"^CN1-\d+$"
-    if not re.match(pattern, value):
+    if not _CN1_ID_RE.match(value):
         return False, f"Fila {row_num}: cn1_id formato inválido '{value}' (esperado: CN1-XX)"
     
     return True, ""
@@ -203,8 +208,7 @@ def validate_inverter_id(value: Any, row_num: int = 0) -> Tuple[bool, str]:
         return False, f"Fila {row_num}: inverter_id debe ser texto -> {value}"
     
     # Check format: INV-X or INV-XX
-    pattern = r"^INV-\d+$"
-    if not re.match(pattern, value):
+    if not _INVERTER_ID_RE.match(value):
         return False, f"Fila {row_num}: inverter_id formato inválido '{value}' (esperado: INV-X)"
     
     return True, ""
@@ -229,10 +233,9 @@ def validate_length_symmetry(df: pd.DataFrame) -> List[str]:
     if "length_pos_m" not in df.columns or "length_neg_m" not in df.columns:
         return warnings
     
-    for index, row in df.iterrows():
+    # Plain tuples (index, pos, neg): no Series built per row
+    for index, pos_length, neg_length in df[["length_pos_m", "length_neg_m"]].itertuples(name=None):
         row_num = index + 2
-        pos_length = row["length_pos_m"]
-        neg_length = row["length_neg_m"]
         
         if pd.isna(pos_length) or pd.isna(neg_length):
             continue
@@ -316,6 +319,32 @@ def validate_duplicate_strings(df: pd.DataFrame) -> List[str]:
     
     return errors
 
+# ============================================================================
+# ROW SCHEMA
+# ============================================================================
+
+def _typical_length_passes(column: str):
+    """Mask builder: lengths inside the typical range (valid and no warning logged)"""
+    def passes(df: pd.DataFrame) -> np.ndarray:
+        min_typical, max_typical = DC_STRING_BUSINESS_RULES["typical_length_range_m"]
+        lengths = numeric_column(df[column])
+        return (lengths >= min_typical) & (lengths <= max_typical)
+    return passes
+
+# Field checks in message order (see validation_utils.validate_rows)
+DC_STRING_ROW_SCHEMA = (
+    RowCheck(lambda df: matches_pattern(df["string_id"], _STRING_ID_RE),
+             field_check("string_id", validate_string_id)),
+    RowCheck(_typical_length_passes("length_pos_m"),
+             field_check("length_pos_m", lambda value, row_num: validate_cable_length(value, "length_pos_m", row_num))),
+    RowCheck(_typical_length_passes("length_neg_m"),
+             field_check("length_neg_m", lambda value, row_num: validate_cable_length(value, "length_neg_m", row_num))),
+    RowCheck(lambda df: matches_pattern(df["cn1_id"], _CN1_ID_RE),
+             field_check("cn1_id", validate_cn1_id)),
+    RowCheck(lambda df: matches_pattern(df["inverter_id"], _INVERTER_ID_RE),
+             field_check("inverter_id", validate_inverter_id)),
+)
+
 # ============================================================================
 # MAIN VALIDATION FUNCTION
 # ============================================================================
@@ -342,34 +371,8 @@ def validate_dc_string_circuits(df: pd.DataFrame) -> List[str]:
     if missing_columns:
         return [f"DC String Circuits: Columnas faltantes: {', '.join(missing_columns)}"]
     
-    # Validate each row
-    for index, row in df.iterrows():
-        row_num = index + 2  # Excel row number (accounting for header)
-        
-        # Validate string_id
-        is_valid, error_msg = validate_string_id(row["string_id"], row_num)
-        if not is_valid:
-            errors.append(f"DC String Circuits: {error_msg}")
-        
-        # Validate length_pos_m
-        is_valid, error_msg = validate_cable_length(row["length_pos_m"], "length_pos_m", row_num)
-        if not is_valid:
-            errors.append(f"DC String Circuits: {error_msg}")
-        
-        # Validate length_neg_m
-        is_valid, error_msg = validate_cable_length(row["length_neg_m"], "length_neg_m", row_num)
-        if not is_valid:
-            errors.append(f"DC String Circuits: {error_msg}")
-        
-        # Validate cn1_id
-        is_valid, error_msg = validate_cn1_id(row["cn1_id"], row_num)
-        if not is_valid:
-            errors.append(f"DC String Circuits: {error_msg}")
-        
-        # Validate inverter_id
-        is_valid, error_msg = validate_inverter_id(row["inverter_id"], row_num)
-        if not is_valid:
-            errors.append(f"DC String Circuits: {error_msg}")
+    # Field checks: column-wise masks, per-row validators only on flagged rows
+    errors.extend(validate_rows(df, DC_STRING_ROW_SCHEMA, "DC String Circuits"))
     
     # Business logic validations (add as warnings)
     duplicate_errors = validate_duplicate_strings(df)
@@ -33,8 +33,13 @@ import numpy as np
 from typing import List, Dict, Any, Tuple, Optional
 import logging
 
+from .validation_utils import numeric_column, matches_pattern, RowCheck, field_check, validate_rows
+
 logger = logging.getLogger(__name__)
 
+# ID patterns compiled once at import (they are checked on every row)
+_MV_ID_RE = re.compile(r"^MV-\d+$")
+
 # ============================================================================
 # MV VALIDATION RULES
 # ============================================================================
@@ -118,8 +123,7 @@ def validate_mv_circuit_id(value: Any, row_num: int = 0) -> Tuple[bool, str]:
         return False, f"Fila {row_num}: circuit_id debe ser texto -> {value}"
     
     # Check format: MV-X (uppercase MV, hyphen, number)
-    pattern = r"^MV-\d+$"
-    if not re.match(pattern, value):
+    if not _MV_ID_RE.match(value):
         return False, f"Fila {row_num}: circuit_id formato inválido '{value}' (esperado: MV-X)"
     
     return True, ""
@@ -321,10 +325,9 @@ def validate_mv_length_section_relationships(df: pd.DataFrame) -> List[str]:
     if "length_m" not in df.columns or "section_mm2" not in df.columns:
         return warnings
     
-    for index, row in df.iterrows():
+    # Plain tuples (index, length, section): no Series built per row
+    for index, length, section in df[["length_m", "section_mm2"]].itertuples(name=None):
         row_num = index + 2
-        length = row["length_m"]
-        section = row["section_mm2"]
         
         if pd.isna(length) or pd.isna(section):
             continue
@@ -346,6 +349,50 @@ def validate_mv_length_section_relationships(df: pd.DataFrame) -> List[str]:
     
     return warnings
 
+# ============================================================================
+# ROW SCHEMA
+# ============================================================================
+
+def _mv_length_passes(df: pd.DataFrame) -> np.ndarray:
+    """Lengths inside the typical MV range (valid and no warning logged)"""
+    min_typical, max_typical = MV_BUSINESS_RULES["typical_length_range_m"]
+    lengths = numeric_column(df["length_m"])
+    return (lengths >= min_typical) & (lengths <= max_typical)
+
+def _mv_section_passes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Sections that validate_mv_section accepts without logging: a standard
+    commercial value that meets the length-based recommendation.
+    """
+    sections = numeric_column(df["section_mm2"])
+    lengths = numeric_column(df["length_m"])
+    guidelines = MV_BUSINESS_RULES["section_length_guidelines"]
+    undersized = np.zeros(sections.shape, dtype=bool)
+    for guideline in ("short", "medium", "long"):
+        undersized |= (lengths <= guidelines[guideline]["max_length"]) & (sections < guidelines[guideline]["min_section"])
+    return np.isin(sections, STANDARD_MV_SECTIONS) & ~undersized
+
+def _check_mv_section(row: pd.Series, row_num: int) -> Tuple[bool, str]:
+    """validate_mv_section with the row's length as context"""
+    length_value = None
+    try:
+        length_value = float(row["length_m"]) if not pd.isna(row["length_m"]) else None
+    except (ValueError, TypeError):
+        pass
+    return validate_mv_section(row["section_mm2"], row_num, length_value)
+
+# Field checks in message order (see validation_utils.validate_rows)
+MV_ROW_SCHEMA = (
+    RowCheck(lambda df: matches_pattern(df["circuit_id"], _MV_ID_RE),
+             field_check("circuit_id", validate_mv_circuit_id)),
+    RowCheck(_mv_length_passes,
+             field_check("length_m", validate_mv_length)),
+    RowCheck(lambda df: numeric_column(df["phases"]) == 3,
+             field_check("phases", validate_mv_phases)),
+    RowCheck(_mv_section_passes,
+             _check_mv_section),
+)
+
 # ============================================================================
 # MAIN VALIDATION FUNCTION
 # ============================================================================
@@ -372,35 +419,8 @@ def validate_mv_circuits(df: pd.DataFrame) -> List[str]:
     if missing_columns:
         return [f"MV Circuits: Columnas faltantes: {', '.join(missing_columns)}"]
     
-    # Validate each row
-    for index, row in df.iterrows():
-        row_num = index + 2  # Excel row number (accounting for header)
-        
-        # Validate circuit_id
-        is_valid, error_msg = validate_mv_circuit_id(row["circuit_id"], row_num)
-        if not is_valid:
-            errors.append(f"MV Circuits: {error_msg}")
-        
-        # Validate length_m
-        is_valid, error_msg = validate_mv_length(row["length_m"], row_num)
-        if not is_valid:
-            errors.append(f"MV Circuits: {error_msg}")
-        
-        # Validate phases
-        is_valid, error_msg = validate_mv_phases(row["phases"], row_num)
-        if not is_valid:
-            errors.append(f"MV Circuits: {error_msg}")
-        
-        # Validate section_mm2 (with length context)
-        length_value = None
-        try:
-            length_value = float(row["length_m"]) if not pd.isna(row["length_m"]) else None
-        except (ValueError, TypeError):
-            pass
-        
-        is_valid, error_msg = validate_mv_section(row["section_mm2"], row_num, length_value)
-        if not is_valid:
-            errors.append(f"MV Circuits: {error_msg}")
+    # Field checks: column-wise masks, per-row validators only on flagged rows
+    errors.extend(validate_rows(df, MV_ROW_SCHEMA, "MV Circuits"))
     
     # Business logic validations
     duplicate_errors = validate_duplicate_mv_circuits(df)
@@ -216,6 +216,13 @@ NON_PRIORITY_FIELDS = {
     }
 }
 
+# Both tables merged, and the text patterns compiled once at import
+ALL_FIELDS = {**PRIORITY_FIELDS, **NON_PRIORITY_FIELDS}
+FIELD_PATTERNS = {
+    config["pattern"]: re.compile(config["pattern"])
+    for config in ALL_FIELDS.values() if "pattern" in config
+}
+
 # Regional coordinate validation for Central America
 COORDINATE_REGIONS = {
     "CENTROAMERICA": {
@@ -305,7 +312,7 @@ def validate_field_value(field_name: str, value: Any, field_config: Dict[str, An
             return False, f"'{field_name}' no puede exceder {max_len} caracteres"
         
         pattern = field_config.get("pattern")
-        if pattern and not re.match(pattern, value):
+        if pattern and not (FIELD_PATTERNS.get(pattern) or re.compile(pattern)).match(value):
             return False, f"'{field_name}' tiene formato inválido"
     
     # Number validation
@@ -562,8 +569,8 @@ def generate_completion_form(missing_fields: List[str], current_data: Dict[str,
     
     # Add current values (all editable)
     for field, value in current_data.items():
-        if not pd.isna(value) and field in {**PRIORITY_FIELDS, **NON_PRIORITY_FIELDS}:
-            field_config = PRIORITY_FIELDS.get(field, NON_PRIORITY_FIELDS.get(field, {}))
+        if field in ALL_FIELDS and not pd.isna(value):
+            field_config = ALL_FIELDS[field]
             form_structure["current_values"][field] = {
                 "value": value,
                 "editable": True,
@@ -573,7 +580,7 @@ def generate_completion_form(missing_fields: List[str], current_data: Dict[str,
             }
     
     # Add field definitions for reference
-    form_structure["field_definitions"] = {**PRIORITY_FIELDS, **NON_PRIORITY_FIELDS}
+    form_structure["field_definitions"] = dict(ALL_FIELDS)
     
     return form_structure
 
@@ -694,7 +701,7 @@ def validate_single_field(field_name: str, value: Any, priority: str = "Priorita
     Returns:
         Validation result with status and message
     """
-    field_config = PRIORITY_FIELDS.get(field_name, NON_PRIORITY_FIELDS.get(field_name))
+    field_config = ALL_FIELDS.get(field_name)
     
     if not field_config:
         return {
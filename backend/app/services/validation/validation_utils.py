@@ -0,0 +1,93 @@
+# backend/services/validation/validation_utils.py
+"""
+VALIDATION UTILITIES MODULE
+
+=== PURPOSE ===
+Column-wise helpers shared by the sheet validators. They compute, for a
+whole column at once, which rows pass a field check without producing any
+error or warning, so the per-field validators only run on the rest.
+
+=== DESIGN ===
+Every mask is conservative: a row marked as passing must be one the
+per-field validator accepts silently. Anything uncertain (text in a
+numeric column, blanks, booleans) is left for the per-field validator,
+which keeps the original messages and logs.
+
+Each sheet declares its row checks as a table of RowCheck entries
+(passing mask + per-row validator, in message order); validate_rows
+runs any such table.
+
+=== LAST UPDATED ===
+Created: 2025-07-02
+Version: 1.0.0
+Maintainer: Solar Engineering Team
+"""
+
+import re
+from typing import Any, Callable, List, NamedTuple, Sequence, Tuple
+
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+from pandas.api.types import is_bool_dtype, is_numeric_dtype, is_object_dtype, is_string_dtype # type: ignore
+
+
+def numeric_column(series: pd.Series) -> np.ndarray:
+    """
+    Column values as float64, with NaN wherever the cell is not a real number.
+
+    Text (even "21.5"), booleans and blanks become NaN, so they never pass a
+    range mask and are checked by the per-field validator instead.
+    """
+    if is_numeric_dtype(series) and not is_bool_dtype(series):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    return np.array(
+        [float(value) if isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_))
+         else np.nan
+         for value in series.tolist()],
+        dtype=np.float64
+    )
+
+
+def matches_pattern(series: pd.Series, pattern: re.Pattern) -> np.ndarray:
+    """True where the cell is text matching the compiled pattern (re.match semantics)"""
+    if not (is_object_dtype(series) or is_string_dtype(series)):
+        return np.zeros(len(series), dtype=bool)
+    return series.str.match(pattern, na=False).to_numpy(dtype=bool)
+
+
+def flagged_rows(*passing_masks: np.ndarray) -> List[int]:
+    """Row positions where at least one field check did not pass, in row order"""
+    passing = np.logical_and.reduce(passing_masks)
+    return np.flatnonzero(~passing).tolist()
+
+
+class RowCheck(NamedTuple):
+    """One field check of a sheet schema"""
+    passes: Callable[[pd.DataFrame], np.ndarray]  # column-wise mask: True = passes silently
+    check: Callable[[pd.Series, int], Tuple[bool, str]]  # per-row validator: (is_valid, error_message)
+
+
+def field_check(column: str, validator: Callable[[Any, int], Tuple[bool, str]]) -> Callable[[pd.Series, int], Tuple[bool, str]]:
+    """Adapts a field validator validator(value, row_num) to a per-row check"""
+    def check(row: pd.Series, row_num: int) -> Tuple[bool, str]:
+        return validator(row[column], row_num)
+    return check
+
+
+def validate_rows(df: pd.DataFrame, schema: Sequence[RowCheck], prefix: str) -> List[str]:
+    """
+    Runs a sheet schema: the masks over whole columns, then the per-row
+    validators only on the flagged rows, in row order and schema order.
+    
+    Row numbers are Excel rows (index + 2, accounting for the header).
+    """
+    errors = []
+    for position in flagged_rows(*(rule.passes(df) for rule in schema)):
+        row = df.iloc[position]
+        row_num = df.index[position] + 2
+        for rule in schema:
+            is_valid, error_msg = rule.check(row, row_num)
+            if not is_valid:
+                errors.append(f"{prefix}: {error_msg}")
+    return errors
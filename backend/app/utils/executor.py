@@ -0,0 +1,27 @@
+import asyncio
+import atexit
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Pool compartido por todo el proceso: los hilos se crean una sola vez y se
+# reutilizan entre peticiones en lugar de abrir un ThreadPoolExecutor por handler.
+EXECUTOR = ThreadPoolExecutor(
+    max_workers=max(8, (os.cpu_count() or 1) * 2),
+    thread_name_prefix="pv-data",
+)
+atexit.register(EXECUTOR.shutdown)
+
+
+async def run_blocking(fn, *args, **kwargs):
+    """
+    Ejecuta una función bloqueante (lectura de Excel, pandas, YAML) en el pool
+    compartido y espera su resultado desde un handler async.
+
+    Args:
+        fn: Función a ejecutar.
+        *args, **kwargs: Argumentos para `fn`.
+
+    Returns:
+        El valor devuelto por `fn`; las excepciones se propagan al llamador.
+    """
+    return await asyncio.wrap_future(EXECUTOR.submit(fn, *args, **kwargs))
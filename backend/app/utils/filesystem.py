@@ -1,13 +1,31 @@
-import json
+import os
 import shutil
+import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from fastapi import UploadFile
+import orjson
 import pandas as pd
 
 # Define base project directory dynamically
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
-PROJECTS_DIR = BASE_DIR / "projects"
+# CALCAPP_PROJECTS_DIR permite usar otra carpeta de proyectos (p. ej. una temporal en los tests)
+PROJECTS_DIR = Path(os.environ.get("CALCAPP_PROJECTS_DIR", BASE_DIR / "projects"))
+# Cachés derivadas (hojas parseadas): fuera de PROJECTS_DIR, nunca en la carpeta que el usuario sube o borra
+CACHE_DIR = Path(os.environ.get("CALCAPP_CACHE_DIR", BASE_DIR / ".cache"))
+
+
+# Tamaño de bloque al copiar subidas (el SpooledTemporaryFile de Starlette pasa a disco a partir de 1 MB)
+UPLOAD_COPY_CHUNK_BYTES = 1024 * 1024
+
+# os.sendfile entre archivos regulares solo está garantizado en Linux (en macOS el destino debe ser un socket)
+SENDFILE_AVAILABLE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
+
+def project_excel_path(project_name: str) -> Path:
+    """Ruta del input.xlsx de un proyecto (siempre bajo PROJECTS_DIR, no relativa al cwd)"""
+    return PROJECTS_DIR / project_name / "input.xlsx"
 
 
 def create_project_folder(project_name: str):
@@ -28,11 +46,16 @@ def create_project_folder(project_name: str):
     """
     path = PROJECTS_DIR / project_name
 
-    if path.exists():
+    try:
+        # mkdir sin exist_ok: la comprobación de "ya existe" es la propia creación (sin carrera)
+        path.mkdir(parents=True)
+    except FileExistsError:
         return False, "Project already exists."
+    except Exception as e:
+        return False, f"Error creating project: {str(e)}"
 
     try:
-        (path / "calculations").mkdir(parents=True)
+        (path / "calculations").mkdir()
         (path / "reports").mkdir()
 
         # Crear archivo de configuración
@@ -40,8 +63,7 @@ def create_project_folder(project_name: str):
             "name": project_name,
             "created_at": datetime.now().isoformat()
         }
-        with open(path / "config.json", "w") as f:
-            json.dump(config, f, indent=2)
+        (path / "config.json").write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
 
         return True, f"Project '{project_name}' created successfully."
     
@@ -49,20 +71,74 @@ def create_project_folder(project_name: str):
         return False, f"Error creating project: {str(e)}"
 
 
+def _append_log_line(log_path: Path, line: str) -> None:
+    """
+    Añade una línea al log del proyecto con una sola escritura O_APPEND:
+    sin capa de texto/buffer de Python, y atómica frente a subidas concurrentes.
+    El archivo no se deja abierto: el log es la traza de auditoría y debe quedar en disco.
+    """
+    fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line.encode())
+    finally:
+        os.close(fd)
+
+
+def _copy_upload(source, buffer) -> None:
+    """
+    Copia la subida al archivo destino ya abierto.
+    Si Starlette la pasó a disco (SpooledTemporaryFile "rolled"), la copia la
+    hace el kernel con os.sendfile; si sigue en memoria, copyfileobj.
+    """
+    if SENDFILE_AVAILABLE and getattr(source, "_rolled", False):
+        start = source.tell()
+        try:
+            in_fd = source.fileno()
+            offset, size = start, os.fstat(in_fd).st_size
+            while offset < size:
+                sent = os.sendfile(buffer.fileno(), in_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except OSError:
+            # Sistema de archivos sin soporte para sendfile: se repite con la copia normal
+            buffer.seek(0)
+            buffer.truncate()
+            source.seek(start)
+
+    # Bloques de 1 MB: una subida que sigue en memoria se copia en una sola lectura/escritura
+    shutil.copyfileobj(source, buffer, UPLOAD_COPY_CHUNK_BYTES)
+
+
+def _write_upload_atomically(file: UploadFile, dest_file: Path) -> None:
+    """
+    Copia el archivo subido a un temporal en la misma carpeta y lo renombra
+    sobre dest_file (os.replace): quien lea input.xlsx ve el archivo anterior
+    o el nuevo completo, nunca uno a medio escribir.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=dest_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            _copy_upload(file.file, buffer)
+        os.chmod(tmp_path, 0o644)  # mkstemp crea el archivo con 0600
+        os.replace(tmp_path, dest_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 def save_excel_file(project_name: str, file: UploadFile):
     path = PROJECTS_DIR / project_name
     if not path.exists():
         return False, "Project does not exist."
 
     try:
-        dest_file = path / "input.xlsx"
-        with open(dest_file, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        _write_upload_atomically(file, path / "input.xlsx")
 
         # Log the upload
-        log_path = path / "log.csv"
-        with open(log_path, "a") as log:
-            log.write(f"{datetime.now().isoformat()},uploaded,{file.filename}\n")
+        _append_log_line(path / "log.csv", f"{datetime.now().isoformat()},uploaded,{file.filename}\n")
 
         return True, "Excel file uploaded and logged successfully."
     except Exception as e:
@@ -70,14 +146,20 @@ def save_excel_file(project_name: str, file: UploadFile):
 
 
 def load_excel_sheet(project_name: str, sheet_name: str) -> pd.DataFrame:
-    file_path = PROJECTS_DIR / project_name / "input.xlsx"
+    # Import diferido: el parser importa project_excel_path de este módulo
+    from app.services.parsing.parser import load_workbook
+
+    file_path = project_excel_path(project_name)
     print(f"[DEBUG] Buscando archivo: {file_path}")  # Reemplazar por logger.debug si prefieres
 
     if not file_path.exists():
         raise FileNotFoundError(f"No se encontró el archivo: {file_path}")
     
     try:
-        return pd.read_excel(file_path, sheet_name=sheet_name)
+        # Libro parseado una sola vez por versión del archivo (mtime + tamaño):
+        # leer varias hojas del mismo input.xlsx no vuelve a descomprimirlo.
+        # Copia: los DataFrames en caché se comparten entre peticiones.
+        return load_workbook(file_path).parse(sheet_name).copy()
     except Exception as e:
         raise RuntimeError(f"Error al cargar hoja '{sheet_name}' del archivo: {e}")
 
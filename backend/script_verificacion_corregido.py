@@ -9,48 +9,186 @@ CORRECCIONES APLICADAS:
 - Carga directa de archivos sin dependencias complejas
 """
 
+import numpy as np
 import pandas as pd
 import yaml
 import json
 import os
 import sys
+import bisect
+import copy
+import pickle
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from pathlib import Path
 
+# libyaml (extensión C) si está disponible; si no, el loader en Python puro
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+# Numba opcional: kernel compilado para proyectos con muchos strings
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Por debajo de este número de strings NumPy es suficiente (la compilación JIT no compensa)
+NUMBA_MIN_STRINGS = 5000
+
+# python-calamine (lector en Rust) es mucho más rápido que openpyxl; opcional
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None  # pandas usa openpyxl por defecto
+
+# Únicas columnas de dc_string_circuits que usa la verificación
+STRING_COLUMNS = ["string_id", "length_pos_m", "length_neg_m"]
+STRING_DTYPES = {"length_pos_m": "float64", "length_neg_m": "float64"}
+
+# VERIF_VERBOSE=0 omite el reporte paso a paso de cada string (ejecuciones en lote / CI)
+VERBOSE = os.environ.get("VERIF_VERBOSE", "1") == "1"
+
+# VERIF_DEBUG=1 muestra la traza completa de los errores (por defecto, una sola línea)
+DEBUG = os.environ.get("VERIF_DEBUG", "0") == "1"
+
+# Errores esperables: archivo ausente, clave faltante en YAML/Excel, valor o YAML inválido
+ERRORES_ESPERADOS = (OSError, KeyError, ValueError, yaml.YAMLError)
+
 # Agregar el directorio del proyecto al path
 sys.path.append('backend')
 
-def verificar_factores_proyecto(project_name: str):
-    """🔍 Función auxiliar para mostrar todos los factores de corrección disponibles"""
+@dataclass(frozen=True)
+class ProjectPaths:
+    """📁 Rutas de un proyecto resueltas una vez por ejecución, con su existencia ya comprobada"""
+    project_name: str
+    excel: Path
+    normativa: Path
+    dc_strings: Path
+    excel_exists: bool
+    normativa_exists: bool
+    dc_strings_exists: bool
+
+@dataclass(slots=True, frozen=True)
+class StringResult:
+    """📐 Resultado de la verificación de un string (valores ya como escalares de Python)"""
+    string_id: str
+    length_total: float
+    i_nominal: float
+    i_adjusted: float
+    resistivity: float
+    max_voltage_drop_v: float
+    s_teorica_mm2: float
+
+@lru_cache(maxsize=None)
+def rutas_proyecto(project_name: str) -> ProjectPaths:
+    """Rutas del proyecto (relativas al directorio de trabajo, como el resto del script)"""
+    root = Path("projects") / project_name
+    excel = root / "input.xlsx"
+    normativa = root / "normativa.yaml"
+    dc_strings = root / "normativas" / "dc_strings.yaml"
+    return ProjectPaths(
+        project_name=project_name,
+        excel=excel,
+        normativa=normativa,
+        dc_strings=dc_strings,
+        excel_exists=excel.exists(),
+        normativa_exists=normativa.exists(),
+        dc_strings_exists=dc_strings.exists(),
+    )
+
+# Caché de YAML parseados: ruta -> (mtime_ns, tamaño, datos)
+_YAML_CACHE_MAX = 100
+_yaml_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+def _reportar_error(contexto: str, e: Exception) -> None:
+    """Error en una línea; la traza completa (que lee el código fuente de disco) solo con VERIF_DEBUG=1"""
+    print(f"❌ {contexto}: [ERR] {type(e).__name__}: {e}")
+    if DEBUG:
+        import traceback
+        traceback.print_exc()
+
+def _emitir(lines: list) -> None:
+    """Escribe un bloque de líneas con una sola llamada a stdout (en vez de un print por línea)"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+def load_yaml_cached(path: str):
+    """📄 Carga un YAML una sola vez mientras el archivo no cambie (mtime + tamaño)"""
+    stat = os.stat(path)
+    entry = _yaml_cache.get(path)
+    if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        _yaml_cache.move_to_end(path)
+        return copy.deepcopy(entry[2])
+    
+    # Sidecar en disco (otra ejecución ya parseó esta versión del archivo)
+    data = _leer_sidecar_yaml(path, stat)
+    if data is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=YamlSafeLoader)
+        _escribir_sidecar_yaml(path, stat, data)
+    
+    _yaml_cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+    _yaml_cache.move_to_end(path)
+    if len(_yaml_cache) > _YAML_CACHE_MAX:
+        _yaml_cache.popitem(last=False)
+    # Copia profunda: los llamadores pueden modificar el resultado sin tocar la caché
+    return copy.deepcopy(data)
+
+def _leer_sidecar_yaml(path: str, stat: os.stat_result):
+    """Lee el pickle junto al YAML (archivo.yaml.cache.pkl) si corresponde a esta versión"""
+    cache_path = f"{path}.cache.pkl"
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ Ignorando caché ilegible {cache_path}: {e}")
+        return None
+    
+    if cached.get('mtime_ns') != stat.st_mtime_ns or cached.get('size') != stat.st_size:
+        return None
+    return cached['data']
+
+def _escribir_sidecar_yaml(path: str, stat: os.stat_result, data) -> None:
+    """Guarda el YAML parseado de forma atómica (temporal + os.replace); los fallos no son críticos"""
+    cache_path = f"{path}.cache.pkl"
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".", suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'data': data}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"⚠️ No se pudo escribir la caché {cache_path}: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def verificar_factores_proyecto(project_name: str, normativa_cargada: dict = None):
+    """🔍 Función auxiliar para mostrar todos los factores de corrección disponibles (devuelve la normativa cargada)"""
     print(f"🔍 === FACTORES DE CORRECCIÓN DISPONIBLES: {project_name} ===")
     
     try:
-        project_normative_file = f"projects/{project_name}/normativa.yaml"
-        
-        if os.path.exists(project_normative_file):
-            with open(project_normative_file, 'r', encoding='utf-8') as f:
-                normativa_data = yaml.safe_load(f)
-            normativa_config = normativa_data['normativa']
+        if normativa_cargada is None:
+            normativa_cargada = cargar_normativa(project_name)
+        normativa_config = normativa_cargada['config']
+        if normativa_cargada['origen'] == 'proyecto':
             print(f"📋 Usando normativa del proyecto")
         else:
-            with open('configs/normativas.yaml', 'r', encoding='utf-8') as f:
-                normativas_config = yaml.safe_load(f)
-            normativa_config = normativas_config['normativas']['IEC']
-            print(f"📋 Usando normativa base IEC")
+            print(f"📋 Usando normativa base {normativa_cargada['nombre']}")
         
-        # Mostrar factores de temperatura - CORREGIDO
+        # Mostrar factores de temperatura - CORREGIDO (orden precalculado)
         print(f"\n🌡️ FACTORES DE TEMPERATURA:")
-        temp_values = normativa_config.get('temperature_correction', {}).get('values', {})
-        
-        temp_items = []
-        for temp_key, factor in temp_values.items():
-            try:
-                temp_num = int(str(temp_key))
-                temp_items.append((temp_num, temp_key, factor))
-            except (ValueError, TypeError):
-                temp_items.append((999, temp_key, factor))
-        
-        temp_items.sort()
-        for _, temp_key, factor in temp_items:
+        for temp_key, factor in normativa_cargada['tablas']['temperatura']['orden']:
             print(f"  {temp_key}°C: {factor}")
         
         # Mostrar factores de agrupamiento
@@ -65,66 +203,134 @@ def verificar_factores_proyecto(project_name: str):
                         for circuits, factor in layout_data['values'].items():
                             print(f"      {circuits} cables: {factor}")
         
+        return normativa_cargada
+        
     except Exception as e:
         print(f"❌ Error: {e}")
+        return None
+
+def _congelar(valor):
+    """Vista recursiva de solo lectura de los datos del YAML (se comparte sin copiar)"""
+    if isinstance(valor, dict):
+        return MappingProxyType({k: _congelar(v) for k, v in valor.items()})
+    if isinstance(valor, list):
+        return tuple(_congelar(v) for v in valor)
+    return valor
+
+# Índice de paneles por versión de panel_database.yaml: ruta -> ((mtime_ns, tamaño), índice)
+_panel_index_cache = {}
+
+def _indice_paneles(path: str = 'configs/panel_database.yaml') -> dict:
+    """🗂️ Construye (una vez por versión del YAML) los índices de búsqueda de paneles"""
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _panel_index_cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    # Paneles congelados: se devuelven tal cual a los llamadores, sin copias defensivas
+    panels = _congelar(load_yaml_cached(path).get('panels', {}))
+    keys = list(panels.keys())
+    
+    # Todas las claves en un solo string: str.find (en C) localiza la primera que contiene el modelo
+    starts = []
+    offset = 0
+    for panel_key in keys:
+        starts.append(offset)
+        offset += len(panel_key) + 1
+    
+    # Modelo sin marca (último token) -> primera clave que lo tiene
+    by_model_only = {}
+    for panel_key in keys:
+        model_only = panel_key.split()[-1] if ' ' in panel_key else panel_key
+        by_model_only.setdefault(model_only, panel_key)
+    
+    index = {
+        'panels': panels,
+        'keys': keys,
+        'haystack': '\0'.join(keys),
+        'starts': starts,
+        'by_model_only': by_model_only,
+        'resueltos': {},  # panel_model -> (modo, clave), memo de búsquedas ya hechas
+    }
+    _panel_index_cache[path] = (version, index)
+    return index
+
+def _buscar_panel_con_marca(index: dict, panel_model: str):
+    """Primera clave (en orden del YAML) que contiene `panel_model`, o None"""
+    if '\0' in panel_model:
+        return None
+    pos = index['haystack'].find(panel_model)
+    if pos < 0:
+        return None
+    return index['keys'][bisect.bisect_right(index['starts'], pos) - 1]
+
+def _resolver_panel(index: dict, panel_model: str) -> tuple:
+    """
+    (modo, clave) del panel para `panel_model`: 'exacto', 'con marca', 'sin marca' o (None, None).
+    
+    El resultado se memoriza en el índice, así que repetir un modelo es una sola consulta de dict.
+    """
+    resueltos = index['resueltos']
+    if panel_model in resueltos:
+        return resueltos[panel_model]
+    
+    if panel_model in index['panels']:
+        resultado = ('exacto', panel_model)
+    else:
+        panel_key = _buscar_panel_con_marca(index, panel_model)
+        if panel_key is not None:
+            resultado = ('con marca', panel_key)
+        else:
+            panel_key = index['by_model_only'].get(panel_model)
+            resultado = ('sin marca', panel_key) if panel_key is not None else (None, None)
+    
+    resueltos[panel_model] = resultado
+    return resultado
 
 def cargar_panel_inteligente(panel_model: str):
     """🔧 CORRECCIÓN: Busca paneles de forma inteligente (con y sin marca)"""
     try:
-        with open('configs/panel_database.yaml', 'r', encoding='utf-8') as f:
-            panel_db = yaml.safe_load(f)
-        
-        panels = panel_db.get('panels', {})
+        index = _indice_paneles()
+        panels = index['panels']
         
         print(f"🔍 Buscando panel: '{panel_model}'")
         
-        # 1. Búsqueda exacta
-        if panel_model in panels:
-            panel_data = panels[panel_model]
-            print(f"✅ Panel encontrado (exacto): '{panel_model}'")
+        # 1-3. Búsqueda exacta, con marca (la clave contiene el modelo) o sin marca
+        modo, panel_key = _resolver_panel(index, panel_model)
+        if modo is not None:
+            panel_data = panels[panel_key]
+            print(f"✅ Panel encontrado ({modo}): '{panel_key}'")
+            if modo != 'exacto':
+                print(f"   Buscado: '{panel_model}'")
             print(f"   ISC: {panel_data['electrical_stc']['isc']}A")
             print(f"   Potencia: {panel_data['power_stc']}W")
             return panel_data
         
-        # 2. Búsqueda inteligente - con marca
-        for panel_key in panels.keys():
-            if panel_model in panel_key or panel_key.endswith(panel_model):
-                panel_data = panels[panel_key]
-                print(f"✅ Panel encontrado (con marca): '{panel_key}'")
-                print(f"   Buscado: '{panel_model}'")
-                print(f"   ISC: {panel_data['electrical_stc']['isc']}A")
-                print(f"   Potencia: {panel_data['power_stc']}W")
-                return panel_data
-        
-        # 3. Búsqueda inteligente - sin marca
-        for panel_key in panels.keys():
-            # Extraer modelo sin marca
-            model_only = panel_key.split()[-1] if ' ' in panel_key else panel_key
-            if model_only == panel_model:
-                panel_data = panels[panel_key]
-                print(f"✅ Panel encontrado (sin marca): '{panel_key}'")
-                print(f"   Buscado: '{panel_model}'")
-                print(f"   ISC: {panel_data['electrical_stc']['isc']}A")
-                print(f"   Potencia: {panel_data['power_stc']}W")
-                return panel_data
-        
         # 4. No encontrado - mostrar opciones
         print(f"⚠️ Panel '{panel_model}' no encontrado")
         print(f"📋 Paneles disponibles:")
-        for i, panel_key in enumerate(panels.keys(), 1):
+        for i, panel_key in enumerate(index['keys'], 1):
             print(f"  {i}. {panel_key}")
         
         # Usar panel personalizado como fallback
         if 'Panel Personalizado' in panels:
             print(f"🔧 Usando 'Panel Personalizado' como fallback")
-            fallback_data = panels['Panel Personalizado'].copy()
+            fallback_data = panels['Panel Personalizado']
             
             # 🚨 CORRECCIÓN CRÍTICA: Si encontramos TSM-720, usar ISC real
             if 'TSM-720' in panel_model:
                 print(f"🔥 PANEL TSM-720 DETECTADO - Usando ISC real!")
-                fallback_data['electrical_stc']['isc'] = 18.44  # ISC real del .PAN
-                fallback_data['electrical_stc']['voc'] = 49.20  # VOC real del .PAN
-                fallback_data['power_stc'] = 720  # Potencia real
+                # Nueva vista con los valores sustituidos; el panel base compartido no se modifica
+                fallback_data = MappingProxyType({
+                    **fallback_data,
+                    'electrical_stc': MappingProxyType({
+                        **fallback_data['electrical_stc'],
+                        'isc': 18.44,  # ISC real del .PAN
+                        'voc': 49.20,  # VOC real del .PAN
+                    }),
+                    'power_stc': 720,  # Potencia real
+                })
                 print(f"🔥 ISC corregido a: {fallback_data['electrical_stc']['isc']}A")
             
             return fallback_data
@@ -135,8 +341,133 @@ def cargar_panel_inteligente(panel_model: str):
         print(f"❌ Error cargando panel: {e}")
         raise
 
-def calcular_factores_correccion_reales(i_nominal: float, config: dict) -> float:
-    """🔧 Calcula los factores de corrección usando la configuración real del proyecto"""
+def _mas_cercano(tabla: dict, objetivo: float) -> tuple:
+    """Par (clave, factor) con la clave más cercana a `objetivo` (búsqueda binaria; empate → el menor)"""
+    claves = tabla['claves']
+    idx = bisect.bisect_left(claves, objetivo)
+    if idx == len(claves):
+        idx -= 1
+    elif idx > 0 and abs(claves[idx - 1] - objetivo) <= abs(claves[idx] - objetivo):
+        idx -= 1
+    # Primera aparición si la clave está repetida
+    idx = bisect.bisect_left(claves, claves[idx])
+    return claves[idx], tabla['factores'][idx]
+
+def _tabla_numerica(values: dict, excluir_rangos: bool = False) -> dict:
+    """Claves enteras ordenadas y sus factores, listas para búsqueda binaria"""
+    pares = []
+    for key, factor in values.items():
+        try:
+            if excluir_rangos and '+' in str(key):
+                continue
+            pares.append((int(str(key)), float(factor)))
+        except (ValueError, TypeError):
+            continue
+    pares.sort()
+    return {'claves': [clave for clave, _ in pares], 'factores': [factor for _, factor in pares]}
+
+def _tabla_temperatura(temp_values: dict) -> dict:
+    """Tabla de factores de temperatura: exactos por str(clave), cercanos y orden de visualización"""
+    exactos = {}
+    for temp_key, factor in temp_values.items():
+        exactos.setdefault(str(temp_key), (temp_key, factor))
+    
+    orden = []
+    for temp_key, factor in temp_values.items():
+        try:
+            orden.append((int(str(temp_key)), temp_key, factor))
+        except (ValueError, TypeError):
+            orden.append((999, temp_key, factor))
+    orden.sort()
+    
+    tabla = _tabla_numerica(temp_values)
+    tabla['exactos'] = exactos
+    tabla['orden'] = [(temp_key, factor) for _, temp_key, factor in orden]
+    return tabla
+
+def _tabla_agrupamiento(group_values: dict) -> dict:
+    """Tabla de factores de agrupamiento: exactos, rangos "N+" (en orden del YAML) y cercanos"""
+    rangos = []
+    for key, value in group_values.items():
+        if '+' in str(key):
+            try:
+                rangos.append((int(str(key).replace('+', '')), key, value))
+            except (ValueError, TypeError):
+                continue
+    
+    tabla = _tabla_numerica(group_values, excluir_rangos=True)
+    tabla['valores'] = group_values
+    tabla['rangos'] = rangos
+    return tabla
+
+# Tablas de factores por versión del YAML de normativa: (ruta, sección) -> ((mtime_ns, tamaño), tablas)
+_factor_tables_cache = {}
+
+def _tablas_factores(path: str, seccion: tuple) -> dict:
+    """
+    🗂️ Normaliza (una vez por versión del YAML) las tablas de temperatura y agrupamiento.
+    
+    `seccion` es la ruta de claves hasta la normativa dentro del archivo, p. ej.
+    ('normativa',) o ('normativas', 'IEC'). Las búsquedas posteriores son
+    consultas de dict y bisect sobre listas ya ordenadas.
+    """
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cache_key = (path, seccion)
+    cached = _factor_tables_cache.get(cache_key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    normativa_config = load_yaml_cached(path)
+    for clave in seccion:
+        normativa_config = normativa_config[clave]
+    
+    grupos = {}
+    for method, method_data in normativa_config.get('grouping_factors', {}).items():
+        if not isinstance(method_data, dict):
+            grupos[method] = {'layouts': {}, 'values': None}
+            continue
+        grupos[method] = {
+            'layouts': {layout: _tabla_agrupamiento(layout_data['values'])
+                        for layout, layout_data in method_data.items()
+                        if isinstance(layout_data, dict) and 'values' in layout_data},
+            'values': _tabla_agrupamiento(method_data['values']) if 'values' in method_data else None,
+        }
+    
+    tablas = {
+        'temperatura': _tabla_temperatura(normativa_config.get('temperature_correction', {}).get('values', {})),
+        'agrupamiento': grupos,
+    }
+    _factor_tables_cache[cache_key] = (version, tablas)
+    return tablas
+
+def cargar_normativa(project_name: str, normativa: str = "IEC") -> dict:
+    """
+    📋 Normativa aplicable al proyecto: la del proyecto si existe, si no la base `normativa`.
+    
+    Devuelve {'origen', 'nombre', 'config', 'tablas'}; se carga una vez por ejecución
+    y viaja en config['_normativa'] para no releer el YAML en cada función.
+    """
+    paths = rutas_proyecto(project_name)
+    if paths.normativa_exists:
+        path, seccion, origen = str(paths.normativa), ('normativa',), 'proyecto'
+    else:
+        path, seccion, origen = 'configs/normativas.yaml', ('normativas', normativa), 'base'
+    
+    normativa_config = load_yaml_cached(path)
+    for clave in seccion:
+        normativa_config = normativa_config[clave]
+    
+    return {
+        'origen': origen,
+        'nombre': normativa,
+        'config': normativa_config,
+        'tablas': _tablas_factores(path, seccion),
+    }
+
+def calcular_factor_combinado(config: dict) -> float:
+    """🔧 Factor combinado (temperatura × agrupamiento) según la configuración real del proyecto"""
+    lines = []
     try:
         project_name = config.get('project_name', 'colorado-v1')
         ambient_temp = config['correction_factors']['ambient_temperature']['current_ambient']
@@ -144,160 +475,128 @@ def calcular_factores_correccion_reales(i_nominal: float, config: dict) -> float
         method = config['installation']['method']
         layout = config['installation']['layout']
         
-        print(f"🔧 Parámetros de corrección:")
-        print(f"🔧   Temperatura ambiente: {ambient_temp}°C")
-        print(f"🔧   Número de circuitos: {num_circuits}")
-        print(f"🔧   Método instalación: {method}")
-        print(f"🔧   Layout: {layout}")
-        
-        # Cargar factores de corrección del proyecto
-        project_normative_file = f"projects/{project_name}/normativa.yaml"
-        
-        if os.path.exists(project_normative_file):
-            with open(project_normative_file, 'r', encoding='utf-8') as f:
-                normativa_data = yaml.safe_load(f)
-            normativa_config = normativa_data['normativa']
-            print(f"🔧 Usando normativa del proyecto")
+        lines.append(f"🔧 Parámetros de corrección:")
+        lines.append(f"🔧   Temperatura ambiente: {ambient_temp}°C")
+        lines.append(f"🔧   Número de circuitos: {num_circuits}")
+        lines.append(f"🔧   Método instalación: {method}")
+        lines.append(f"🔧   Layout: {layout}")
+        
+        # Factores de corrección del proyecto (normativa ya cargada en la configuración)
+        normativa_cargada = config.get('_normativa') or cargar_normativa(project_name)
+        tablas = normativa_cargada['tablas']
+        if normativa_cargada['origen'] == 'proyecto':
+            lines.append(f"🔧 Usando normativa del proyecto")
         else:
-            with open('configs/normativas.yaml', 'r', encoding='utf-8') as f:
-                normativas_config = yaml.safe_load(f)
-            normativa_config = normativas_config['normativas']['IEC']
-            print(f"🔧 Usando normativa base IEC")
+            lines.append(f"🔧 Usando normativa base {normativa_cargada['nombre']}")
         
         # Factor de temperatura - CORREGIDO
         temp_factor = 1.0
-        temp_values = normativa_config.get('temperature_correction', {}).get('values', {})
-        
-        # Buscar temperatura de forma segura
-        temp_key_found = None
-        for temp_key in temp_values.keys():
-            if str(temp_key) == str(ambient_temp):
-                temp_key_found = temp_key
-                break
-        
-        if temp_key_found is not None:
-            temp_factor = float(temp_values[temp_key_found])
-            print(f"🔧   Factor temperatura ({ambient_temp}°C): {temp_factor}")
-        else:
+        tabla_temp = tablas['temperatura']
+        exacto = tabla_temp['exactos'].get(str(ambient_temp))
+        
+        if exacto is not None:
+            temp_factor = float(exacto[1])
+            lines.append(f"🔧   Factor temperatura ({ambient_temp}°C): {temp_factor}")
+        elif tabla_temp['claves']:
             # Buscar el más cercano
-            available_temps = []
-            for temp_key, factor in temp_values.items():
-                try:
-                    temp_num = int(str(temp_key))
-                    available_temps.append((temp_num, float(factor)))
-                except (ValueError, TypeError):
-                    continue
-            
-            if available_temps:
-                available_temps.sort()
-                closest = min(available_temps, key=lambda x: abs(x[0] - ambient_temp))
-                temp_factor = closest[1]
-                print(f"🔧   Factor temperatura (aproximado {closest[0]}°C): {temp_factor}")
+            closest = _mas_cercano(tabla_temp, ambient_temp)
+            temp_factor = closest[1]
+            lines.append(f"🔧   Factor temperatura (aproximado {closest[0]}°C): {temp_factor}")
         
         # Factor de agrupamiento - MEJORADO
         group_factor = 1.0
-        grouping_factors = normativa_config.get('grouping_factors', {})
+        grouping_factors = tablas['agrupamiento']
         
         if method in grouping_factors:
             method_data = grouping_factors[method]
             
             # Buscar valores de agrupamiento
-            if layout in method_data and 'values' in method_data[layout]:
-                group_values = method_data[layout]['values']
-            elif 'values' in method_data:
-                group_values = method_data['values']
-            else:
-                # Si no hay values directamente, buscar en sublayouts
-                group_values = {}
-                for sub_layout, sub_data in method_data.items():
-                    if isinstance(sub_data, dict) and 'values' in sub_data:
-                        group_values = sub_data['values']
-                        print(f"🔧   Usando layout: {sub_layout}")
-                        break
+            tabla_grupo = method_data['layouts'].get(layout) or method_data['values']
+            if tabla_grupo is None and method_data['layouts']:
+                # Si no hay values directamente, usar el primer sublayout
+                sub_layout, tabla_grupo = next(iter(method_data['layouts'].items()))
+                lines.append(f"🔧   Usando layout: {sub_layout}")
             
-            if group_values:
+            if tabla_grupo is not None and tabla_grupo['valores']:
+                group_values = tabla_grupo['valores']
                 # Buscar factor para número de circuitos
                 str_circuits = str(num_circuits)
                 if str_circuits in group_values:
                     group_factor = float(group_values[str_circuits])
-                    print(f"🔧   Factor agrupamiento ({num_circuits} cables): {group_factor}")
+                    lines.append(f"🔧   Factor agrupamiento ({num_circuits} cables): {group_factor}")
                 else:
                     # Buscar rangos como "10+" o "5+"
-                    for key, value in group_values.items():
-                        if '+' in str(key):
-                            try:
-                                threshold = int(str(key).replace('+', ''))
-                                if num_circuits >= threshold:
-                                    group_factor = float(value)
-                                    print(f"🔧   Factor agrupamiento ({key} cables): {group_factor}")
-                                    break
-                            except (ValueError, TypeError):
-                                continue
+                    for threshold, key, value in tabla_grupo['rangos']:
+                        if num_circuits >= threshold:
+                            group_factor = float(value)
+                            lines.append(f"🔧   Factor agrupamiento ({key} cables): {group_factor}")
+                            break
                     else:
                         # Usar el más cercano
-                        available_circuits = []
-                        for circuits_key, factor in group_values.items():
-                            try:
-                                if '+' not in str(circuits_key):
-                                    circuits_num = int(str(circuits_key))
-                                    available_circuits.append((circuits_num, float(factor)))
-                            except (ValueError, TypeError):
-                                continue
-                        
-                        if available_circuits:
-                            closest = min(available_circuits, key=lambda x: abs(x[0] - num_circuits))
+                        if tabla_grupo['claves']:
+                            closest = _mas_cercano(tabla_grupo, num_circuits)
                             group_factor = closest[1]
-                            print(f"🔧   Factor agrupamiento (aproximado {closest[0]} cables): {group_factor}")
+                            lines.append(f"🔧   Factor agrupamiento (aproximado {closest[0]} cables): {group_factor}")
             else:
-                print(f"🔧   No se encontraron valores de agrupamiento para {method}")
+                lines.append(f"🔧   No se encontraron valores de agrupamiento para {method}")
         
-        # Aplicar factores de corrección
+        # Combinar factores de corrección
         combined_factor = temp_factor * group_factor
-        i_adjusted = i_nominal / combined_factor
-        
-        print(f"🔧   Factor combinado: {temp_factor} × {group_factor} = {combined_factor}")
-        print(f"🔧   I_adjusted = {i_nominal} ÷ {combined_factor} = {i_adjusted:.2f}A")
+        lines.append(f"🔧   Factor combinado: {temp_factor} × {group_factor} = {combined_factor}")
         
-        return i_adjusted
+        return combined_factor
         
     except Exception as e:
-        print(f"🔧 ❌ Error calculando factores reales: {e}")
-        print(f"🔧 Usando factor estimado de seguridad")
-        return i_nominal / 1.25
+        lines.append(f"🔧 ❌ Error calculando factores reales: {e}")
+        lines.append(f"🔧 Usando factor estimado de seguridad")
+        return 1.25
+    finally:
+        _emitir(lines)
 
-def verificar_configuracion_segura(project_name: str, normativa: str = "IEC"):
-    """🔍 Verificación de configuración con manejo seguro de errores"""
+def calcular_factores_correccion_reales(i_nominal: float, config: dict) -> float:
+    """🔧 Calcula los factores de corrección usando la configuración real del proyecto"""
+    combined_factor = calcular_factor_combinado(config)
+    i_adjusted = i_nominal / combined_factor
+    print(f"🔧   I_adjusted = {i_nominal} ÷ {combined_factor} = {i_adjusted:.2f}A")
+    return i_adjusted
+
+def verificar_configuracion_segura(project_name: str, normativa: str = "IEC", xls: pd.ExcelFile = None,
+                                   normativa_cargada: dict = None):
+    """
+    🔍 Verificación de configuración con manejo seguro de errores
+    
+    `xls`: libro ya abierto, opcional. `normativa_cargada`: resultado previo de
+    cargar_normativa(), opcional; se guarda en config['_normativa'].
+    """
     print("🔍 === VERIFICACIÓN DE CONFIGURACIÓN SEGURA ===")
     
+    lines = []
     try:
         # 1. Cargar información del proyecto directamente del Excel
-        excel_path = f"projects/{project_name}/input.xlsx"
+        paths = rutas_proyecto(project_name)
         
-        if not os.path.exists(excel_path):
-            raise FileNotFoundError(f"Excel no encontrado: {excel_path}")
+        if not paths.excel_exists:
+            raise FileNotFoundError(f"Excel no encontrado: {paths.excel}")
         
-        df_info = pd.read_excel(excel_path, sheet_name='project_info')
-        project_info = {}
-        for _, row in df_info.iterrows():
-            project_info[row['Campo']] = row['Valor']
+        if xls is not None:
+            df_info = xls.parse('project_info')
+        else:
+            df_info = pd.read_excel(paths.excel, sheet_name='project_info', engine=EXCEL_ENGINE)
+        project_info = df_info.set_index('Campo')['Valor'].to_dict()
         
         panel_model = project_info.get('panel_model', 'Panel Personalizado')
-        print(f"📋 Proyecto: {project_name}")
-        print(f"📋 Panel del Excel: {panel_model}")
+        _emitir([f"📋 Proyecto: {project_name}", f"📋 Panel del Excel: {panel_model}"])
         
         # 2. Cargar panel con búsqueda inteligente
         panel_data = cargar_panel_inteligente(panel_model)
         
         # 3. Verificar overrides del proyecto
-        dc_strings_yaml_path = f"projects/{project_name}/normativas/dc_strings.yaml"
-        overrides_exist = os.path.exists(dc_strings_yaml_path)
-        print(f"🔧 Overrides de proyecto: {'SÍ' if overrides_exist else 'NO'}")
+        lines = [f"🔧 Overrides de proyecto: {'SÍ' if paths.dc_strings_exists else 'NO'}"]
         
         overrides = {}
-        if overrides_exist:
-            with open(dc_strings_yaml_path, 'r', encoding='utf-8') as f:
-                overrides = yaml.safe_load(f)
-            print(f"🔧 Secciones con override: {list(overrides.keys())}")
+        if paths.dc_strings_exists:
+            overrides = load_yaml_cached(str(paths.dc_strings))
+            lines.append(f"🔧 Secciones con override: {list(overrides.keys())}")
         
         # 4. Construir configuración manualmente
         config = {
@@ -326,103 +625,179 @@ def verificar_configuracion_segura(project_name: str, normativa: str = "IEC"):
                 'reference_voltage': overrides.get('voltage_drop', {}).get('reference_voltage', 1500)
             }
         }
+        config['_normativa'] = normativa_cargada or cargar_normativa(project_name, normativa)
         
-        print(f"\n🎯 === CONFIGURACIÓN FINAL ===")
-        print(f"🎯 Panel ISC: {config['isc_ref']}A")
-        print(f"🎯 ISC Correction Factor: {config['isc_correction']}")
         i_nominal_calc = config['isc_ref'] * config['isc_correction']
-        print(f"🎯 I_nominal = {config['isc_ref']} × {config['isc_correction']} = {i_nominal_calc}A")
-        print(f"🎯 Parallel strings: {config['number_of_parallel_strings']}")
-        print(f"🎯 Max voltage drop: {config['voltage_drop']['max_percentage']}%")
-        print(f"🎯 Reference voltage: {config['voltage_drop']['reference_voltage']}V")
-        print(f"🎯 Cable material: {config['cable']['material']}")
-        print(f"🎯 Installation method: {config['installation']['method']}")
-        print(f"🎯 Ambient temperature: {config['correction_factors']['ambient_temperature']['current_ambient']}°C")
+        lines += [
+            f"\n🎯 === CONFIGURACIÓN FINAL ===",
+            f"🎯 Panel ISC: {config['isc_ref']}A",
+            f"🎯 ISC Correction Factor: {config['isc_correction']}",
+            f"🎯 I_nominal = {config['isc_ref']} × {config['isc_correction']} = {i_nominal_calc}A",
+            f"🎯 Parallel strings: {config['number_of_parallel_strings']}",
+            f"🎯 Max voltage drop: {config['voltage_drop']['max_percentage']}%",
+            f"🎯 Reference voltage: {config['voltage_drop']['reference_voltage']}V",
+            f"🎯 Cable material: {config['cable']['material']}",
+            f"🎯 Installation method: {config['installation']['method']}",
+            f"🎯 Ambient temperature: {config['correction_factors']['ambient_temperature']['current_ambient']}°C",
+        ]
+        _emitir(lines)
         
         return config, project_info
         
     except Exception as e:
+        _emitir(lines)
         print(f"❌ Error verificando configuración: {e}")
         raise
 
+@lru_cache(maxsize=64)
 def calcular_resistividad_cobre(temp_celsius: float) -> float:
-    """Calcular resistividad del cobre a temperatura específica"""
+    """Calcular resistividad del cobre a temperatura específica (memorizada por temperatura)"""
     rho_20 = 0.01724  # Ω·mm²/m a 20°C
     alpha = 0.00393   # 1/°C
     return rho_20 * (1 + alpha * (temp_celsius - 20))
 
-def calcular_string_manual_seguro(string_data: dict, config: dict):
-    """🧮 Cálculo manual de string con manejo seguro de errores"""
-    print(f"\n🧮 === CÁLCULO MANUAL STRING {string_data['string_id']} ===")
+def _secciones_numpy(lengths_pos, lengths_neg, resistivity, i_adjusted, max_voltage_drop_v):
+    """Longitud total y sección teórica de todos los strings (NumPy)"""
+    length_total = lengths_pos + lengths_neg
+    s_teorica_mm2 = (2 * resistivity * length_total * i_adjusted) / max_voltage_drop_v
+    return length_total, s_teorica_mm2
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _secciones_kernel(lengths_pos, lengths_neg, resistivity, i_adjusted, max_voltage_drop_v,
+                          out_total, out_s):
+        for i in prange(lengths_pos.shape[0]):
+            out_total[i] = lengths_pos[i] + lengths_neg[i]
+            out_s[i] = (2 * resistivity * out_total[i] * i_adjusted) / max_voltage_drop_v
+
+def calcular_secciones(lengths_pos: np.ndarray, lengths_neg: np.ndarray, resistivity: float,
+                       i_adjusted: float, max_voltage_drop_v: float) -> tuple:
+    """(length_total, s_teorica_mm2) por string; usa el kernel Numba en lotes grandes"""
+    if not NUMBA_AVAILABLE or lengths_pos.shape[0] < NUMBA_MIN_STRINGS:
+        return _secciones_numpy(lengths_pos, lengths_neg, resistivity, i_adjusted, max_voltage_drop_v)
     
+    out_total = np.empty_like(lengths_pos)
+    out_s = np.empty_like(lengths_pos)
+    _secciones_kernel(lengths_pos, lengths_neg, float(resistivity), float(i_adjusted),
+                      float(max_voltage_drop_v), out_total, out_s)
+    return out_total, out_s
+
+def calcular_strings_vectorizado(df_strings: pd.DataFrame, config: dict) -> dict:
+    """🧮 Calcula todos los strings de una vez (NumPy): longitudes y sección teórica por string"""
     try:
-        # Datos del string
-        string_id = string_data['string_id']
-        length_pos = float(string_data['length_pos_m'])
-        length_neg = float(string_data['length_neg_m'])
-        length_total = length_pos + length_neg
-        
-        print(f"📏 Longitud total: {length_total}m")
+        # Datos de los strings (columnas completas, sin iterar filas)
+        string_ids = df_strings['string_id'].to_numpy()
+        lengths_pos = df_strings['length_pos_m'].to_numpy(dtype=np.float64)
+        lengths_neg = df_strings['length_neg_m'].to_numpy(dtype=np.float64)
         
         # Paso 1: Corriente nominal
-        isc_ref = config['isc_ref']
-        isc_correction = config['isc_correction']
-        i_nominal = isc_ref * isc_correction
-        
-        print(f"\n⚡ Paso 1 - Corriente nominal:")
-        print(f"⚡ I_nominal = {isc_ref} × {isc_correction} = {i_nominal}A")
+        i_nominal = config['isc_ref'] * config['isc_correction']
         
-        # Paso 2: Factores de corrección REALES
-        i_adjusted = calcular_factores_correccion_reales(i_nominal, config)
+        # Paso 2: Factores de corrección REALES (el factor es único por proyecto)
+        combined_factor = config.get('_combined_factor')
+        if combined_factor is None:
+            combined_factor = calcular_factor_combinado(config)
+        i_adjusted = i_nominal / combined_factor
         
         # Paso 3: Resistividad
         temp_operating = config['correction_factors']['ambient_temperature']['current_ambient']
         resistivity = calcular_resistividad_cobre(temp_operating)
         
-        print(f"\n🔌 Paso 3 - Resistividad:")
-        print(f"🔌 Resistividad cobre a {temp_operating}°C: {resistivity:.6f} Ω·mm²/m")
-        
         # Paso 4: Caída de tensión
         max_percentage = config['voltage_drop']['max_percentage']
         v_ref = config['voltage_drop']['reference_voltage']
         max_voltage_drop_v = v_ref * (max_percentage / 100)
         
-        print(f"\n📉 Paso 4 - Caída de tensión:")
-        print(f"📉 Máxima caída: {max_percentage}% de {v_ref}V = {max_voltage_drop_v}V")
-        
-        # Paso 5: Sección teórica
-        numerator = 2 * resistivity * length_total * i_adjusted
-        s_teorica_mm2 = numerator / max_voltage_drop_v
-        
-        print(f"\n📐 Paso 5 - Sección teórica:")
-        print(f"📐 S_teórica = (2 × {resistivity:.6f} × {length_total} × {i_adjusted:.2f}) / {max_voltage_drop_v}")
-        print(f"📐 S_teórica = {s_teorica_mm2:.3f} mm²")
+        # Paso 5: Sección teórica (una sola pasada sobre todos los strings)
+        length_total, s_teorica_mm2 = calcular_secciones(
+            lengths_pos, lengths_neg, resistivity, i_adjusted, max_voltage_drop_v
+        )
         
         return {
-            'string_id': string_id,
+            'string_id': string_ids,
             'length_total': length_total,
+            's_teorica_mm2': s_teorica_mm2,
             'i_nominal': i_nominal,
+            'combined_factor': combined_factor,
             'i_adjusted': i_adjusted,
+            'temp_operating': temp_operating,
             'resistivity': resistivity,
+            'max_percentage': max_percentage,
+            'v_ref': v_ref,
             'max_voltage_drop_v': max_voltage_drop_v,
-            's_teorica_mm2': s_teorica_mm2
         }
         
     except Exception as e:
-        print(f"❌ Error en cálculo manual: {e}")
+        print(f"❌ Error en cálculo de strings: {e}")
         raise
 
-def verificar_proyecto_seguro(project_name: str, max_strings: int = 3):
-    """🔍 Verificación completa con manejo seguro de errores"""
+def calcular_string_manual_seguro(string_id, length_total: float, s_teorica_mm2: float,
+                                  lote: dict, config: dict, lines: list = None) -> StringResult:
+    """
+    🧮 Reporte paso a paso de un string a partir de los valores calculados en lote.
+    
+    Recibe los valores propios del string ya como escalares de Python; `lote` aporta los
+    comunes a todo el proyecto. Si se pasa `lines`, el reporte se acumula ahí para
+    escribirlo junto con el resto; si no, se escribe en una sola llamada.
+    Con VERIF_VERBOSE=0 no se formatea nada.
+    """
+    i_nominal = lote['i_nominal']
+    i_adjusted = lote['i_adjusted']
+    resistivity = lote['resistivity']
+    max_voltage_drop_v = lote['max_voltage_drop_v']
+    
+    if VERBOSE:
+        report = [
+            f"\n🧮 === CÁLCULO MANUAL STRING {string_id} ===",
+            f"📏 Longitud total: {length_total}m",
+            f"\n⚡ Paso 1 - Corriente nominal:",
+            f"⚡ I_nominal = {config['isc_ref']} × {config['isc_correction']} = {i_nominal}A",
+            f"🔧   I_adjusted = {i_nominal} ÷ {lote['combined_factor']} = {i_adjusted:.2f}A",
+            f"\n🔌 Paso 3 - Resistividad:",
+            f"🔌 Resistividad cobre a {lote['temp_operating']}°C: {resistivity:.6f} Ω·mm²/m",
+            f"\n📉 Paso 4 - Caída de tensión:",
+            f"📉 Máxima caída: {lote['max_percentage']}% de {lote['v_ref']}V = {max_voltage_drop_v}V",
+            f"\n📐 Paso 5 - Sección teórica:",
+            f"📐 S_teórica = (2 × {resistivity:.6f} × {length_total} × {i_adjusted:.2f}) / {max_voltage_drop_v}",
+            f"📐 S_teórica = {s_teorica_mm2:.3f} mm²",
+        ]
+        if lines is None:
+            _emitir(report)
+        else:
+            lines.extend(report)
+    
+    return StringResult(
+        string_id=string_id,
+        length_total=length_total,
+        i_nominal=i_nominal,
+        i_adjusted=i_adjusted,
+        resistivity=resistivity,
+        max_voltage_drop_v=max_voltage_drop_v,
+        s_teorica_mm2=s_teorica_mm2,
+    )
+
+def verificar_proyecto_seguro(project_name: str, max_strings: int = 3, normativa_cargada: dict = None):
+    """🔍 Verificación completa con manejo seguro de errores (`normativa_cargada`: de cargar_normativa(), opcional)"""
     print(f"🔍 === VERIFICACIÓN SEGURA PROYECTO: {project_name} ===")
     
     try:
-        # Paso 1: Verificar configuración
-        config, project_info = verificar_configuracion_segura(project_name)
-        
-        # Paso 2: Cargar datos del Excel
-        excel_path = f"projects/{project_name}/input.xlsx"
-        df = pd.read_excel(excel_path, sheet_name="dc_string_circuits")
+        # El libro se abre (y descomprime) una sola vez para project_info y dc_string_circuits
+        paths = rutas_proyecto(project_name)
+        xls = pd.ExcelFile(paths.excel, engine=EXCEL_ENGINE) if paths.excel_exists else None
+        try:
+            # Paso 1: Verificar configuración
+            config, project_info = verificar_configuracion_segura(project_name, xls=xls,
+                                                                 normativa_cargada=normativa_cargada)
+            
+            # Factores de corrección: mismos para todos los strings, se calculan una vez
+            print()
+            config['_combined_factor'] = calcular_factor_combinado(config)
+            
+            # Paso 2: Cargar datos del Excel
+            df = xls.parse("dc_string_circuits", usecols=STRING_COLUMNS, dtype=STRING_DTYPES)
+        finally:
+            if xls is not None:
+                xls.close()
         
         if df.empty:
             print("❌ No hay datos en la hoja dc_string_circuits")
@@ -431,18 +806,24 @@ def verificar_proyecto_seguro(project_name: str, max_strings: int = 3):
         print(f"\n📊 Total strings en Excel: {len(df)}")
         print(f"📊 Verificando primeros {min(max_strings, len(df))} strings...")
         
-        # Paso 3: Verificar strings específicos
+        # Paso 3: Verificar strings específicos (cálculo en lote, el bucle solo muestra)
+        lote = calcular_strings_vectorizado(df.head(max_strings), config)
         resultados = []
-        
-        for i, (index, row) in enumerate(df.head(max_strings).iterrows()):
-            print(f"\n" + "="*60)
-            print(f"🔍 STRING {i+1}/{min(max_strings, len(df))}")
+        lines = []
+        
+        # Columnas -> escalares de Python en una conversión por columna (no float() por string)
+        columnas = zip(lote['string_id'].tolist(), lote['length_total'].tolist(), lote['s_teorica_mm2'].tolist())
+        for i, (string_id, length_total, s_teorica_mm2) in enumerate(columnas):
+            if VERBOSE:
+                lines.append(f"\n" + "="*60)
+                lines.append(f"🔍 STRING {i+1}/{min(max_strings, len(df))}")
             
-            # Cálculo manual
-            string_data = row.to_dict()
-            resultado = calcular_string_manual_seguro(string_data, config)
+            resultado = calcular_string_manual_seguro(string_id, length_total, s_teorica_mm2, lote, config, lines)
             resultados.append(resultado)
         
+        # Todo el reporte de strings en una sola escritura
+        _emitir(lines)
+        
         # Resumen final MEJORADO
         print(f"\n🎯 === RESUMEN COMPARATIVO ===")
         print(f"🎯 Panel del proyecto: {project_info.get('panel_model')}")
@@ -451,20 +832,20 @@ def verificar_proyecto_seguro(project_name: str, max_strings: int = 3):
         if resultados:
             primer_resultado = resultados[0]
             print(f"\n🎯 Resultado ejemplo (primer string):")
-            print(f"🎯   I_nominal: {primer_resultado['i_nominal']}A")
-            print(f"🎯   I_ajustada: {primer_resultado['i_adjusted']:.2f}A")
-            print(f"🎯   S_teórica: {primer_resultado['s_teorica_mm2']:.3f} mm²")
+            print(f"🎯   I_nominal: {primer_resultado.i_nominal}A")
+            print(f"🎯   I_ajustada: {primer_resultado.i_adjusted:.2f}A")
+            print(f"🎯   S_teórica: {primer_resultado.s_teorica_mm2:.3f} mm²")
             
             # Comparar con valores anteriores (fallback ISC=10A)
             if config['isc_ref'] != 10.0:
                 incremento_isc = (config['isc_ref'] / 10.0 - 1) * 100
-                incremento_seccion = (primer_resultado['s_teorica_mm2'] / 1.29 - 1) * 100  # vs sección anterior
+                incremento_seccion = (primer_resultado.s_teorica_mm2 / 1.29 - 1) * 100  # vs sección anterior
                 
                 print(f"\n🔥 === COMPARACIÓN CON FALLBACK ANTERIOR ===")
                 print(f"🔥 ISC: {config['isc_ref']}A vs 10.0A (fallback) → +{incremento_isc:.1f}%")
-                print(f"🔥 I_nominal: {primer_resultado['i_nominal']}A vs 12.5A → +{(primer_resultado['i_nominal']/12.5-1)*100:.1f}%")
-                print(f"🔥 I_ajustada: {primer_resultado['i_adjusted']:.1f}A vs 18.6A → +{(primer_resultado['i_adjusted']/18.6-1)*100:.1f}%")
-                print(f"🔥 S_teórica: {primer_resultado['s_teorica_mm2']:.3f}mm² vs 1.29mm² → +{incremento_seccion:.1f}%")
+                print(f"🔥 I_nominal: {primer_resultado.i_nominal}A vs 12.5A → +{(primer_resultado.i_nominal/12.5-1)*100:.1f}%")
+                print(f"🔥 I_ajustada: {primer_resultado.i_adjusted:.1f}A vs 18.6A → +{(primer_resultado.i_adjusted/18.6-1)*100:.1f}%")
+                print(f"🔥 S_teórica: {primer_resultado.s_teorica_mm2:.3f}mm² vs 1.29mm² → +{incremento_seccion:.1f}%")
                 
                 if incremento_seccion > 50:
                     print(f"⚠️  ATENCIÓN: Las secciones anteriores estaban SIGNIFICATIVAMENTE subdimensionadas")
@@ -477,10 +858,8 @@ def verificar_proyecto_seguro(project_name: str, max_strings: int = 3):
         
         return resultados
         
-    except Exception as e:
-        print(f"❌ Error en verificación: {e}")
-        import traceback
-        traceback.print_exc()
+    except ERRORES_ESPERADOS as e:
+        _reportar_error("Error en verificación", e)
         return None
 
 if __name__ == "__main__":
@@ -500,11 +879,11 @@ if __name__ == "__main__":
     
     # Ejecutar verificación
     try:
-        # Mostrar factores disponibles primero
-        verificar_factores_proyecto(PROJECT_NAME)
+        # Mostrar factores disponibles primero (la normativa cargada se reutiliza después)
+        normativa_cargada = verificar_factores_proyecto(PROJECT_NAME)
         
         # Verificar cálculos
-        resultados = verificar_proyecto_seguro(PROJECT_NAME, MAX_STRINGS)
+        resultados = verificar_proyecto_seguro(PROJECT_NAME, MAX_STRINGS, normativa_cargada)
         
         if resultados:
             print(f"\n✅ === VERIFICACIÓN COMPLETADA ===")
@@ -513,7 +892,5 @@ if __name__ == "__main__":
         else:
             print(f"\n❌ === VERIFICACIÓN FALLÓ ===")
         
-    except Exception as e:
-        print(f"❌ Error general: {e}")
-        import traceback
-        traceback.print_exc()
\ No newline at end of file
+    except ERRORES_ESPERADOS as e:
+        _reportar_error("Error general", e)
\ No newline at end of file
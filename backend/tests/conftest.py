@@ -0,0 +1,251 @@
+import base64
+import hashlib
+import io
+
+import httpx
+import openpyxl
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+# Los routers importan `app.*` (no `backend.app.*`): se parchean esos módulos
+from app.api import pv_projects
+from app.utils import filesystem
+
+# =============================================================================
+# MARCADORES: `pytest -m "not slow"` para el ciclo rápido; CI ejecuta todo
+# (`pytest -n auto`)
+# =============================================================================
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: tests que escriben carpetas/Excel reales y pasan por las rutas de archivos")
+
+# =============================================================================
+# APP Y CLIENTE FASTAPI: uno por sesión (por worker con xdist)
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """La app FastAPI, importada una vez por sesión; los clientes la reciben de aquí"""
+    from backend.app.main import app
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app_instance):
+    """Cliente de pruebas compartido: el arranque de la app (lifespan) corre una sola vez"""
+    with TestClient(app_instance) as test_client:
+        yield test_client
+
+# =============================================================================
+# CLIENTE ASÍNCRONO para los tests de solo lectura (GET): httpx llama a la app
+# ASGI directamente en el bucle de anyio, sin el hilo intermedio de TestClient.
+# Los tests async llevan @pytest.mark.anyio (plugin de pytest incluido en anyio).
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Un solo backend (asyncio) y un bucle compartido por toda la sesión"""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def aclient(anyio_backend, app_instance):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app_instance), base_url="http://test") as async_client:
+        yield async_client
+
+# =============================================================================
+# CARPETA DE PROYECTOS: una temporal por test (tmp_path) en vez de backend/projects,
+# así los tests no se pisan entre sí ni con workers de pytest-xdist (`pytest -n auto`)
+# =============================================================================
+
+@pytest.fixture(scope="session", autouse=True)
+def cache_dir(tmp_path_factory):
+    """Caché de hojas parseadas de la sesión: los tests no escriben en backend/.cache"""
+    root = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("CALCAPP_CACHE_DIR", str(root))
+        mp.setattr(filesystem, "CACHE_DIR", root)
+        yield root
+
+
+def _use_projects_dir(monkeypatch, root):
+    """Apunta la app a root como carpeta de proyectos (se deshace al terminar el test)"""
+    monkeypatch.setenv("CALCAPP_PROJECTS_DIR", str(root))
+    monkeypatch.setattr(filesystem, "PROJECTS_DIR", root)
+    monkeypatch.setattr(pv_projects, "PROJECTS_DIR", root)
+
+
+@pytest.fixture
+def projects_dir(tmp_path, monkeypatch):
+    _use_projects_dir(monkeypatch, tmp_path)
+    return tmp_path
+
+# =============================================================================
+# EXCEL DE PRUEBA: cada forma de libro se serializa una vez (y se guarda en la
+# caché de pytest entre ejecuciones); los tests escriben los bytes como
+# input.xlsx o los suben directamente
+# =============================================================================
+
+def _workbook_bytes(sheets: dict) -> bytes:
+    """
+    Serializa {hoja: DataFrame} a un .xlsx en memoria.
+    Libro write_only de openpyxl: solo valores, sin pasar por el formateo de celdas de pandas.
+    """
+    workbook = openpyxl.Workbook(write_only=True)
+    for sheet_name, df in sheets.items():
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet.append(list(df.columns))
+        for row in df.itertuples(index=False, name=None):
+            worksheet.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
+def build_workbook(pytestconfig):
+    """
+    _workbook_bytes con caché persistente: los bytes del .xlsx se guardan en
+    .pytest_cache (base64) con una clave derivada del contenido de las hojas,
+    así en las ejecuciones siguientes no se vuelve a serializar el libro.
+    Si el contenido de una hoja cambia, cambia la clave.
+    """
+    cache = getattr(pytestconfig, "cache", None)  # None con -p no:cacheprovider
+
+    def build(sheets: dict) -> bytes:
+        content_repr = repr({sheet_name: df.to_dict(orient="split") for sheet_name, df in sheets.items()})
+        key = f"calcapp/xlsx/{hashlib.sha1(content_repr.encode()).hexdigest()}"
+        if cache is not None:
+            cached = cache.get(key, None)
+            if cached is not None:
+                return base64.b64decode(cached)
+
+        content = _workbook_bytes(sheets)
+        if cache is not None:
+            cache.set(key, base64.b64encode(content).decode("ascii"))
+        return content
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def valid_excel_bytes(build_workbook) -> bytes:
+    """
+    Excel de proyecto completo y válido (project_info, dc_string_circuits,
+    dc_cn1_circuits, mv_circuits).
+    """
+    return build_workbook({
+        "project_info": pd.DataFrame([
+            {"Campo": "project_name", "Valor": "Test Project", "Prioridad": "Prioritario"},
+            {"Campo": "installed_capacity_dc_kw", "Valor": 50000, "Prioridad": "Prioritario"},
+            {"Campo": "installed_capacity_ac_kw", "Valor": 45000, "Prioridad": "Prioritario"},
+            {"Campo": "design_voltage_dc", "Valor": 1500, "Prioridad": "Prioritario"},
+            {"Campo": "design_voltage_ac_volt", "Valor": 480, "Prioridad": "Prioritario"},
+            {"Campo": "design_voltage_mv_volt", "Valor": 34500, "Prioridad": "Prioritario"},
+            {"Campo": "inverter_brand", "Valor": "Sungrow", "Prioridad": "Prioritario"},
+            {"Campo": "inverter_model", "Valor": "SG8800UD-MV", "Prioridad": "Prioritario"},
+            {"Campo": "number_of_inverters", "Valor": 2, "Prioridad": "Prioritario"},
+            {"Campo": "inverter_station_model", "Valor": "Central MV", "Prioridad": "Prioritario"},
+            {"Campo": "panel_brand", "Valor": "LONGi Solar", "Prioridad": "Prioritario"},
+            {"Campo": "panel_model", "Valor": "LR5-72H", "Prioridad": "Prioritario"},
+            {"Campo": "number_of_panels", "Valor": 10000, "Prioridad": "Prioritario"},
+            {"Campo": "number_of_panels_per_string", "Valor": 28, "Prioridad": "Prioritario"},
+            {"Campo": "latitude", "Valor": 14.1, "Prioridad": "No prioritario"},
+            {"Campo": "longitude", "Valor": -87.2, "Prioridad": "No prioritario"}
+        ]),
+        "dc_string_circuits": pd.DataFrame([{
+            "string_id": "str-01-01-CN1-01-01",
+            "inverter_id": "INV-1",
+            "length_pos_m": 30,
+            "length_neg_m": 30,
+            "cn1_id": "CN1-01"
+        }]),
+        "dc_cn1_circuits": pd.DataFrame([{
+            "circuit_id": "cn1-01",
+            "inverter_id": "INV-1",
+            "length_pos_m": 60,
+            "length_neg_m": 60
+        }]),
+        "mv_circuits": pd.DataFrame([{
+            "circuit_id": "MV-1",
+            "phases": 3,
+            "length_m": 100,
+            "section_mm2": 240
+        }]),
+    })
+
+
+@pytest.fixture(scope="session")
+def invalid_excel_bytes(build_workbook) -> bytes:
+    """Excel incompleto: faltan campos requeridos y las hojas tienen columnas inválidas"""
+    return build_workbook({
+        "project_info": pd.DataFrame([
+            {"Campo": "project_name", "Valor": "Bad Project", "Prioridad": "Prioritario"},
+            {"Campo": "installed_capacity_dc_kw", "Valor": 0, "Prioridad": "Prioritario"}
+        ]),
+        "dc_string_circuits": pd.DataFrame([{"foo": 1}]),
+        "dc_cn1_circuits": pd.DataFrame([{"bar": 2}]),
+        "mv_circuits": pd.DataFrame([{"baz": 3}]),
+    })
+
+
+@pytest.fixture(scope="session")
+def list_projects_excel_bytes(build_workbook) -> bytes:
+    """Excel con todas las hojas requeridas (contenido mínimo) para el listado de proyectos"""
+    df = pd.DataFrame({"col1": [1], "col2": [2]})
+    return build_workbook({
+        sheet: df for sheet in ["project_info", "dc_string_circuits", "dc_cn1_circuits", "mv_circuits"]
+    })
+
+
+@pytest.fixture(scope="session")
+def single_sheet_excel_bytes(build_workbook) -> bytes:
+    """Excel mal estructurado: solo una hoja irrelevante"""
+    return build_workbook({"only_one_sheet": pd.DataFrame({"dummy": [1, 2, 3]})})
+
+
+@pytest.fixture(scope="session")
+def excel_data_demo_bytes(build_workbook) -> bytes:
+    """Excel con las cinco hojas que devuelve /data/excel-data"""
+    return build_workbook({
+        "project_info": pd.DataFrame([{"project_name": "Test Farm", "panel_model": "TestPanel-400"}]),
+        "dc_string_circuits": pd.DataFrame([{"circuit_id": "String_01", "current": 8.5}]),
+        "dc_cn1_circuits": pd.DataFrame([{"circuit_id": "CN1_01", "voltage": 1000}]),
+        "ac_circuits": pd.DataFrame([{"circuit_id": "AC_01", "voltage": 480}]),
+        "mv_circuits": pd.DataFrame([{"circuit_id": "MV_01", "voltage": 34000}]),
+    })
+
+
+@pytest.fixture(scope="session")
+def overwrite_excel_bytes(build_workbook) -> tuple:
+    """Dos versiones de project_info (columna A = 1 y A = 999) para probar la sobrescritura"""
+    return (
+        build_workbook({"project_info": pd.DataFrame({"A": [1]})}),
+        build_workbook({"project_info": pd.DataFrame({"A": [999]})}),
+    )
+
+
+# =============================================================================
+# PROYECTO DEMO DE SOLO LECTURA: se escribe una vez por sesión (por worker con
+# xdist) y lo comparten los tests que solo lo consultan
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def demo_projects_root(tmp_path_factory, excel_data_demo_bytes):
+    """Carpeta de proyectos de la sesión con demo_project/input.xlsx (Excel de /data/excel-data)"""
+    root = tmp_path_factory.mktemp("demo_projects")
+    project_path = root / "demo_project"
+    project_path.mkdir()
+    (project_path / "input.xlsx").write_bytes(excel_data_demo_bytes)
+    return root
+
+
+@pytest.fixture
+def demo_project(demo_projects_root, monkeypatch) -> str:
+    """
+    Nombre del proyecto demo, con la app apuntando a la carpeta de la sesión.
+    Los tests que lo usan no deben modificarlo.
+    """
+    _use_projects_dir(monkeypatch, demo_projects_root)
+    return "demo_project"
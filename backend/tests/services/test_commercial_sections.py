@@ -0,0 +1,22 @@
+import math
+
+import numpy as np
+import pytest
+from backend.app.services.calculation import string_calculator as sc
+
+# =============================================================================
+# SECCIÓN COMERCIAL: la versión por fila y la versión en lote eligen lo mismo
+# =============================================================================
+
+@pytest.mark.parametrize("theoretical", [0.5, 4.0, 5.3, 1e6, math.nan])
+def test_scalar_and_batch_commercial_section_agree(theoretical):
+    """✅ get_commercial_section y get_commercial_sections_batch coinciden (incluida una celda vacía → NaN)"""
+    scalar = sc.get_commercial_section(theoretical)
+    batch = sc.get_commercial_sections_batch(np.array([theoretical]))
+    assert scalar == batch[0]
+
+
+def test_nan_theoretical_section_uses_largest():
+    """⚠️ Una longitud vacía (NaN) no debe dimensionar el cable con la sección mínima"""
+    available = sc.get_available_sections_array("dc_strings")
+    assert sc.get_commercial_section(math.nan) == available[-1]
@@ -0,0 +1,69 @@
+import pytest
+from backend.app.services import config_loader as cl
+
+PROJECT_INFO = {"panel_model": "Canadian Solar CS3W-400P"}
+
+# =============================================================================
+# CONFIGURACIÓN DE CÁLCULO EN CACHÉ: compartida entre llamadas y de solo lectura
+# =============================================================================
+
+def test_cached_base_config_is_read_only():
+    """🔒 La parte memorizada no se puede modificar: se comparte entre peticiones"""
+    base = cl._build_base_calculation_config(PROJECT_INFO["panel_model"], "IEC", None, None)
+    with pytest.raises(TypeError):
+        base["isc_ref"] = 0
+    with pytest.raises(TypeError):
+        del base["cable"]
+
+
+def test_build_calculation_config_top_level_is_per_call():
+    """✅ Claves añadidas por una petición (project_name, _metadata) no llegan a la siguiente"""
+    first = cl.build_calculation_config(dict(PROJECT_INFO), "IEC")
+    first["project_name"] = "otro"
+    first["cn1_parallel_mapping"] = {"cn1-1": 4}
+    first["_metadata"]["project_name"] = "otro"
+
+    second = cl.build_calculation_config(dict(PROJECT_INFO), "IEC")
+    assert "project_name" not in second
+    assert "cn1_parallel_mapping" not in second
+    assert second["_metadata"]["project_name"] is None
+    assert second["cable"] is first["cable"]  # secciones compartidas, sin copia
+
+
+def test_custom_params_do_not_leak_into_shared_sections():
+    """✅ merge_custom_params copia solo lo que escribe: la configuración base no cambia"""
+    plain_before = cl.build_calculation_config(dict(PROJECT_INFO), "IEC")
+    material = plain_before["cable"]["material"]
+
+    custom = cl.build_calculation_config(dict(PROJECT_INFO), "IEC", custom_params={"cable_material": "aluminum"})
+    plain_after = cl.build_calculation_config(dict(PROJECT_INFO), "IEC")
+
+    assert custom["cable"]["material"] == "aluminum"
+    assert plain_after["cable"]["material"] == material
+    assert custom["_metadata"]["has_custom_params"] is True
+    assert plain_after["_metadata"]["has_custom_params"] is False
+
+
+# =============================================================================
+# LISTADOS PARA LA UI: una sola construcción por proceso, de solo lectura
+# =============================================================================
+
+@pytest.mark.parametrize("getter", [cl.get_available_panels, cl.get_available_normativas])
+def test_available_listings_are_shared_read_only_views(getter):
+    """🔒 El listado se construye una vez y no se puede modificar desde un endpoint"""
+    listing = getter()
+    assert getter() is listing
+    key = next(iter(listing))
+    with pytest.raises(TypeError):
+        listing["nuevo"] = {}
+    with pytest.raises(TypeError):
+        listing[key]["name"] = "modificado"
+
+
+def test_invalidate_config_cache_rebuilds_listings():
+    """✅ invalidate_config_cache() descarta los listados junto con los YAML"""
+    before = cl.get_available_normativas()
+    cl.invalidate_config_cache()
+    after = cl.get_available_normativas()
+    assert after is not before
+    assert dict(after) == dict(before)
@@ -1,42 +1,29 @@
-from fastapi.testclient import TestClient
-from backend.app.main import app
-import os
-import shutil
+import pytest
 
-# === CLIENTE FASTAPI ===
+# Escribe Excel/carpetas reales: fuera del ciclo rápido (pytest -m "not slow")
+pytestmark = pytest.mark.slow
 
-client = TestClient(app)
+# === SETUP ===
+# La carpeta de proyectos es temporal por test (fixture projects_dir): no hace falta limpiarla
 
-# === SETUP Y TEARDOWN ===
-
-def setup_project(project_name: str):
+def setup_project(projects_dir, project_name: str):
     """
     Crea una carpeta de proyecto con subcarpetas y un archivo ficticio.
     Se simula una estructura válida del proyecto.
     """
-    path = os.path.join("backend", "projects", project_name)
-    os.makedirs(os.path.join(path, "calculations"), exist_ok=True)
-    os.makedirs(os.path.join(path, "reports"), exist_ok=True)
-    with open(os.path.join(path, "input.xlsx"), "w") as f:
-        f.write("dummy content")
-
-def teardown_project(project_name: str):
-    """
-    Elimina la carpeta del proyecto si existe.
-    Se utiliza para limpiar después de cada prueba.
-    """
-    path = os.path.join("backend", "projects", project_name)
-    if os.path.exists(path):
-        shutil.rmtree(path)
+    path = projects_dir / project_name
+    (path / "calculations").mkdir(parents=True)
+    (path / "reports").mkdir()
+    (path / "input.xlsx").write_text("dummy content")
 
 # === TEST 1: Eliminación correcta con confirmación ===
 
-def test_delete_project_success():
+def test_delete_project_success(client, projects_dir):
     """
     ✅ Borra correctamente un proyecto existente si se proporciona confirmación.
     """
     project_name = "test_delete_project_success"
-    setup_project(project_name)
+    setup_project(projects_dir, project_name)
 
     response = client.delete(f"/projects/delete-project/{project_name}?confirm=true")
     assert response.status_code == 200
@@ -44,29 +31,27 @@ def test_delete_project_success():
     data = response.json()
     assert data["message"].startswith("Project")
     assert "deleted_files" in data
-    assert not os.path.exists(os.path.join("backend", "projects", project_name))
+    assert not (projects_dir / project_name).exists()
 
 # === TEST 2: Intento de eliminación sin confirmación ===
 
-def test_delete_project_without_confirmation():
+def test_delete_project_without_confirmation(client, projects_dir):
     """
     ❌ Rechaza la eliminación si no se proporciona confirmación explícita.
     """
     project_name = "test_delete_project_no_confirm"
-    setup_project(project_name)
+    setup_project(projects_dir, project_name)
 
     response = client.delete(f"/projects/delete-project/{project_name}")
     assert response.status_code == 400
     assert "confirm=true" in response.json()["detail"]
 
     # Verificar que el proyecto no fue eliminado
-    assert os.path.exists(os.path.join("backend", "projects", project_name))
-
-    teardown_project(project_name)
+    assert (projects_dir / project_name).exists()
 
 # === TEST 3: Proyecto inexistente ===
 
-def test_delete_project_not_found():
+def test_delete_project_not_found(client, projects_dir):
     """
     ❌ Devuelve 404 si el proyecto no existe en el sistema de archivos.
     """
@@ -74,3 +59,24 @@ def test_delete_project_not_found():
     response = client.delete(f"/projects/delete-project/{project_name}?confirm=true")
     assert response.status_code == 404
     assert "not found" in response.json()["detail"]
+
+# === TEST 4: La caché de hojas no aparece en el listado y se borra con el proyecto ===
+
+def test_delete_project_lists_only_project_files(client, projects_dir, cache_dir, list_projects_excel_bytes):
+    """
+    ✅ Tras leer el Excel (se genera la caché de hojas parseadas), el borrado
+    lista solo los archivos del proyecto y elimina también esa caché.
+    """
+    project_name = "test_delete_project_cached"
+    path = projects_dir / project_name
+    path.mkdir()
+    (path / "input.xlsx").write_bytes(list_projects_excel_bytes)
+    before = set((cache_dir / "sheets").glob("*.pkl"))
+    assert client.get(f"/data/excel-info/{project_name}").status_code == 200
+    cached = set((cache_dir / "sheets").glob("*.pkl")) - before
+    assert cached
+
+    response = client.delete(f"/projects/delete-project/{project_name}?confirm=true")
+    assert response.status_code == 200
+    assert response.json()["deleted_files"] == ["input.xlsx"]
+    assert not cached & set((cache_dir / "sheets").glob("*.pkl"))
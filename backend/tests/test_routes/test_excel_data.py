@@ -1,23 +1,20 @@
 import pandas as pd
-import os
-from pathlib import Path
-from fastapi.testclient import TestClient
-from backend.app.main import app
+import pytest
 
-client = TestClient(app)
+# Escribe Excel/carpetas reales: fuera del ciclo rápido (pytest -m "not slow").
+# Solo hacen GET: usan el cliente asíncrono (aclient) sobre la app ASGI.
+pytestmark = [pytest.mark.slow, pytest.mark.anyio]
 
 # =============================================================================
 # TEST 1: Extracción de datos con archivo válido
 # =============================================================================
-def test_get_complete_excel_data_success():
+async def test_get_complete_excel_data_success(aclient, demo_project):
     """
     Verifica que el endpoint /excel-data/{project_name} retorne correctamente
     todos los datos estructurados si el archivo Excel es válido.
+    El proyecto demo (fixture de sesión) se escribe una sola vez.
     """
-    project_name = "demo_project"
-    create_test_excel_file(project_name)
-
-    response = client.get(f"/data/excel-data/{project_name}")
+    response = await aclient.get(f"/data/excel-data/{demo_project}")
 
     assert response.status_code == 200
 
@@ -33,53 +30,33 @@ def test_get_complete_excel_data_success():
         assert sheet in data
         assert isinstance(data[sheet], list)
 
-    delete_test_excel_file(project_name)
-
 # =============================================================================
 # TEST 2: Error al extraer datos cuando el archivo no existe
 # =============================================================================
-def test_get_complete_excel_data_file_missing():
+async def test_get_complete_excel_data_file_missing(aclient, projects_dir):
     """
     Verifica que el endpoint /excel-data/{project_name} retorne un error 400
     cuando el archivo Excel no existe.
     """
     project_name = "non_existing_project"
-    response = client.get(f"/data/excel-data/{project_name}")
+    response = await aclient.get(f"/data/excel-data/{project_name}")
     assert response.status_code == 400
     assert "detail" in response.json()
 
 # =============================================================================
-# Helpers para creación y limpieza de archivo Excel de prueba
+# TEST 3: Los decimales se devuelven completos (sin redondeo a 15 decimales)
 # =============================================================================
-
-def create_test_excel_file(project_name: str):
+async def test_get_complete_excel_data_keeps_float_precision(aclient, projects_dir, build_workbook):
     """
-    Crea un archivo Excel válido para pruebas con todas las hojas requeridas.
+    Verifica que un valor pequeño (1.234567890123457e-7) llegue con todos sus dígitos.
     """
-    base_path = Path(f"projects/{project_name}")
-    base_path.mkdir(parents=True, exist_ok=True)
-    file_path = base_path / "input.xlsx"
-
-    sheets = {
-        "project_info": pd.DataFrame([{"project_name": "Test Farm", "panel_model": "TestPanel-400"}]),
-        "dc_string_circuits": pd.DataFrame([{"circuit_id": "String_01", "current": 8.5}]),
-        "dc_cn1_circuits": pd.DataFrame([{"circuit_id": "CN1_01", "voltage": 1000}]),
-        "ac_circuits": pd.DataFrame([{"circuit_id": "AC_01", "voltage": 480}]),
-        "mv_circuits": pd.DataFrame([{"circuit_id": "MV_01", "voltage": 34000}]),
-    }
+    value = 1.234567890123457e-7
+    sheets = {sheet: pd.DataFrame({"circuit_id": ["C_01"], "value": [value]})
+              for sheet in ["project_info", "dc_string_circuits", "dc_cn1_circuits", "ac_circuits", "mv_circuits"]}
+    (projects_dir / "precision_project").mkdir()
+    (projects_dir / "precision_project" / "input.xlsx").write_bytes(build_workbook(sheets))
 
-    with pd.ExcelWriter(file_path) as writer:
-        for sheet_name, df in sheets.items():
-            df.to_excel(writer, index=False, sheet_name=sheet_name)
+    response = await aclient.get("/data/excel-data/precision_project")
 
-    return file_path
-
-def delete_test_excel_file(project_name: str):
-    """
-    Elimina el archivo Excel y su carpeta de proyecto después del test.
-    """
-    project_dir = Path(f"projects/{project_name}")
-    if project_dir.exists():
-        for f in project_dir.glob("*"):
-            f.unlink()
-        project_dir.rmdir()
+    assert response.status_code == 200
+    assert response.json()["dc_string_circuits"][0]["value"] == value
@@ -1,22 +1,10 @@
-from fastapi.testclient import TestClient
 from fastapi import status
-from backend.app.main import app
-import os
-import shutil
 
 # ================================
 # TEST 1: Creación exitosa de proyecto
 # ================================
-def test_create_project_success():
+def test_create_project_success(client, projects_dir):
     project_name = "test_project_unit"
-    path = os.path.join("backend", "projects", project_name)
-    
-    # Eliminar el proyecto si ya existe (limpieza previa)
-    if os.path.exists(path):
-        shutil.rmtree(path)
-
-    # Crear cliente de prueba
-    client = TestClient(app)
 
     # Enviar solicitud POST para crear el proyecto
     response = client.post("/projects/create-project", json={
@@ -34,22 +22,14 @@ def test_create_project_success():
     assert "calculations" in data["folder_structure"]
     assert "reports" in data["folder_structure"]
 
-    # Eliminar el proyecto después de la prueba (limpieza)
-    if os.path.exists(path):
-        shutil.rmtree(path)
-
 # ================================
 # TEST 2: Proyecto ya existe (debe fallar)
 # ================================
-def test_create_project_already_exists():
+def test_create_project_already_exists(client, projects_dir):
     project_name = "test_project_exists"
-    path = os.path.join("backend", "projects", project_name)
 
     # Crear manualmente el proyecto para simular existencia previa
-    os.makedirs(path, exist_ok=True)
-
-    # Crear cliente de prueba
-    client = TestClient(app)
+    (projects_dir / project_name).mkdir()
 
     # Enviar solicitud POST con el mismo nombre de proyecto
     response = client.post("/projects/create-project", json={
@@ -63,7 +43,3 @@ def test_create_project_already_exists():
 
     # Verificar que el mensaje de error sea el esperado
     assert "Project already exists" in response.json()["detail"]
-
-    # Eliminar el proyecto después de la prueba (limpieza)
-    if os.path.exists(path):
-        shutil.rmtree(path)